@@ -0,0 +1,79 @@
+"""
+Background Task Runner for PySide6 Application.
+
+This module defines the `BackgroundTask` runnable, which executes a Python callable on a
+`QThreadPool` worker thread and reports its outcome to the GUI thread through Qt signals.
+It lets long-running work, such as downloading or preprocessing the dataset, run in the
+same process without freezing the user interface.
+
+Key Features:
+-------------
+1. **In-process Execution**:
+   - Calls the given function directly, without starting a new Python interpreter.
+   - Forwards positional and keyword arguments to the function.
+
+2. **Thread-safe Results**:
+   - `finished` is emitted with the task name and the function's return value.
+   - `failed` is emitted with the task name and the error message if it raises.
+
+Classes:
+--------
+1. `BackgroundTaskSignals(QObject)`:
+   - Holds the signals emitted by the task.
+
+2. `BackgroundTask(QRunnable)`:
+   - Runs a callable and emits the outcome.
+"""
+# Standard library imports
+from typing import Callable
+
+# Third-party imports
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class BackgroundTaskSignals(QObject):
+    """
+    Signals emitted by `BackgroundTask`.
+
+    Attributes:
+        finished (Signal): Emitted with the task name and the function's return value.
+        failed (Signal): Emitted with the task name and the error message on failure.
+    """
+    finished = Signal(str, object)
+    failed = Signal(str, str)
+
+
+class BackgroundTask(QRunnable):
+    """
+    Runnable that executes a callable on a `QThreadPool` worker thread.
+    """
+
+    def __init__(self, name: str, function: Callable, *args, **kwargs) -> None:
+        """
+        Initialize the task.
+
+        Args:
+            name (str): Identifier sent back with the outcome (e.g. "download").
+            function (Callable): The function to execute.
+            *args: Positional arguments passed to the function.
+            **kwargs: Keyword arguments passed to the function.
+        """
+        super().__init__()
+        self.name: str = name
+        self.function: Callable = function
+        self.args: tuple = args
+        self.kwargs: dict = kwargs
+        self.signals: BackgroundTaskSignals = BackgroundTaskSignals()
+
+    def run(self) -> None:
+        """Execute the function and emit `finished`, or `failed` if it raises."""
+        try:
+            result = self.function(*self.args, **self.kwargs)
+
+        except Exception as gen_err:
+            print(f"❌ [ERROR] Background task '{self.name}' failed: {gen_err}")
+            self.signals.failed.emit(self.name, str(gen_err) or type(gen_err).__name__)
+            return
+
+        print(f"✅ [SUCCESS] Background task '{self.name}' completed.")
+        self.signals.finished.emit(self.name, result)
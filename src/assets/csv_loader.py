@@ -0,0 +1,123 @@
+"""
+Background CSV Loader for PySide6 Application.
+
+This module defines the `CsvLoader` runnable, which reads a CSV file with pandas on a
+`QThreadPool` worker thread and hands the resulting DataFrame back to the GUI thread
+through Qt signals. Parsing stays off the UI thread, so windows keep painting and
+responding to input while the data is being loaded.
+
+Key Features:
+-------------
+1. **Background Loading**:
+   - Runs `pandas.read_csv` inside `QRunnable.run`, on a worker thread of the pool.
+   - Forwards any keyword arguments (e.g. `nrows`, `usecols`) to `read_csv`.
+
+2. **Thread-safe Results**:
+   - `loaded` delivers the DataFrame to the GUI thread through a queued signal, together
+     with the modification time the file had before it was read, so callers can tell
+     results of older versions of the file apart.
+   - `failed` reports any error raised while reading the file.
+
+3. **Lightweight Previews**:
+   - `read_csv_preview` returns the header and first rows of a CSV file as text with the
+     standard `csv` module, without importing pandas or building a DataFrame.
+
+Functions:
+----------
+1. `read_csv_preview(csv_path: str, nrows: int) -> tuple[list[str], list[list[str]]]`:
+   - Reads the header and the first `nrows` rows of a CSV file.
+
+Classes:
+--------
+1. `CsvLoaderSignals(QObject)`:
+   - Holds the signals emitted by the loader.
+
+2. `CsvLoader(QRunnable)`:
+   - Reads a CSV file and emits the result or the error.
+"""
+# Standard library imports
+import csv
+import itertools
+import os
+
+# Third-party imports
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+def read_csv_preview(csv_path: str, nrows: int) -> tuple[list[str], list[list[str]]]:
+    """
+    Read the header and the first rows of a CSV file as text.
+
+    Only `nrows + 1` lines are parsed, so the cost does not depend on the size of the file.
+
+    Args:
+        csv_path (str): Path to the CSV file to read.
+        nrows (int): Number of data rows to return.
+
+    Returns:
+        tuple[list[str], list[list[str]]]: The column names and the rows of cell texts.
+            Both are empty if the file has no lines.
+
+    Raises:
+        OSError: If the file cannot be opened.
+        csv.Error: If the file is not valid CSV.
+    """
+    with open(csv_path, newline="", encoding="utf-8") as file:
+        lines = list(itertools.islice(csv.reader(file), nrows + 1))
+
+    if not lines:
+        return [], []
+    return lines[0], lines[1:]
+
+
+class CsvLoaderSignals(QObject):
+    """
+    Signals emitted by `CsvLoader`.
+
+    Attributes:
+        loaded (Signal): Emitted with the loader name, the loaded DataFrame and the
+            modification time of the file (`st_mtime_ns`) taken before reading it.
+        failed (Signal): Emitted with the loader name and the error message.
+    """
+    loaded = Signal(str, object, object)
+    failed = Signal(str, str)
+
+
+class CsvLoader(QRunnable):
+    """
+    Runnable that reads a CSV file with pandas on a `QThreadPool` worker thread.
+    """
+
+    def __init__(self, name: str, csv_path: str, **read_csv_kwargs) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            name (str): Identifier sent back with the result (e.g. the target table).
+            csv_path (str): Path to the CSV file to read.
+            **read_csv_kwargs: Extra keyword arguments passed to `pandas.read_csv`.
+        """
+        super().__init__()
+        self.name: str = name
+        self.csv_path: str = csv_path
+        self.read_csv_kwargs: dict = read_csv_kwargs
+        self.signals: CsvLoaderSignals = CsvLoaderSignals()
+
+    def run(self) -> None:
+        """Read the CSV file and emit `loaded` with the DataFrame, or `failed` on error."""
+        # pandas is imported here so the module stays cheap to import
+        import pandas as pd
+
+        try:
+            # Taken before reading, so a file rewritten meanwhile is never reported as
+            # the newer version
+            mtime_ns = os.stat(self.csv_path).st_mtime_ns
+            df = pd.read_csv(self.csv_path, **self.read_csv_kwargs)
+
+        except Exception as gen_err:
+            print(f"❌ [ERROR] Failed to load {self.csv_path}: {gen_err}")
+            self.signals.failed.emit(self.name, str(gen_err))
+            return
+
+        print(f"✅ [SUCCESS] Loaded {self.csv_path} in the background.")
+        self.signals.loaded.emit(self.name, df, mtime_ns)
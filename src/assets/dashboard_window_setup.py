@@ -13,7 +13,7 @@ Key Features:
 
 2. **User Interface Setup**:
    - Creates a central layout with welcome and feedback labels.
-   - Adds table widgets within scrollable areas to display XLSX data.
+   - Adds table views, backed by pandas models, within scrollable areas to display the data.
    - Applies custom styles using a centralized style dictionary.
 
 3. **Menu Bar with Actions**:
@@ -42,9 +42,10 @@ Functions:
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (QLabel, QVBoxLayout, QWidget, QApplication,
                                QMenuBar, QWidgetAction, QPushButton,
-                               QTableWidget, QScrollArea)
+                               QTableView, QScrollArea)
 
 # Local project-specific imports
+from src.assets.pandas_model import PandasModel
 from src.styles.styles import STYLES
 
 # Constants
@@ -116,7 +117,8 @@ def setup_dashboard_ui(self) -> None:
         # Create a scroll area to contain the table widget
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.table_widget = QTableWidget()  # Create a table widget to display the XLSX data
+        self.table_widget = QTableView()  # Create a table view to display the XLSX data
+        self.table_widget.setModel(PandasModel(parent=self.table_widget))
         self.scroll_area.setWidget(
             self.table_widget)  # Set the table widget as the widget for the scroll area
         table_layout.addWidget(self.scroll_area)  # Add the scroll area to the layout
@@ -124,7 +126,8 @@ def setup_dashboard_ui(self) -> None:
         # Create the second scroll area for the second table
         self.scroll_area_processed = QScrollArea()
         self.scroll_area_processed.setWidgetResizable(True)
-        self.table_widget_processed = QTableWidget()
+        self.table_widget_processed = QTableView()
+        self.table_widget_processed.setModel(PandasModel(parent=self.table_widget_processed))
         self.scroll_area_processed.setWidget(self.table_widget_processed)
         table_layout.addWidget(self.scroll_area_processed)
 
@@ -165,11 +168,13 @@ def setup_dashboard_menu(self) -> None:
     download_button.setStyleSheet(STYLES["menu_button"])
     download_button.clicked.connect(self.download_xlsx)
     download_action.setDefaultWidget(download_button)
+    self.download_button = download_button  # Disabled while a download is running
 
     preprocess_button = QPushButton("Preprocess XLSX")
     preprocess_button.setStyleSheet(STYLES["menu_button"])
     preprocess_button.clicked.connect(self.run_preprocessing)
     preprocess_action.setDefaultWidget(preprocess_button)
+    self.preprocess_button = preprocess_button  # Disabled while preprocessing is running
 
     # Add actions to the menu
     file_menu.addAction(download_action)
@@ -9,11 +9,19 @@ with Python's standard libraries.
 Key Features:
 -------------
 1. **File Download Automation**:
-   - Automates the process of logging into Kaggle and downloading a dataset ZIP file.
-   - Uses Selenium WebDriver for interaction with the Kaggle website.
+   - Streams the dataset archive directly from the Kaggle REST API and extracts it as soon
+     as it arrives, authenticating with the Kaggle API token when one is configured.
+   - Caches the archive and revalidates it with its ETag/Last-Modified headers, so an
+     unchanged dataset is not downloaded again.
+   - Writes and hashes each received chunk on a separate thread while the next one is
+     being downloaded.
+   - Falls back to logging into Kaggle and downloading the ZIP file with Selenium WebDriver.
 
 2. **File Extraction**:
    - Extracts the downloaded ZIP file to a specified directory.
+   - Streams each member through a 1 MiB buffer and refuses paths outside the target folder.
+   - Extracts the files of multi-file archives in parallel, opening one ZIP handle per
+     worker thread.
    - Handles corrupt ZIP files or invalid paths gracefully.
    - Deletes the ZIP file after successful extraction.
 
@@ -27,45 +35,79 @@ Key Features:
 
 Functions:
 ----------
-1. `unzip_file(zip_file_path: str, extract_to_folder: str) -> None`:
-   - Unzips a given ZIP file to the specified folder.
-   - Deletes the ZIP file after successful extraction.
+1. `unzip_file(zip_file_path: str, extract_to_folder: str, remove_zip: bool = True) -> str`:
+   - Unzips a given ZIP file to the specified folder and returns its top-level folder name.
+   - Deletes the ZIP file after successful extraction, unless `remove_zip` is False.
 
 2. `rename_folder(folder_path: str, new_folder_name: str) -> str | None`:
-   - Renames a specified folder to a new name and returns the new path.
+   - Renames a specified folder to a new name and returns the new path, replacing a folder
+     left at the destination by a previous run.
 
 3. `setup_browser() -> webdriver.Chrome | None`:
-   - Sets up and returns a Chrome WebDriver instance with configured preferences.
+   - Sets up and returns a Chrome WebDriver instance with configured preferences. Pages are
+     loaded eagerly and without extensions, so the fallback does not wait for resources
+     it never uses.
+
+4. `wait_for_download(download_dir: str, timeout: float = 120,
+   ignored_files: set[str] | None = None) -> str`:
+   - Polls a folder until a new ZIP file has finished downloading and returns its name.
 
-4. `download_file(driver: webdriver.Chrome, sleep_time: int = 10) -> str | None`:
+5. `download_file(driver: webdriver.Chrome, timeout: float = 120) -> str | None`:
    - Automates the download of a dataset ZIP file from Kaggle.
 
+6. `download_and_extract(url: str, extract_to_folder: str, timeout: float = 120,
+   cache_dir: str = DOWNLOAD_CACHE_DIR, force: bool = False) -> str | None`:
+   - Downloads a ZIP archive over HTTP, reusing the cached copy if the server reports
+     it unchanged, extracts it and returns its top-level folder name.
+
+7. `main(force: bool = False) -> str | None`:
+   - Runs the complete workflow below and returns the path of the dataset folder. It can be
+     called in-process (e.g. from the dashboard) or by executing the script directly.
+
 Main Execution Workflow:
 ------------------------
-1. **Setup**:
-   - Initializes the Chrome WebDriver with custom preferences.
+1. **Direct Download**:
+   - Downloads the archive from `DATASET_URL` with the Kaggle API token, if configured (or
+     reuses the cached copy if it has not changed), and extracts it, skipping steps 2 and 3.
+
+2. **Setup**:
+   - If the direct download fails, initializes the Chrome WebDriver with custom preferences.
 
-2. **Dataset Download**:
+3. **Dataset Download**:
    - Automates the login to Kaggle, navigates to the dataset page, and downloads the ZIP file.
 
-3. **File Extraction**:
+4. **File Extraction**:
    - Extracts the contents of the downloaded ZIP file.
 
-4. **Folder Renaming**:
+5. **Folder Renaming**:
    - Renames the extracted folder to a user-defined name.
 
-5. **Cleanup**:
+6. **Cleanup**:
    - Closes the WebDriver instance and handles any cleanup tasks.
 
 Usage:
 ------
-Execute the script directly, and follow the on-screen prompts for interaction with Kaggle.
-The dataset is downloaded, extracted, and prepared automatically.
+Execute the script directly. With a Kaggle API token in `~/.kaggle/kaggle.json` (or the
+`KAGGLE_USERNAME` and `KAGGLE_KEY` environment variables) no browser or login is needed;
+otherwise, follow the on-screen prompts for interaction with Kaggle.
+The dataset is downloaded, extracted, and prepared automatically. Pass `--force` to
+download the archive again even if the cached copy is up to date.
 """
 # Standard library imports
+import base64
+import hashlib
+import json
 import os
+import queue
+import shutil
+import sys
+import threading
 import time
+import urllib.error
+import urllib.parse
+import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 # Third-party imports
 from selenium import webdriver
@@ -74,24 +116,134 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
 
+# Local project-specific imports
+from src.assets.io_utils import USER_CACHE_DIR
+
+# Constants
+DOWNLOAD_POLL_INTERVAL = 0.2  # Seconds between two checks of the download folder
+EXTRACT_BUFFER_SIZE = 1 << 20  # Bytes copied per read when extracting a ZIP member (1 MiB)
+EXTRACT_MAX_WORKERS = min(8, os.cpu_count() or 4)  # Threads extracting ZIP members at once
+# Public download endpoint of the dataset, used before falling back to the browser
+DATASET_URL = ("https://www.kaggle.com/api/v1/datasets/download/"
+               "jocelyndumlao/impulse-buying-factors-on-tiktok-shop")
+KAGGLE_HOST = "www.kaggle.com"  # Only requests to this host carry the API credentials
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # Bytes read per chunk when streaming the archive (1 MiB)
+DOWNLOAD_QUEUE_SIZE = 8  # Chunks received ahead of the disk writer before reading pauses
+# Downloaded archives kept between runs, revalidated with the server before being reused
+DOWNLOAD_CACHE_DIR = USER_CACHE_DIR
+# Top-level folder of the dataset archive, used if the archive does not have exactly one
+EXTRACTED_FOLDER_NAME = ("Exploring factors influencing the impulse buying behavior of"
+                         " Vietnamese students on TikTok Shop")
+DATA_FOLDER_NAME = "impulse_buying_data"
+# The browser fallback only needs the page structure, not every image and script on it
+BROWSER_PAGE_LOAD_STRATEGY = "eager"  # Return once the DOM is ready
+BROWSER_PAGE_LOAD_TIMEOUT = 30  # Seconds before a page load is abandoned
+BROWSER_ARGUMENTS = ("--disable-extensions", "--disable-gpu")
+
+
+def _member_target_path(extract_to_folder: str, member: zipfile.ZipInfo) -> str:
+    """Returns where a ZIP member is extracted, refusing paths outside the target folder."""
+    root = os.path.realpath(extract_to_folder)
+    target = os.path.realpath(os.path.join(root, member.filename))
+
+    if os.path.commonpath([root, target]) != root:
+        raise ValueError(f"Error: The ZIP member {member.filename} is outside the target folder.")
+    return target
+
+
+def _extract_member(zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo,
+                    extract_to_folder: str) -> None:
+    """Extracts one ZIP member, copying it in `EXTRACT_BUFFER_SIZE` chunks."""
+    target = _member_target_path(extract_to_folder, member)
+
+    if member.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with zip_ref.open(member) as source, \
+            open(target, "wb", buffering=EXTRACT_BUFFER_SIZE) as destination:
+        shutil.copyfileobj(source, destination, EXTRACT_BUFFER_SIZE)
+
+
+def _top_level_name(members: list[zipfile.ZipInfo]) -> str:
+    """
+    Returns the only top-level folder of an archive, ignoring files stored at its root.
+
+    Archives without exactly one top-level folder fall back to `EXTRACTED_FOLDER_NAME`, the
+    folder the dataset archive is known to contain.
+    """
+    folders = {member.filename.split('/')[0] for member in members if '/' in member.filename}
+    return folders.pop() if len(folders) == 1 else EXTRACTED_FOLDER_NAME
+
+
+def _extract_members_in_parallel(zip_file_path: str, members: list[zipfile.ZipInfo],
+                                 extract_to_folder: str) -> None:
+    """
+    Extracts ZIP members on a thread pool, decompression releasing the GIL.
+
+    ZipFile objects are not thread-safe, so each worker thread opens the archive once and
+    reuses that handle for every member it extracts.
+    """
+    handles = threading.local()
+    opened: list[zipfile.ZipFile] = []
+
+    def extract(member: zipfile.ZipInfo) -> None:
+        zip_ref = getattr(handles, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = handles.zip_ref = zipfile.ZipFile(zip_file_path, 'r')
+            opened.append(zip_ref)
+        _extract_member(zip_ref, member, extract_to_folder)
 
-def unzip_file(zip_file_path: str, extract_to_folder: str) -> None:
-    """Unzips the specified ZIP file into the target folder."""
+    try:
+        with ThreadPoolExecutor(max_workers=EXTRACT_MAX_WORKERS) as executor:
+            list(executor.map(extract, members))
+    finally:
+        for zip_ref in opened:
+            zip_ref.close()
+
+
+def unzip_file(zip_file_path: str, extract_to_folder: str, remove_zip: bool = True) -> str:
+    """
+    Unzips the specified ZIP file into the target folder, then deletes it if `remove_zip`.
+
+    Extraction is synchronous, so every member exists on disk when this function returns.
+
+    Returns:
+        str: Name of the only top-level folder of the archive, or `EXTRACTED_FOLDER_NAME` if
+            it does not have exactly one.
+    """
     try:
         if zipfile.is_zipfile(zip_file_path):
-            # Unzip the file
             with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_to_folder)
-                print(f"The ZIP file has been extracted to: {extract_to_folder}")
-
-            # Delete the ZIP file after extraction
-            if os.path.exists(zip_file_path):
+                members = zip_ref.infolist()
+                extracted_name = _top_level_name(members)
+
+                # Create the folders first, so the threads never race to create them
+                for member in members:
+                    if member.is_dir():
+                        _extract_member(zip_ref, member, extract_to_folder)
+
+                files = [member for member in members if not member.is_dir()]
+                if len(files) <= 1:
+                    for member in files:
+                        _extract_member(zip_ref, member, extract_to_folder)
+
+            # Decompression releases the GIL, so several files are extracted at once
+            if len(files) > 1:
+                _extract_members_in_parallel(zip_file_path, files, extract_to_folder)
+            print(f"The ZIP file has been extracted to: {extract_to_folder}")
+
+            # Delete the ZIP file after extraction, unless the caller keeps it (e.g. a cache)
+            if remove_zip and os.path.exists(zip_file_path):
                 os.remove(zip_file_path)
                 print(f"The ZIP file {zip_file_path} has been deleted.")
 
-            else:
+            elif remove_zip:
                 print(f"Warning: The ZIP file {zip_file_path} was not found to be deleted.")
 
+            return extracted_name
+
         else:
             raise ValueError(f"Error: The file {zip_file_path} is not a valid ZIP file.")
 
@@ -109,12 +261,23 @@ def unzip_file(zip_file_path: str, extract_to_folder: str) -> None:
 
 
 def rename_folder(folder_path: str, new_folder_name: str) -> str | None:
-    """Renames the extracted folder."""
+    """
+    Renames the extracted folder.
+
+    A folder already at the destination, e.g. from a previous run, is replaced, so running
+    the download again does not fail at this last step.
+    """
     try:
         parent_folder = os.path.dirname(folder_path)
         new_folder_path = os.path.join(parent_folder, new_folder_name)
 
-        os.rename(folder_path, new_folder_path)
+        if os.path.abspath(folder_path) == os.path.abspath(new_folder_path):
+            return new_folder_path
+
+        if os.path.isdir(new_folder_path) and os.path.isdir(folder_path):
+            shutil.rmtree(new_folder_path)
+
+        os.replace(folder_path, new_folder_path)
         print(f"Folder has been renamed to: {new_folder_name}")
         return new_folder_path
     except Exception as rename_err:
@@ -132,7 +295,12 @@ def setup_browser() -> webdriver.Chrome | None:
             "safebrowsing.enabled": True  # Avoid blocking suspicious files
         }
         options.add_experimental_option("prefs", prefs)
+        for argument in BROWSER_ARGUMENTS:
+            options.add_argument(argument)
+        options.page_load_strategy = BROWSER_PAGE_LOAD_STRATEGY
+
         driver = webdriver.Chrome(options=options)
+        driver.set_page_load_timeout(BROWSER_PAGE_LOAD_TIMEOUT)
         return driver
 
 
@@ -145,8 +313,58 @@ def setup_browser() -> webdriver.Chrome | None:
         return None
 
 
-def download_file(driver: webdriver.Chrome, sleep_time: int = 10) -> str | None:
-    """Attempts to download the file from Kaggle."""
+def wait_for_download(download_dir: str, timeout: float = 120,
+                      ignored_files: set[str] | None = None) -> str:
+    """
+    Waits until a new ZIP file has finished downloading into a folder.
+
+    The folder is checked every `DOWNLOAD_POLL_INTERVAL` seconds. A download is complete
+    once a ZIP file keeps the same size and modification time for two consecutive checks
+    and no partial Chrome download (`.crdownload`) is left in the folder.
+
+    Args:
+        download_dir (str): Folder the browser downloads into.
+        timeout (float): Maximum number of seconds to wait. Defaults to 120.
+        ignored_files (set[str] | None): ZIP files already present before the download.
+
+    Returns:
+        str: The name of the downloaded ZIP file.
+
+    Raises:
+        TimeoutError: If no complete ZIP file appears within `timeout` seconds.
+    """
+    ignored_files = ignored_files or set()
+    deadline = time.monotonic() + timeout
+    previous: dict[str, tuple[int, int]] = {}
+
+    while True:
+        current: dict[str, tuple[int, int]] = {}
+        is_downloading = False
+
+        with os.scandir(download_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".crdownload"):
+                    is_downloading = True
+                elif (entry.name.endswith(".zip") and entry.name not in ignored_files
+                      and entry.is_file()):
+                    file_stat = entry.stat()
+                    current[entry.name] = (file_stat.st_size, file_stat.st_mtime_ns)
+
+        if not is_downloading:
+            for name in sorted(current):
+                if previous.get(name) == current[name]:
+                    return name
+
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"No completed ZIP download found in {download_dir} "
+                               f"after {timeout} seconds.")
+
+        previous = current
+        time.sleep(DOWNLOAD_POLL_INTERVAL)
+
+
+def download_file(driver: webdriver.Chrome, timeout: float = 120) -> str | None:
+    """Attempts to download the file from Kaggle, waiting at most `timeout` seconds for it."""
     try:
         driver.get("https://www.kaggle.com/")
 
@@ -164,6 +382,11 @@ def download_file(driver: webdriver.Chrome, sleep_time: int = 10) -> str | None:
         )
         download_button.click()  # Opens the dropdown menu
 
+        # ZIP files already in the folder are not the one being downloaded
+        with os.scandir(os.getcwd()) as entries:
+            existing_zip_files = {entry.name for entry in entries
+                                  if entry.name.endswith('.zip') and entry.is_file()}
+
         # Wait for the "Download dataset as zip" option to be visible
         download_zip_option = wait.until(
             ec.element_to_be_clickable((By.XPATH, "//p[text()='Download dataset as zip']"))
@@ -172,22 +395,15 @@ def download_file(driver: webdriver.Chrome, sleep_time: int = 10) -> str | None:
 
         print(f"The file will be downloaded to the working directory: {os.getcwd()}")
 
-        # Wait for the file to download (adjust the time based on file size)
-        time.sleep(sleep_time)
-
-        # Check if the ZIP file is in the directory
-        files_in_directory = os.listdir(os.getcwd())
-        zip_files = [file for file in files_in_directory if file.endswith('.zip')]
-
-        if not zip_files:
-            print("Error: No ZIP file found in the directory.")
-            return None
-
-        return zip_files[0]  # Return the first ZIP file found
+        # Return as soon as the new ZIP file is complete
+        return wait_for_download(os.getcwd(), timeout, existing_zip_files)
 
     except TimeoutException as time_err:
         print(f"Error: Timeout during file download: {str(time_err)}")
 
+    except TimeoutError as time_err:
+        print(f"Error: No ZIP file found in the directory: {str(time_err)}")
+
     except WebDriverException as web_err:
         print(f"Error: Unable to interact with the browser: {str(web_err)}")
 
@@ -197,42 +413,267 @@ def download_file(driver: webdriver.Chrome, sleep_time: int = 10) -> str | None:
     return None
 
 
-if __name__ == "__main__":
+def _load_kaggle_credentials() -> tuple[str, str] | None:
+    """
+    Returns the Kaggle API username and key, or None if no API token is configured.
+
+    Like the `kaggle` CLI, the `KAGGLE_USERNAME` and `KAGGLE_KEY` environment variables take
+    precedence over the `kaggle.json` token file in `KAGGLE_CONFIG_DIR` (`~/.kaggle` by default).
+    """
+    username, key = os.environ.get("KAGGLE_USERNAME"), os.environ.get("KAGGLE_KEY")
+    if username and key:
+        return username, key
+
+    config_dir = os.environ.get("KAGGLE_CONFIG_DIR",
+                                os.path.join(os.path.expanduser("~"), ".kaggle"))
+    try:
+        with open(os.path.join(config_dir, "kaggle.json"), encoding="utf-8") as file:
+            token = json.load(file)
+        return token["username"], token["key"]
+
+    except FileNotFoundError:
+        return None
+
+    except (OSError, ValueError, KeyError, TypeError) as token_err:
+        print(f"Warning: The Kaggle API token could not be read: {str(token_err)}")
+        return None
+
+
+def _build_request(url: str) -> urllib.request.Request:
+    """
+    Builds the request for `url`, authenticated with the Kaggle API token for Kaggle URLs.
+
+    The credentials are added as an unredirected header, so they are never forwarded to the
+    storage server Kaggle redirects the download to.
+    """
+    request = urllib.request.Request(url)
+    credentials = (_load_kaggle_credentials()
+                   if urllib.parse.urlsplit(url).hostname == KAGGLE_HOST else None)
+    if credentials:
+        token = base64.b64encode(":".join(credentials).encode("utf-8")).decode("ascii")
+        request.add_unredirected_header("Authorization", f"Basic {token}")
+    return request
+
+
+def _file_sha256(file_path: str) -> str:
+    """Returns the SHA-256 digest of a file, read in `DOWNLOAD_CHUNK_SIZE` chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_overlapped(source, destination, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> str:
+    """
+    Copies `source` into `destination` and returns the SHA-256 digest of the copied data.
+
+    Chunks are written and hashed by a separate thread, so the next chunk is received from
+    the network while the previous one is written to disk. Both calls release the GIL.
+    At most `DOWNLOAD_QUEUE_SIZE` chunks are buffered between the two threads.
+
+    Raises:
+        OSError: If reading the source or writing the destination fails.
+    """
+    chunks: queue.Queue[bytes | None] = queue.Queue(maxsize=DOWNLOAD_QUEUE_SIZE)
+    digest = hashlib.sha256()
+    write_errors: list[BaseException] = []
+
+    def write_chunks() -> None:
+        while (chunk := chunks.get()) is not None:
+            if write_errors:
+                continue  # Keep draining so the reader is never blocked on a full queue
+            try:
+                destination.write(chunk)
+                digest.update(chunk)
+            except BaseException as write_err:
+                write_errors.append(write_err)
+
+    writer = threading.Thread(target=write_chunks, daemon=True)
+    writer.start()
+    try:
+        while not write_errors and (chunk := source.read(chunk_size)):
+            chunks.put(chunk)
+    finally:
+        chunks.put(None)
+        writer.join()
+
+    if write_errors:
+        raise write_errors[0]
+    return digest.hexdigest()
+
+
+def _load_download_metadata(metadata_path: str) -> dict[str, str | None]:
+    """Loads the metadata stored next to a cached archive, or an empty dict if there is none."""
+    try:
+        with open(metadata_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _remove_partial_file(partial_path: str) -> None:
+    """Removes a partially written cache file, ignoring it if it was never created."""
+    try:
+        os.remove(partial_path)
+    except OSError:
+        pass
+
+
+def download_and_extract(url: str, extract_to_folder: str, timeout: float = 120,
+                         cache_dir: str = DOWNLOAD_CACHE_DIR,
+                         force: bool = False) -> str | None:
+    """
+    Downloads a ZIP archive over HTTP and extracts it, without a browser.
+
+    The archive is cached in `cache_dir` under a name derived from the URL, together with
+    its ETag, Last-Modified date and SHA-256 digest. Later calls send a conditional request
+    and, if the server answers 304 Not Modified, extract the cached copy instead of
+    downloading it again.
+
+    Args:
+        url (str): URL of the ZIP archive.
+        extract_to_folder (str): Folder to extract the archive into.
+        timeout (float): Seconds to wait for the server before giving up. Defaults to 120.
+        cache_dir (str): Folder of the download cache. Defaults to `DOWNLOAD_CACHE_DIR`.
+        force (bool): Download the archive even if the cached copy is up to date.
+
+    Returns:
+        str | None: Top-level folder name of the archive that was downloaded (or reused) and
+            extracted, or None on failure.
+    """
+    cache_key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    archive_path = os.path.join(cache_dir, f"{cache_key}.zip")
+    metadata_path = os.path.join(cache_dir, f"{cache_key}.json")
+
+    try:
+        # Only revalidate a cached archive that is intact
+        metadata = _load_download_metadata(metadata_path)
+        is_cached = (not force and os.path.exists(archive_path)
+                     and metadata.get("sha256") == _file_sha256(archive_path))
+
+        request = _build_request(url)
+        if is_cached and metadata.get("etag"):
+            request.add_header("If-None-Match", metadata["etag"])
+        if is_cached and metadata.get("last_modified"):
+            request.add_header("If-Modified-Since", metadata["last_modified"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                os.makedirs(cache_dir, exist_ok=True)
+                partial_path = f"{archive_path}.part"
+                try:
+                    with open(partial_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as archive:
+                        archive_digest = _copy_overlapped(response, archive)
+                    os.replace(partial_path, archive_path)
+                except BaseException:
+                    _remove_partial_file(partial_path)
+                    raise
+
+                metadata = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "sha256": archive_digest,
+                }
+                # Replaced in one step, so an interrupted run never leaves half a JSON file
+                partial_metadata_path = f"{metadata_path}.part"
+                try:
+                    with open(partial_metadata_path, "w", encoding="utf-8") as file:
+                        json.dump(metadata, file, indent=4)
+                    os.replace(partial_metadata_path, metadata_path)
+                except BaseException:
+                    _remove_partial_file(partial_metadata_path)
+                    raise
+
+        except urllib.error.HTTPError as http_err:
+            if http_err.code != 304 or not is_cached:
+                raise
+            print("The dataset has not changed since the last download, using the cached copy.")
+
+        return unzip_file(archive_path, extract_to_folder, remove_zip=False)
+
+    except zipfile.BadZipFile as zip_err:
+        print(f"Error: The downloaded archive is not a valid ZIP file: {str(zip_err)}")
+
+    except (urllib.error.URLError, OSError) as url_err:
+        print(f"Error: The archive could not be downloaded: {str(url_err)}")
+
+    except ValueError as value_err:
+        print(f"Error: The archive could not be extracted: {str(value_err)}")
+
+    return None
+
+
+def _rename_extracted_folder(download_dir: str, extracted_name: str) -> str | None:
+    """
+    Renames the folder extracted from the dataset archive to `DATA_FOLDER_NAME`.
+
+    Returns:
+        str | None: The path of the renamed folder, or None if it could not be renamed.
+
+    Raises:
+        FileNotFoundError: If the extracted folder does not exist. Extraction is synchronous,
+            so a missing folder is an error rather than something worth waiting for.
+    """
+    # After extracting, find the folder named after the top-level folder of the archive
+    extracted_folder = os.path.join(download_dir, extracted_name)
+
+    if not os.path.isdir(extracted_folder):
+        raise FileNotFoundError(f"Expected extracted folder missing: {extracted_folder}")
+
+    # Rename the extracted folder
+    renamed_folder_path = rename_folder(extracted_folder, DATA_FOLDER_NAME)
+
+    if renamed_folder_path:
+        print(f"Folder renamed successfully to: {DATA_FOLDER_NAME}")
+    else:
+        print("Error: The folder could not be renamed.")
+    return renamed_folder_path
+
+
+def main(force: bool = False) -> str | None:
+    """
+    Downloads the dataset, extracts it and renames the extracted folder.
+
+    The archive is first downloaded directly from `DATASET_URL`, or reused from the cache
+    if it has not changed; the browser is only used if that fails, and it is always closed
+    when the workflow finishes.
+
+    Args:
+        force (bool): Download the archive even if the cached copy is up to date.
+
+    Returns:
+        str | None: The path of the dataset folder, or None if the dataset could not be
+            downloaded, extracted or renamed.
+    """
+    # Try the direct download first, it needs neither a browser nor a manual login
+    extracted_name = download_and_extract(DATASET_URL, os.getcwd(), force=force)
+    if extracted_name:
+        return _rename_extracted_folder(os.getcwd(), extracted_name)
+
     # Set up the browser and download the file
     driver = setup_browser()
     if driver is None:
         print("Error: The browser could not be started. Exiting.")
-    else:
-        try:
-            # Call the function to download the file
-            zip_file = download_file(driver)
-            if zip_file:
-                zip_file_path = os.path.join(os.getcwd(), zip_file)
-
-                # Unzip the file
-                unzip_file(zip_file_path, os.getcwd())
-
-                # After extracting, find the folder
-                extracted_folder = os.path.join(os.getcwd(), "Exploring factors influencing"
-                                                             " the impulse buying behavior of"
-                                                             " Vietnamese students on TikTok Shop"
-                                                )
-
-                # Wait for the folder to exist
-                while not os.path.exists(extracted_folder):
-                    print(f"Waiting for the folder to be extracted: {extracted_folder}")
-                    time.sleep(2)
-
-                # Rename the extracted folder
-                new_folder_name = "impulse_buying_data"
-                renamed_folder_path = rename_folder(extracted_folder, new_folder_name)
-
-                if renamed_folder_path:
-                    print(f"Folder renamed successfully to: {new_folder_name}")
-                else:
-                    print("Error: The folder could not be renamed.")
-            else:
-                print("Error: File could not be downloaded.")
-        finally:
-            # Close the browser after finishing
-            driver.quit()
+        return None
+
+    try:
+        # Call the function to download the file
+        zip_file = download_file(driver)
+        if not zip_file:
+            print("Error: File could not be downloaded.")
+            return None
+
+        zip_file_path = os.path.join(os.getcwd(), zip_file)
+
+        # Unzip the file and rename the extracted folder
+        extracted_name = unzip_file(zip_file_path, os.getcwd())
+        return _rename_extracted_folder(os.getcwd(), extracted_name)
+    finally:
+        # Close the browser after finishing
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main(force="--force" in sys.argv[1:])
@@ -23,7 +23,10 @@ Key Features:
 3. **Customizable Events**:
    - `on_click`: Handles mouse click events.
    - `on_release`: Detects mouse button release.
-   - `on_move`: Enables panning via mouse drag.
+   - `on_move`: Enables panning via mouse drag. Redraws are throttled to about 60 per
+     second, so a fast drag does not render the figure once per motion event.
+   - Keyboard panning, zooming and the other view changes use `draw_idle`, so Qt
+     renders once per event-loop pass however many changes were requested.
    - `on_scroll`: Implements zoom functionality centered on the cursor.
 
 4. **Other Utilities**:
@@ -32,8 +35,11 @@ Key Features:
    - `save_figure`: Opens a dialog to save the current graph in various formats
     (PNG, JPG, PDF, etc.).
 """
+# Standard library imports
+from functools import wraps
+
 # Third-party imports
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (QSizePolicy, QFileDialog, QInputDialog)
 from matplotlib.backend_bases import MouseEvent
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -41,6 +47,31 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 # Local project-specific imports
 from src.assets.utils import show_message
 
+# Constants
+PAN_REDRAW_INTERVAL_MS = 16  # At most one redraw per frame (~60 fps) while panning
+
+
+def _report_event_errors(handler):
+    """
+    Wrap a matplotlib event handler so an error is reported instead of propagating.
+
+    Keeps a single error handler per callback instead of a `try/except` in every body.
+
+    Args:
+        handler (Callable): The event handler method to wrap.
+
+    Returns:
+        Callable: The wrapped handler.
+    """
+    @wraps(handler)
+    def wrapper(self, event: MouseEvent) -> None:
+        try:
+            handler(self, event)
+        except Exception as gen_err:
+            print(f"❌ [ERROR] An error occurred in {handler.__name__}: {gen_err}")
+
+    return wrapper
+
 
 class GraphWidget(FigureCanvas):
     """
@@ -71,7 +102,22 @@ class GraphWidget(FigureCanvas):
         self._dragging: bool = False
         self._last_x: float | None = None
         self._last_y: float | None = None
-        self._annotations: dict = {}
+
+        # Axis being panned and its limits, kept up to date during a drag
+        self._ax = None
+        self._xlim: list[float] = []
+        self._ylim: list[float] = []
+
+        # Grid visibility, read from the figure on the first toggle
+        self._grid_visible: bool | None = None
+        self._annotations: list = []  # Added annotations, most recent last
+
+        # Throttle redraws while panning: motion events only schedule a draw
+        self._draw_pending: bool = False
+        self._draw_timer = QTimer(self)
+        self._draw_timer.setSingleShot(True)
+        self._draw_timer.setInterval(PAN_REDRAW_INTERVAL_MS)
+        self._draw_timer.timeout.connect(self._flush_pending_draw)
 
         # Connect mouse events for click, release, and movement
         self.mpl_connect('button_press_event', self.on_click)
@@ -165,6 +211,7 @@ class GraphWidget(FigureCanvas):
         # Use the show_message function to display the help content
         show_message(self, "Help", help_text)
 
+    @_report_event_errors
     def on_click(self, event: MouseEvent) -> None:
         """
         Handle mouse click events on the graph. Displays the X and Y
@@ -173,28 +220,23 @@ class GraphWidget(FigureCanvas):
         Args:
             event: The mouse event containing the click information.
         """
-        try:
-            if event.button == 1 and event.inaxes:  # Left mouse button and within axes
-                self._dragging = True
-                # Get the X position where the click occurred
-                self._last_x = event.xdata
-                # Get the Y value corresponding to the X position
-                self._last_y = event.ydata
-
-                if self._last_x is not None and self._last_y is not None:
-                    print(f"🖱️ [CLICK] Click detected at X: {self._last_x}, Y: {self._last_y}.")
-                else:
-                    print("🖱️ [CLICK] Click occurred outside of the data range.")
-            else:
-                print("⚠️ [WARNING] Invalid click. It might be outside of the plot"
-                      " or the wrong mouse button was used.")
-
-        except AttributeError as atr_err:
-            print(f"❌ [ERROR] An error occurred with the event attributes: {atr_err}")
+        if event.button == 1 and event.inaxes:  # Left mouse button and within axes
+            self._dragging = True
+            # Get the X position where the click occurred
+            self._last_x = event.xdata
+            # Get the Y value corresponding to the X position
+            self._last_y = event.ydata
+            self._cache_axis_limits(event.inaxes)
 
-        except Exception as gen_err:
-            print(f"❌ [ERROR] An unexpected error occurred: {gen_err}")
+            if self._last_x is not None and self._last_y is not None:
+                print(f"🖱️ [CLICK] Click detected at X: {self._last_x}, Y: {self._last_y}.")
+            else:
+                print("🖱️ [CLICK] Click occurred outside of the data range.")
+        else:
+            print("⚠️ [WARNING] Invalid click. It might be outside of the plot"
+                  " or the wrong mouse button was used.")
 
+    @_report_event_errors
     def on_release(self, event: MouseEvent) -> None:
         """
         Handle mouse release events to stop panning.
@@ -202,15 +244,14 @@ class GraphWidget(FigureCanvas):
         Args:
             event: The mouse release event.
         """
-        try:
-            if event.button == 1:  # Left mouse button
-                self._dragging = False
-        except AttributeError as atr_err:
-            print(f"❌ [ERROR] An error occurred with the event attributes: {atr_err}")
-
-        except Exception as gen_err:
-            print(f"❌ [ERROR] An unexpected error occurred: {gen_err}")
-
+        if event.button == 1:  # Left mouse button
+            self._dragging = False
+            if self._ax is not None:  # Report the view once per drag, not per motion event
+                print(f"🔍 [INFO] Drag ended with X limits: {tuple(self._xlim)},"
+                      f" Y limits: {tuple(self._ylim)}.")
+            self._ax = None
+
+    @_report_event_errors
     def on_move(self, event: MouseEvent) -> None:
         """
         Handle mouse movement events for panning the graph when dragging.
@@ -218,34 +259,54 @@ class GraphWidget(FigureCanvas):
         Args:
             event: The mouse move event.
         """
-        try:
-            if self._dragging and event.inaxes:
-                dx: float = event.xdata - self._last_x
-                dy: float = event.ydata - self._last_y
-
-                # Move the axis limits
-                axis = event.inaxes
-                xlim = axis.get_xlim()
-                ylim = axis.get_ylim()
-
-                # Adjust the axis limits to move the graph
-                axis.set_xlim(xlim[0] - dx, xlim[1] - dx)
-                axis.set_ylim(ylim[0] - dy, ylim[1] - dy)
-
-                # Update the last mouse position
-                self._last_x = event.xdata
-                self._last_y = event.ydata
-
-                # Redraw the canvas to reflect the change
-                self.draw()
+        if self._dragging and event.inaxes:
+            dx: float = event.xdata - self._last_x
+            dy: float = event.ydata - self._last_y
+
+            # Only query the limits again if the drag moved to another axis
+            if event.inaxes is not self._ax:
+                self._cache_axis_limits(event.inaxes)
+            xlim, ylim = self._xlim, self._ylim
+
+            # Adjust the cached limits in place and apply them to move the graph
+            xlim[0] -= dx
+            xlim[1] -= dx
+            ylim[0] -= dy
+            ylim[1] -= dy
+            self._ax.set_xlim(xlim[0], xlim[1])
+            self._ax.set_ylim(ylim[0], ylim[1])
+
+            # Update the last mouse position
+            self._last_x = event.xdata
+            self._last_y = event.ydata
+
+            # Schedule a redraw instead of rendering on every motion event
+            self._schedule_draw()
+
+    def _cache_axis_limits(self, axis) -> None:
+        """
+        Remember the axis being panned and its current limits.
 
-                print(f"🔍 [INFO] Graph panned by dx: {dx}, dy: {dy}.")
+        Args:
+            axis (matplotlib.axes.Axes): The axis under the mouse.
+        """
+        self._ax = axis
+        self._xlim = list(axis.get_xlim())
+        self._ylim = list(axis.get_ylim())
 
-        except AttributeError as atr_err:
-            print(f"❌ [ERROR] An error occurred with the event attributes: {atr_err}")
+    def _schedule_draw(self) -> None:
+        """
+        Request a redraw, coalescing all requests made within `PAN_REDRAW_INTERVAL_MS`.
+        """
+        self._draw_pending = True
+        if not self._draw_timer.isActive():
+            self._draw_timer.start()
 
-        except Exception as gen_err:
-            print(f"❌ [ERROR] An unexpected error occurred: {gen_err}")
+    def _flush_pending_draw(self) -> None:
+        """Redraw the canvas once if any redraw was requested since the last one."""
+        if self._draw_pending:
+            self._draw_pending = False
+            self.draw_idle()
 
     def pan_view(self, dx: float, dy: float) -> None:
         """
@@ -265,10 +326,12 @@ class GraphWidget(FigureCanvas):
         # Adjust the axis limits based on the pan direction (dx, dy)
         axis.set_xlim(x_min + dx, x_max + dx)
         axis.set_ylim(y_min + dy, y_max + dy)
+        self._ax = None  # Limits cached by a drag in progress are now stale
 
-        # Redraw the canvas to reflect the change
-        self.draw()
+        # Schedule a redraw; auto-repeated key presses coalesce into one render
+        self.draw_idle()
 
+    @_report_event_errors
     def on_scroll(self, event: MouseEvent) -> None:
         """
         Handle scroll events for zooming in and out on the graph.
@@ -276,64 +339,64 @@ class GraphWidget(FigureCanvas):
         Args:
             event: The mouse scroll event.
         """
-        try:
-            if event.inaxes:  # Ensure the scroll occurs within the plot area
-                axis = event.inaxes
-                x_min, x_max = axis.get_xlim()
-                y_min, y_max = axis.get_ylim()
-                x_range = x_max - x_min
-                y_range = y_max - y_min
-
-                # Determine zoom factor (0.9 for zooming in, 1.1 for zooming out)
-                zoom_factor: float = 0.9 if event.button == 'up' else 1.1
-
-                # Calculate new limits centered on the cursor
-                mouse_x, mouse_y = event.xdata, event.ydata
-                new_xlim = [
-                    mouse_x - (mouse_x - x_min) * zoom_factor,
-                    mouse_x + (x_max - mouse_x) * zoom_factor,
-                ]
-                new_ylim = [
-                    mouse_y - (mouse_y - y_min) * zoom_factor,
-                    mouse_y + (y_max - mouse_y) * zoom_factor,
-                ]
-
-                # Define zoom bounds (to prevent excessive zooming)
-                min_range = 0.02  # Minimum allowable range for both axes
-                max_range = 3 * max(x_range, y_range)  # Maximum allowable range
-
-                if (new_xlim[1] - new_xlim[0] < min_range or
-                        new_ylim[1] - new_ylim[0] < min_range):
-                    print("🔍 [INFO] Zoomed in too far, limit reached.")
-                    return
-                if (new_xlim[1] - new_xlim[0] > max_range or
-                        new_ylim[1] - new_ylim[0] > max_range):
-                    print("🔍 [INFO] Zoomed out too far, limit reached.")
-                    return
-
-                # Apply the new limits
-                axis.set_xlim(new_xlim)
-                axis.set_ylim(new_ylim)
-                self.draw()
-
-        except AttributeError as atr_err:
-            print(f"❌ [ERROR] An error occurred with the event attributes: {atr_err}")
-        except Exception as gen_err:
-            print(f"❌ [ERROR] An unexpected error occurred: {gen_err}")
+        if event.inaxes:  # Ensure the scroll occurs within the plot area
+            axis = event.inaxes
+            x_min, x_max = axis.get_xlim()
+            y_min, y_max = axis.get_ylim()
+            x_range = x_max - x_min
+            y_range = y_max - y_min
+
+            # Determine zoom factor (0.9 for zooming in, 1.1 for zooming out)
+            zoom_factor: float = 0.9 if event.button == 'up' else 1.1
+
+            # Calculate new limits centered on the cursor
+            mouse_x, mouse_y = event.xdata, event.ydata
+            new_xlim = [
+                mouse_x - (mouse_x - x_min) * zoom_factor,
+                mouse_x + (x_max - mouse_x) * zoom_factor,
+            ]
+            new_ylim = [
+                mouse_y - (mouse_y - y_min) * zoom_factor,
+                mouse_y + (y_max - mouse_y) * zoom_factor,
+            ]
+
+            # Define zoom bounds (to prevent excessive zooming)
+            min_range = 0.02  # Minimum allowable range for both axes
+            max_range = 3 * max(x_range, y_range)  # Maximum allowable range
+
+            if (new_xlim[1] - new_xlim[0] < min_range or
+                    new_ylim[1] - new_ylim[0] < min_range):
+                print("🔍 [INFO] Zoomed in too far, limit reached.")
+                return
+            if (new_xlim[1] - new_xlim[0] > max_range or
+                    new_ylim[1] - new_ylim[0] > max_range):
+                print("🔍 [INFO] Zoomed out too far, limit reached.")
+                return
+
+            # Apply the new limits
+            axis.set_xlim(new_xlim)
+            axis.set_ylim(new_ylim)
+            if axis is self._ax:  # Keep the limits of a drag in progress in sync
+                self._xlim, self._ylim = new_xlim, new_ylim
+            self.draw_idle()
 
     def reset_zoom(self) -> None:
         """Reset the graph zoom to fit the full data area."""
         axis = self.figure.gca()
         axis.autoscale()  # Matplotlib automatically adjust the limits
-        self.draw()
+        self._ax = None  # Limits cached by a drag in progress are now stale
+        self.draw_idle()
 
     def toggle_grid(self) -> None:
         """Toggle the visibility of the grid on the graph"""
         axis = self.figure.gca()
-        current_grid = axis._axisbelow
-        axis.grid(not current_grid)  # Toggle the grid state
-        axis._axisbelow = not current_grid
-        self.draw()  # Redraw the plot
+        if self._grid_visible is None:  # Some charts are created with a grid, others without
+            self._grid_visible = (any(line.get_visible() for line in axis.get_xgridlines()) or
+                                  any(line.get_visible() for line in axis.get_ygridlines()))
+
+        self._grid_visible = not self._grid_visible
+        axis.grid(self._grid_visible)  # Show or hide both axes' gridlines
+        self.draw_idle()  # Redraw the plot
 
 
     def add_annotation(self) -> None:
@@ -350,18 +413,16 @@ class GraphWidget(FigureCanvas):
                     bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
                     arrowprops=dict(arrowstyle='->')
                 )
-                self._annotations[text] = annotation
-                self.draw()
+                self._annotations.append(annotation)
+                self.draw_idle()
                 print(f"📝 [INFO] Added annotation: {text}")
 
 
     def delete_last_annotation(self) -> None:
         """Remove the last added annotation."""
         if self._annotations:
-            last_key = list(self._annotations.keys())[-1]
-            annotation = self._annotations.pop(last_key)
-            annotation.remove()
-            self.draw()
+            self._annotations.pop().remove()
+            self.draw_idle()
             print("🗑️ [INFO] Removed last annotation")
 
 
@@ -373,7 +434,7 @@ class GraphWidget(FigureCanvas):
             axis.legend()
         else:
             legend.remove()
-        self.draw()
+        self.draw_idle()
         print("📊 [INFO] Toggled legend visibility")
 
 
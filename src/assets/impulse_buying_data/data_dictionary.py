@@ -1,3 +1,11 @@
+# Standard library imports
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+# pandas is only imported when a column is decoded, so the tables stay cheap to import
+if TYPE_CHECKING:
+    import pandas as pd
+
 questions = {
     'SC1' : 'You think about the deadline for a promotion I can buy on TikTok Shop.',
     'SC2' : 'You are worried about the remaining time of the promotion when shopping on TikTok Shop.',
@@ -58,4 +66,46 @@ income = {
     2 : 'From 3 - 5 million',
     3 : 'From 5 - 10 million',
     4 : 'Over 10 million'
-}
\ No newline at end of file
+}
+
+
+# The lookup tables are shared by every module that imports them, so they are exposed as
+# read-only views and cannot be changed by one caller behind the others' backs
+questions = MappingProxyType(questions)
+answers = MappingProxyType(answers)
+gender = MappingProxyType(gender)
+school = MappingProxyType(school)
+income = MappingProxyType(income)
+
+# Labels ordered by code, so whole columns are decoded at once with `decode_codes`
+ANSWER_CATEGORIES = tuple(answers[code] for code in sorted(answers))
+GENDER_CATEGORIES = tuple(gender[code] for code in sorted(gender))
+SCHOOL_CATEGORIES = tuple(school[code] for code in sorted(school))
+INCOME_CATEGORIES = tuple(income[code] for code in sorted(income))
+
+
+def decode_codes(values: "pd.Series", categories: tuple[str, ...],
+                 first_code: int = 1) -> "pd.Series":
+    """
+    Decodes a column of survey codes into its labels in a single vectorized pass.
+
+    The result is a categorical Series holding small integer codes and one shared copy of
+    each label, instead of an object Series with a string per row. Codes outside the
+    table, or missing values, become NaN, as with `Series.map`.
+
+    Args:
+        values (pd.Series): The survey codes.
+        categories (tuple[str, ...]): The labels ordered by code, e.g. `ANSWER_CATEGORIES`.
+        first_code (int): The code of the first label. Defaults to 1.
+
+    Returns:
+        pd.Series: The decoded labels, with the index and name of `values`.
+    """
+    import pandas as pd
+
+    codes = pd.to_numeric(values, errors="coerce") - first_code
+    is_valid = codes.between(0, len(categories) - 1) & (codes % 1 == 0)
+    codes = codes.where(is_valid, -1).astype("int8")
+
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories),
+                     index=values.index, name=values.name)
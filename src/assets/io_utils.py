@@ -0,0 +1,163 @@
+"""
+Qt-free helpers for reading the survey workbook.
+
+This module holds the paths of the project's data and cache folders and the Excel
+reading helpers. It only depends on the standard library and pandas, so batch jobs such
+as the preprocessing pipeline and the dataset download can use it without loading Qt.
+
+Functions:
+----------
+1. `get_excel_cache_path(file_path: str) -> str | None`:
+   - Builds the path of the cached DataFrame for a given version of an Excel file.
+
+2. `_find_xlsx_file(folder_path: str) -> str | None`:
+   - Finds the first .xlsx file of a folder, remembering it until the folder changes.
+
+3. `read_xls_from_folder(folder_path: str = None) -> pd.DataFrame | None`:
+   - Reads the first .xlsx file of a folder, using the parsed copy cached on disk when
+     the file has not changed.
+"""
+# Standard library imports
+import hashlib
+import os
+from typing import TYPE_CHECKING
+
+# pandas is imported where it is used, so the login window (which imports this module
+# through utils) starts without it; MainWindow preloads it in the background instead
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Paths resolved once at import time
+ASSETS_DIR: str = os.path.dirname(os.path.abspath(__file__))
+# Default folder holding the survey workbook
+DATA_DIR: str = os.path.join(ASSETS_DIR, "impulse_buying_data")
+# Per-user cache shared by the downloaded dataset archive and the parsed workbook
+USER_CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "impulse_buying")
+# Directory where parsed Excel files are cached between runs
+EXCEL_CACHE_DIR: str = os.path.join(USER_CACHE_DIR, "excel")
+# Environment variable that disables the Excel cache when set to any non-empty value
+EXCEL_NO_CACHE_ENV: str = "IMPULSE_BUYING_NO_EXCEL_CACHE"
+
+# Workbook chosen in each folder, with the folder modification time it was chosen at
+_chosen_xlsx_files: dict[str, tuple[int, str | None]] = {}
+
+
+def get_excel_cache_path(file_path: str) -> str | None:
+    """
+    Builds the path of the cached DataFrame for an Excel file.
+
+    The cache file name starts with a hash of the file's absolute path, followed by a hash
+    of its size and modification time, so any change to the workbook invalidates its cached
+    copy and older copies of the same workbook can be found and removed.
+
+    Args:
+        file_path (str): Path to the Excel file.
+
+    Returns:
+        str | None: Path to the cache file, or None if caching is disabled through the
+            `IMPULSE_BUYING_NO_EXCEL_CACHE` environment variable or the file cannot be accessed.
+    """
+    if os.environ.get(EXCEL_NO_CACHE_ENV):
+        return None
+
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+
+    path_hash = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+    version_hash = hashlib.sha1(
+        f"{file_stat.st_size}:{file_stat.st_mtime_ns}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(EXCEL_CACHE_DIR, f"{path_hash}-{version_hash}.pkl")
+
+
+def _prune_excel_cache(cache_path: str) -> None:
+    """Removes the cached copies of older versions of the workbook cached in `cache_path`."""
+    cache_dir, cache_name = os.path.split(cache_path)
+    path_prefix = cache_name.split("-")[0] + "-"
+
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(path_prefix) and entry.name != cache_name:
+                try:
+                    os.remove(entry.path)
+                except OSError as os_err:
+                    print(f"⚠️ [WARNING] Could not remove the outdated cache file: {os_err}")
+
+
+def _find_xlsx_file(folder_path: str) -> str | None:
+    """
+    Returns the path of the first .xlsx file of a folder, or None if it has none.
+
+    The scan stops at the first matching regular file. Its result is kept until the
+    folder is modified, since adding, removing or renaming an entry changes the folder's
+    modification time, so later calls only need a single stat of the folder.
+    """
+    folder_key = os.path.abspath(folder_path)
+    folder_mtime = os.stat(folder_key).st_mtime_ns
+
+    chosen = _chosen_xlsx_files.get(folder_key)
+    if chosen is not None and chosen[0] == folder_mtime:
+        return chosen[1]
+
+    with os.scandir(folder_key) as entries:
+        file_path = next((entry.path for entry in entries
+                          if entry.is_file() and entry.name.endswith('.xlsx')), None)
+
+    _chosen_xlsx_files[folder_key] = (folder_mtime, file_path)
+    return file_path
+
+
+def read_xls_from_folder(folder_path: str = None) -> "pd.DataFrame | None":
+    """
+    Reads the first .xls or .xlsx file from a given folder.
+
+    The parsed DataFrame is cached on disk, so later calls for an unchanged file skip
+    the Excel parsing entirely.
+
+    Args:
+        folder_path (str): Path to the folder where the files are located.
+            Defaults to `DATA_DIR`.
+
+    Returns:
+        pd.DataFrame: Dataframe containing the data from the Excel file.
+        None: If no valid Excel files are found or an error occurs.
+    """
+    import pandas as pd
+
+    if folder_path is None:
+        folder_path = DATA_DIR
+
+    # Take the first .xlsx file found in the folder, without collecting the others
+    file_path = _find_xlsx_file(folder_path)
+
+    if file_path is None:
+        print("No Excel files found in the folder.")
+        return None
+
+    # Read the Excel file using pandas, or its cached copy if it has not changed
+    try:
+        cache_path = get_excel_cache_path(file_path)
+        if cache_path and os.path.exists(cache_path):
+            print(f"🔍 [DEBUG] Loading cached data for {file_path}")
+            # Only files written below by this function, in the user's own cache, are read
+            return pd.read_pickle(cache_path)  # nosec B301
+
+        df = pd.read_excel(file_path, engine="openpyxl")
+
+        if cache_path:
+            try:
+                os.makedirs(EXCEL_CACHE_DIR, exist_ok=True)
+                df.to_pickle(cache_path)
+                _prune_excel_cache(cache_path)
+            except OSError as os_err:
+                print(f"⚠️ [WARNING] Could not cache the parsed Excel file: {os_err}")
+
+        return df
+    except FileNotFoundError:
+        print(f"The file {file_path} was not found.")
+
+    except Exception as gen_err:
+        print(f"An error occurred while reading the file: {gen_err}")
+
+    return None
@@ -0,0 +1,135 @@
+"""
+Pandas Table Model for PySide6 Application.
+
+This module defines the `PandasModel` class, a read-only `QAbstractTableModel` that
+exposes a pandas DataFrame to a `QTableView`. Instead of allocating one
+`QTableWidgetItem` per cell, the view asks the model for the text of the cells it is
+currently painting, so the cost of showing a table grows with the visible area rather
+than with the size of the DataFrame.
+
+Key Features:
+-------------
+1. **Vectorized Cell Text**:
+   - The DataFrame is converted to strings once with `astype(str)`.
+   - Only the resulting array is kept; the DataFrame itself is not referenced.
+
+2. **Header Support**:
+   - Column names are used as horizontal headers.
+   - Row numbers (starting at 1) are used as vertical headers.
+
+3. **Data Replacement**:
+   - `set_dataframe` swaps the displayed data inside a model reset, so attached
+     views refresh once.
+   - `set_rows` does the same from plain column names and rows of values, for callers
+     that read small previews without pandas.
+   - When the new data has the same columns and number of rows, the existing cells are
+     updated in place with `dataChanged` instead of a reset, so views keep their state.
+     Both methods report whether the model was reset, so callers can skip work that
+     only a new layout needs, such as sizing the columns.
+"""
+# Third-party imports
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class PandasModel(QAbstractTableModel):
+    """
+    Read-only table model that displays the contents of a pandas DataFrame.
+    """
+
+    def __init__(self, df=None, parent=None) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            df (pandas.DataFrame | None): The DataFrame to display. Defaults to an empty table.
+            parent (QObject | None): Optional parent object.
+        """
+        super().__init__(parent)
+        self._columns: list[str] = []
+        self._cells: np.ndarray = np.empty((0, 0), dtype=object)
+
+        if df is not None:
+            self._load(df)
+
+    def _load(self, df) -> None:
+        """Store the column names and the cell texts of a DataFrame."""
+        self._columns = [str(column) for column in df.columns]
+        self._cells = df.astype(str).to_numpy()
+
+    def _replace(self, columns: list[str], cells: np.ndarray) -> bool:
+        """
+        Swap in new column names and cell texts, notifying the attached views.
+
+        A table with the same header and shape only reports its cells as changed, so views
+        keep their selection and scroll position. Otherwise the model is reset.
+
+        Returns:
+            bool: True if the model was reset, False if the cells were updated in place.
+        """
+        if columns == self._columns and cells.shape == self._cells.shape:
+            self._cells = cells
+            if cells.size:
+                self.dataChanged.emit(self.index(0, 0),
+                                      self.index(cells.shape[0] - 1, cells.shape[1] - 1),
+                                      [Qt.ItemDataRole.DisplayRole])
+            return False
+
+        self.beginResetModel()
+        self._columns = columns
+        self._cells = cells
+        self.endResetModel()
+        return True
+
+    def set_dataframe(self, df) -> bool:
+        """
+        Replace the displayed data.
+
+        Args:
+            df (pandas.DataFrame): The new DataFrame to display.
+
+        Returns:
+            bool: True if the model was reset, False if the cells were updated in place.
+        """
+        return self._replace([str(column) for column in df.columns], df.astype(str).to_numpy())
+
+    def set_rows(self, columns: list, rows: list[list]) -> bool:
+        """
+        Replace the displayed data with plain rows of values.
+
+        Rows shorter than the header are padded with empty cells and longer ones are cut.
+
+        Args:
+            columns (list): The column names.
+            rows (list[list]): The rows of cell values.
+
+        Returns:
+            bool: True if the model was reset, False if the cells were updated in place.
+        """
+        columns = [str(column) for column in columns]
+        width = len(columns)
+        cells = [[str(value) for value in row[:width]] + [""] * (width - len(row)) for row in rows]
+        return self._replace(columns, np.array(cells, dtype=object).reshape(len(cells), width))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of rows in the DataFrame."""
+        return 0 if parent.isValid() else self._cells.shape[0]
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns in the DataFrame."""
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
+        """Return the text of a cell for the display role."""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._cells[index.row(), index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
+        """Return column names for the horizontal header and row numbers for the vertical one."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return str(section + 1)
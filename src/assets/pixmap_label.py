@@ -0,0 +1,61 @@
+"""
+Scalable Pixmap Label for PySide6 Application.
+
+This module defines the `PixmapLabel` class, a `QLabel` that shows a pre-rendered image
+scaled to the space it is given. It replaces a matplotlib canvas for charts without
+interactive controls: the chart is rasterized once, and resizing the window only rescales
+the stored image instead of drawing the figure again.
+
+Key Features:
+-------------
+1. **Resize Handling**:
+   - Keeps the original pixmap and scales a copy of it in `resizeEvent`.
+   - Preserves the aspect ratio and uses smooth scaling.
+
+2. **Flexible Layout**:
+   - The label can shrink below the size of the image, so it never stops the window
+     from being made smaller.
+
+Classes:
+--------
+1. `PixmapLabel(QLabel)`:
+   - Displays a pixmap scaled to the label size.
+"""
+# Third-party imports
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QResizeEvent
+from PySide6.QtWidgets import QLabel, QSizePolicy
+
+
+class PixmapLabel(QLabel):
+    """
+    Label that displays a pixmap scaled to its current size, keeping the aspect ratio.
+    """
+
+    def __init__(self, pixmap: QPixmap, parent=None) -> None:
+        """
+        Initialize the label.
+
+        Args:
+            pixmap (QPixmap): The image to display at every size.
+            parent (QWidget | None): Optional parent widget.
+        """
+        super().__init__(parent)
+        self._original: QPixmap = pixmap
+
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(1, 1)  # The pixmap size must not become the minimum size
+        self.setPixmap(pixmap)
+
+    def original_pixmap(self) -> QPixmap:
+        """Return the unscaled pixmap."""
+        return self._original
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Rescale the original pixmap to the new size of the label."""
+        super().resizeEvent(event)
+        if not self._original.isNull() and not self.size().isEmpty():
+            self.setPixmap(self._original.scaled(self.size(),
+                                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                                 Qt.TransformationMode.SmoothTransformation))
@@ -57,7 +57,7 @@ import numpy as np
 import pandas as pd
 
 # Local project-specific imports
-from src.assets.utils import read_xls_from_folder
+from src.assets.io_utils import DATA_DIR, read_xls_from_folder
 
 
 def remove_outliers(df: pd.DataFrame, outlier_thresholds: dict = None) -> pd.DataFrame:
@@ -74,8 +74,6 @@ def remove_outliers(df: pd.DataFrame, outlier_thresholds: dict = None) -> pd.Dat
         pd.DataFrame: The dataframe with outliers removed.
     """
     try:
-        print("📂 Original DataFrame:")
-        print(df)
         print("⏳ [INFO] Starting outlier removal process...")
         # Select only numeric columns from the dataframe
         num_cols = df.select_dtypes(include=[np.number])
@@ -94,27 +92,27 @@ def remove_outliers(df: pd.DataFrame, outlier_thresholds: dict = None) -> pd.Dat
 
         print(f"📊 Outlier thresholds being used: {outlier_thresholds}")
 
-        # Iterate over each numeric column
-        for col in num_cols.columns:
-            # Get the upper bound for the current column
-            upper_bound = outlier_thresholds.get(col, 5)  # Default to 5 if no threshold is set
-            print(f"🔍 Processing column: {col}, Upper bound: {upper_bound}")
-
-            # Identify outliers in the current column
-            outliers = df[(df[col] < 0) | (df[col] > upper_bound)][col]
+        # Compare every numeric value with the upper bound of its column in one pass
+        upper_bounds = np.array([outlier_thresholds.get(col, 5)  # Default to 5 if not set
+                                 for col in num_cols.columns], dtype=float)
+        values = num_cols.to_numpy(dtype=float)
+        is_outlier = (values < 0) | (values > upper_bounds)
+        # Missing values fail the range check as well, so their rows are dropped too
+        is_in_range = (values >= 0) & (values <= upper_bounds)
 
-            # If outliers are found, print a warning with the outlier values
-            if not outliers.empty:
-                print(f"⚠️ [WARNING] Outliers detected in column '{col}':\n{outliers.tolist()}")
+        # If outliers are found, print a single warning with the count of each column
+        outlier_counts = is_outlier.sum(axis=0)
+        if outlier_counts.any():
+            counts_by_column = {col: int(count)
+                                for col, count in zip(num_cols.columns, outlier_counts) if count}
+            print(f"⚠️ [WARNING] Outliers detected (values per column): {counts_by_column}")
 
-            # Filter rows to exclude outliers
-            df = df[(df[col] >= 0) & (df[col] <= upper_bound)]
+        # Filter rows to exclude outliers, keeping only rows in range in every column
+        df = df[is_in_range.all(axis=1)]
 
         # Print a success message once the process is complete
         print("✅ [SUCCESS] Outlier removal process completed successfully."
               f" The dataset now contains {len(df)} rows.")
-        print("🔄 DataFrame after removing outliers")
-        print(df)
         return df
 
     except KeyError as key_err:
@@ -126,6 +124,56 @@ def remove_outliers(df: pd.DataFrame, outlier_thresholds: dict = None) -> pd.Dat
         return df
 
 
+def _count_values(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Counts how often each distinct value of an array occurs, ignoring missing values.
+
+    Each value is replaced by an integer code with `pd.factorize` and the codes are counted
+    with `np.bincount`, which avoids building the Series of `value_counts`.
+
+    Args:
+        values (np.ndarray): The values of a column.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The distinct values in ascending order, and the
+            number of times each one occurs.
+    """
+    codes, uniques = pd.factorize(values, sort=True, use_na_sentinel=True)
+    codes = codes[codes >= 0]  # Missing values are coded as -1
+    return uniques, np.bincount(codes, minlength=len(uniques))
+
+
+def _entropy_from_counts(counts: np.ndarray) -> float:
+    """
+    Calculates the entropy of a distribution from the counts of its values.
+
+    Args:
+        counts (np.ndarray): The number of occurrences of each distinct value.
+
+    Returns:
+        float: The entropy of the distribution, or 0 if there are no values.
+    """
+    if counts.size == 0:
+        return 0.0
+
+    # Every distinct value occurs at least once, so no probability is 0 and log2 is defined
+    probabilities = counts / counts.sum()
+    return float(-np.sum(probabilities * np.log2(probabilities)))
+
+
+def _values_entropy(values: np.ndarray) -> float:
+    """
+    Calculates the entropy of an array of values, ignoring missing values.
+
+    Args:
+        values (np.ndarray): The values of a column.
+
+    Returns:
+        float: The entropy of the values, or 0 if there are no non-missing values.
+    """
+    return _entropy_from_counts(_count_values(values)[1])
+
+
 def calculate_entropy(series: pd.Series) -> float:
     """
     Calculates the entropy of a column, which measures
@@ -146,19 +194,7 @@ def calculate_entropy(series: pd.Series) -> float:
         if not isinstance(series, pd.Series):
             raise TypeError("Input must be a pandas Series.")
 
-        # Drop missing values and calculate the value counts (probabilities)
-        value_counts = series.dropna().value_counts(normalize=True)
-
-        # If the series is empty or contains only NaN values, return 0
-        if value_counts.empty:
-            return 0.0
-
-        # Entropy formula: -sum(p * log2(p)) for each unique value's probability
-        # Avoid log2(0) by filtering out probabilities equal to 0
-        probabilities = value_counts[value_counts > 0]
-        entropy: float = -np.sum(probabilities * np.log2(probabilities))
-
-        return entropy
+        return _values_entropy(series.to_numpy())
 
     except TypeError as type_err:
         print(f"❌ [ERROR] Invalid input type: {type_err}")
@@ -200,14 +236,15 @@ def summary(df: pd.DataFrame) -> pd.DataFrame:
         # Initialize a summary DataFrame with the data types of each column
         summ: pd.DataFrame = pd.DataFrame(df.dtypes, columns=['Data Type'])
 
-        # Calculate missing data for each column
-        summ['Missing#'] = df.isna().sum()
-        summ['Missing%'] = df.isna().mean() * 100
+        # Calculate missing data for each column from a single null mask
+        missing: np.ndarray = df.isna().to_numpy().sum(axis=0)
+        summ['Missing#'] = missing
+        summ['Missing%'] = missing * (100.0 / len(df)) if len(df) else np.nan
 
         # Calculate the number of duplicate rows and unique values for each column
         summ['Dups'] = df.duplicated().sum()
         summ['Cardinality'] = df.nunique()
-        summ['Count'] = df.count()
+        summ['Count'] = len(df) - missing  # Non-missing values
 
 
         # Calculate descriptive statistics only for numeric columns
@@ -223,11 +260,20 @@ def summary(df: pd.DataFrame) -> pd.DataFrame:
             summ['75%'] = desc['75%']
             summ['IQR'] = summ['75%'] - summ['25%'] # Interquartile range (IQR)
 
+        # Count the values of each column once, for both its entropy and its mode
+        entropies: list[float] = []
+        modes: list = []
+        for _, column in df.items():
+            uniques, counts = _count_values(column.to_numpy())
+            entropies.append(_entropy_from_counts(counts))
+            # Like DataFrame.mode, the smallest of the most frequent values
+            modes.append(uniques[counts.argmax()] if counts.size else np.nan)
+
         # Calculate the entropy of all columns
-        summ['Entropy'] = df.apply(calculate_entropy)
+        summ['Entropy'] = entropies
 
-        # Calculate the mode only for numeric columns
-        summ['Mode'] = df.mode().iloc[0] # First value of mode (most frequent value)
+        # Calculate the mode of all columns (most frequent value)
+        summ['Mode'] = modes
 
         # Calculate skewness and kurtosis only for numeric columns
         if not num_cols.empty:
@@ -238,34 +284,30 @@ def summary(df: pd.DataFrame) -> pd.DataFrame:
 
         # Calculate outliers for numeric columns using IQR method
         if not num_cols.empty:
-            summ['Outliers'] = num_cols.apply(lambda x: sum(
-                # Lower bound for outliers
-                (x < (desc.loc[x.name, '25%'] - 1.5 * summ.loc[x.name, 'IQR'])) |
-                # Upper bound for outliers
-                (x > (desc.loc[x.name, '75%'] + 1.5 * summ.loc[x.name, 'IQR']))
-            ))
-
-        # Handle the case of missing rows for first, second, and third values
-        first_values: np.ndarray = df.head(3).values
-        for i, col in enumerate(df.columns):
-            # Check the column's data type before assigning values
-            if summ.at[col, 'Data Type'] in ['int64', 'float64']: # For numeric columns
-
-                summ.at[col, 'First Value'] = first_values[0, i] if len(first_values) > 0 else None
-                summ.at[col, 'Second Value'] = first_values[1, i] if len(first_values) > 1 else None
-                summ.at[col, 'Third Value'] = first_values[2, i] if len(first_values) > 2 else None
+            # Bounds of every column as vectors, compared with all the values at once
+            first_quartiles = desc['25%'].to_numpy()
+            third_quartiles = desc['75%'].to_numpy()
+            iqr = third_quartiles - first_quartiles
+            lower_bounds = first_quartiles - 1.5 * iqr  # Lower bound for outliers
+            upper_bounds = third_quartiles + 1.5 * iqr  # Upper bound for outliers
+
+            # Missing values compare as False, so they are never counted as outliers
+            values = num_cols.to_numpy(dtype=float)
+            is_outlier = (values < lower_bounds) | (values > upper_bounds)
+            summ['Outliers'] = pd.Series(is_outlier.sum(axis=0), index=num_cols.columns)
+
+        # Handle the case of missing rows for first, second, and third values.
+        # Each position is assigned to all the columns at once: numeric columns keep their
+        # values (as floats) and the rest are converted to strings in one vectorized pass
+        first_rows: pd.DataFrame = df.head(3)
+        is_numeric: pd.Series = summ['Data Type'].astype(str).isin(['int64', 'float64'])
+        for position, label in enumerate(['First Value', 'Second Value', 'Third Value']):
+            if position < len(first_rows):
+                values: pd.Series = first_rows.iloc[position]
+                summ[label] = values.astype(str).where(
+                    ~is_numeric, values[is_numeric].astype(float))
             else:
-                # Ensure that non-numeric columns have 'object' type (for strings)
-                if col in summ.columns:  # Check if the column exists in `summ`
-                    summ[col] = summ[col].astype('object')
-
-                # Assign the values as strings
-                summ.at[col, 'First Value'] = str(first_values[0, i]) if len(
-                    first_values) > 0 else None
-                summ.at[col, 'Second Value'] = str(first_values[1, i]) if len(
-                    first_values) > 1 else None
-                summ.at[col, 'Third Value'] = str(first_values[2, i]) if len(
-                    first_values) > 2 else None
+                summ[label] = None
 
         print("✅ [SUCCESS] Dataset summary generated successfully.")
         return summ
@@ -279,17 +321,22 @@ def summary(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def main(output_dir=None):
+def main(output_dir=None) -> tuple[pd.DataFrame, pd.DataFrame] | None:
     """
     Main function for running the preprocessing pipeline.
     Args:
         output_dir (str): Optional path where the output files will be saved.
                           Defaults to the directory of this script.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame] | None: The cleaned data and its summary, as
+            saved to the CSV files, so callers can show them without reading the files
+            back. None if an error occurred.
     """
     try:
         # Set default output directory if not provided
         if output_dir is None:
-            output_dir = os.path.join(os.path.dirname(__file__), "impulse_buying_data")
+            output_dir = DATA_DIR
 
         # Ensure the output directory exists
         os.makedirs(output_dir, exist_ok=True)
@@ -311,11 +358,11 @@ def main(output_dir=None):
         print("DataFrame after outlier removal:")
         print(df)
 
-        # Clean the data by dropping rows with missing values
-        df = df.dropna()
-
-        # Remove duplicate rows
-        df = df.drop_duplicates()
+        # Clean the data by dropping rows with missing values and duplicate rows in one
+        # selection. A duplicate of a row with missing values has them too, so finding
+        # duplicates before dropping those rows keeps the same rows as doing it after
+        keep_rows: np.ndarray = (~df.isna().any(axis=1).to_numpy()) & (~df.duplicated().to_numpy())
+        df = df[keep_rows]
         print("✅ [SUCCESS] Duplicates removed and missing data handled.")
 
         # Save the cleaned and transformed DataFrame to a CSV file
@@ -331,8 +378,11 @@ def main(output_dir=None):
 
         print(f"✅ [SUCCESS] Summary saved to: {processed_data_path}")
 
+        return df, summary_df
+
     except Exception as gen_err:
         print(f"❌ [ERROR] An error occurred during data processing: {gen_err}")
+        return None
 
 
 if __name__ == "__main__":
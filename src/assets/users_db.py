@@ -14,6 +14,10 @@ from src.assets.custom_errors import DatabaseError, ValidationError, UserNotFoun
 # Path to the file simulating the user's database
 DB_FILE: str = os.path.join(os.getcwd(), "assets", "users_db.json")
 
+# In-memory copy of the users database used by username lookups, together with the
+# modification time of the file it was read from
+_users_db_cache: dict = {"mtime": None, "users": {}}
+
 
 def validate_users_db(users_db: dict[str, dict[str, str]]) -> bool:
     """
@@ -113,6 +117,38 @@ def save_users_db(users_db: dict[str, dict[str, str]]) -> None:
         raise DatabaseError("Unexpected error while saving the database.") from gen_err
 
 
+def _load_users_db_cached() -> dict[str, dict[str, str]]:
+    """
+    Return the users database, reading the file only if it changed since the last read.
+
+    Returns:
+        dict: The users database.
+
+    Raises:
+        DatabaseError: If the users database cannot be loaded.
+    """
+    try:
+        mtime = os.stat(DB_FILE).st_mtime_ns
+    except OSError:
+        mtime = None  # Missing file: nothing to cache
+
+    if mtime is not None and _users_db_cache["mtime"] == mtime:
+        print("🔍 [DEBUG] Users database unchanged, using the cached copy.")
+        return _users_db_cache["users"]
+
+    users_db = load_users_db()
+    if mtime is not None:
+        _users_db_cache["mtime"] = mtime
+        _users_db_cache["users"] = users_db
+    return users_db
+
+
+def clear_users_db_cache() -> None:
+    """Discard the cached users database, so the next lookup reads the file again."""
+    _users_db_cache["mtime"] = None
+    _users_db_cache["users"] = {}
+
+
 def add_user_to_db(username: str, email: str, password: str) -> None:
     """
     Add a new user to the database.
@@ -159,6 +195,7 @@ def add_user_to_db(username: str, email: str, password: str) -> None:
 
         # Save changes to the file
         save_users_db(users_db)
+        clear_users_db_cache()
         print(f"✅ [SUCCESS] 👤 User '{username}' added successfully.")
 
     except ValidationError as valid_err:
@@ -178,6 +215,9 @@ def get_user_by_username(username: str) -> dict[str, str] | None:
     """
     Get the data of a user by their username.
 
+    The users database is kept in memory between calls and only read again when the
+    file changes, so repeated lookups (e.g. failed logins) skip the disk read.
+
     Args:
         username (str): The username.
 
@@ -188,7 +228,7 @@ def get_user_by_username(username: str) -> dict[str, str] | None:
         DatabaseError: If there is an issue accessing the database.
     """
     try:
-        users_db = load_users_db()
+        users_db = _load_users_db_cached()
         if users_db.get(username):
             print(f"✅ [INFO] User '{username}' found.")
         else:
@@ -1,14 +1,14 @@
 # Standard library imports
-import os
 import re
 
 # Third-party imports
-import pandas as pd
 from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QMessageBox, QLabel
 
 # Local imports
 from src.assets.regex import PASSWORD_REGEX, USERNAME_REGEX
+# The Excel helpers live in a Qt-free module and are re-exported for existing imports
+from src.assets.io_utils import DATA_DIR, read_xls_from_folder
 
 
 def show_message(parent, title: str, message: str) -> None:
@@ -33,45 +33,6 @@ def show_message(parent, title: str, message: str) -> None:
         print(f"❌ [ERROR] Failed to display message box. Error: {gen_err}")
 
 
-def read_xls_from_folder(folder_path: str = None) -> pd.DataFrame | None:
-    """
-    Reads the first .xls or .xlsx file from a given folder.
-
-    Args:
-        folder_path (str): Path to the folder where the files are located.
-
-    Returns:
-        pd.DataFrame: Dataframe containing the data from the Excel file.
-        None: If no valid Excel files are found or an error occurs.
-    """
-    if folder_path is None:
-        project_root = os.path.dirname(os.path.abspath(__file__))
-        folder_path = os.path.join(project_root, 'impulse_buying_data')
-
-    # Search for .xls or .xlsx files in the folder
-    xls_files = [file for file in os.listdir(folder_path) if file.endswith('.xlsx')]
-
-    if not xls_files:
-        print("No Excel files found in the folder.")
-        return None
-
-    # Take the first Excel file found
-    xls_file = xls_files[0]
-    file_path = os.path.join(folder_path, xls_file)
-
-    # Read the Excel file using pandas
-    try:
-        df = pd.read_excel(file_path)
-        return df
-    except FileNotFoundError:
-        print(f"The file {file_path} was not found.")
-
-    except Exception as gen_err:
-        print(f"An error occurred while reading the file: {gen_err}")
-
-    return None
-
-
 class ValidatorBase:
     """
     Base class for validators (e.g., PasswordValidator, UsernameValidator).
@@ -82,6 +43,8 @@ class ValidatorBase:
         _timer (QTimer): Timer used to hide labels after a period of inactivity.
         _requirements (list[str]): List of requirement descriptions for validation.
         _validation_state (list[bool]): List to store the validation status of each requirement.
+        _rules (list[tuple[re.Pattern, QLabel]] | None): Compiled patterns paired with their
+            labels, built on first use once the labels exist.
 
     Methods:
         create_labels(): Creates and returns requirement labels.
@@ -90,6 +53,9 @@ class ValidatorBase:
         validate_input(input_text, regex_list, validation_status): Validates the input based on
             regex rules.
     """
+    # Compiled patterns of the requirements, in label order; set by each validator
+    _PATTERNS: tuple[re.Pattern, ...] = ()
+
     def __init__(self, requirements: list[str], timer_interval=2000) -> None:
         """
         Initializes the validator with given requirements and timer interval.
@@ -105,6 +71,7 @@ class ValidatorBase:
         self._timer.timeout.connect(self.hide_labels)
         self._requirements: list[str] = requirements # List of requirement descriptions
         self._validation_state: list[bool] = [False] * len(requirements) # Store req´s validation
+        self._rules: list[tuple[re.Pattern, QLabel]] | None = None
         print(f"🔄 [INFO] Validator initialized with {len(requirements)} requirements.")
 
 
@@ -174,15 +141,16 @@ class ValidatorBase:
 
 
     @staticmethod
-    def validate_input(input_text: str, regex_list: list[tuple[str, QLabel]],
+    def validate_input(input_text: str, regex_list: list[tuple[re.Pattern | str, QLabel]],
                        validation_status: list[bool]) -> bool:
         """
         Validates the input using provided regex rules and updates label styles.
 
         Args:
             input_text (str): The input text to validate.
-            regex_list (list[tuple[str, QLabel]]): A list of tuples containing regex patterns and
-                corresponding QLabel objects.
+            regex_list (list[tuple[re.Pattern | str, QLabel]]): A list of tuples containing
+                regex patterns and corresponding QLabel objects. Patterns compiled in advance
+                are used as they are; strings are compiled on each call.
             validation_status (list[bool]): A list of validation statuses,
                 updated for each requirement.
 
@@ -196,7 +164,8 @@ class ValidatorBase:
         try:
             all_requirements_met: bool = True
             for index, (regex, label) in enumerate(regex_list):
-                is_valid = bool(re.search(regex, input_text))
+                pattern = regex if isinstance(regex, re.Pattern) else re.compile(regex)
+                is_valid = pattern.search(input_text) is not None
 
                 if is_valid and not validation_status[index]:
                     label.setStyleSheet("color: green;")
@@ -218,6 +187,20 @@ class ValidatorBase:
             print(f"❌ [ERROR] Unexpected error during input validation: {gen_err}")
             return False
 
+    def _get_rules(self) -> list[tuple[re.Pattern, QLabel]]:
+        """
+        Returns the compiled patterns paired with their labels, pairing them on first use.
+
+        Returns:
+            list[tuple[re.Pattern, QLabel]]: One (pattern, label) pair per requirement.
+
+        Raises:
+            ValueError: If the labels have not been created yet.
+        """
+        if self._rules is None:
+            self._rules = list(zip(self._PATTERNS, self._labels, strict=True))
+        return self._rules
+
     def get_timer(self) -> QTimer:
         """
         Getter for the timer.
@@ -237,6 +220,11 @@ class PasswordValidator(ValidatorBase):
         validate_password(password: str): Validates the password using regex patterns and
             updates label styles.
     """
+    # Uppercase, lowercase, number, special character and length requirements, compiled once
+    # and shared by every instance
+    _PATTERNS: tuple[re.Pattern, ...] = tuple(
+        re.compile(PASSWORD_REGEX[key]) for key in ('upper', 'lower', 'number', 'special', 'length'))
+
     def __init__(self):
         """
         Initializes the password validator with predefined password requirements.
@@ -271,14 +259,7 @@ class PasswordValidator(ValidatorBase):
                 print("🔍 [INFO] Starting password validation.")
                 self.validation_started = True
 
-            requirements = [
-                (PASSWORD_REGEX['upper'], self.get_labels()[0]),   # At least one uppercase
-                (PASSWORD_REGEX['lower'], self.get_labels()[1]),   # At least one lowercase
-                (PASSWORD_REGEX['number'], self.get_labels()[2]),  # At least one number
-                (PASSWORD_REGEX['special'], self.get_labels()[3]), # At least one special character
-                (PASSWORD_REGEX['length'], self.get_labels()[4]),  # At least 8 characters
-            ]
-            return self.validate_input(password, requirements, self._validation_state)
+            return self.validate_input(password, self._get_rules(), self._validation_state)
 
         except Exception as gen_err:
             print(f"❌ [ERROR] Unexpected error during password validation. Error: {gen_err}")
@@ -294,6 +275,12 @@ class UsernameValidator(ValidatorBase):
         validate_username(username: str): Validates the username using regex patterns and
             updates label styles.
     """
+    # Length, valid characters, alphanumeric start and alphanumeric end requirements,
+    # compiled once and shared by every instance
+    _PATTERNS: tuple[re.Pattern, ...] = tuple(
+        re.compile(USERNAME_REGEX[key])
+        for key in ('length', 'valid_chars', 'start_alnum', 'end_alnum'))
+
     def __init__(self):
         """
         Initializes the username validator with predefined username requirements.
@@ -327,13 +314,7 @@ class UsernameValidator(ValidatorBase):
                 print("🔍 [INFO] Starting username validation.")
                 self._validation_started = True
 
-            requirements = [
-                (USERNAME_REGEX['length'], self.get_labels()[0]),       # length
-                (USERNAME_REGEX['valid_chars'], self.get_labels()[1]),  # valid characters
-                (USERNAME_REGEX['start_alnum'], self.get_labels()[2]),  # start with alphanumeric
-                (USERNAME_REGEX['end_alnum'], self.get_labels()[3]),    # end with alphanumeric
-            ]
-            return self.validate_input(username, requirements, self._validation_state)
+            return self.validate_input(username, self._get_rules(), self._validation_state)
 
         except Exception as gen_err:
             print(f"❌ [ERROR] Unexpected error during username validation. Error: {gen_err}")
@@ -74,7 +74,7 @@ STYLES = {
             max-height: 206px;
         }
     
-        QTableWidget {
+        QTableView {
             width: 100%;
             border: 1px solid #8ED0F8; /* Light borders around the table */
             border-radius: 5px; /* Rounded corners */
@@ -82,7 +82,7 @@ STYLES = {
             gridline-color: #8ED0F8;
         }
     
-        QTableWidget::item {
+        QTableView::item {
             padding: 8px;
             font-size: 16px;
             background-color: white;
@@ -90,7 +90,7 @@ STYLES = {
             border-bottom: 1px solid #e1e1e1; /* Separators between rows */
         }
     
-        QTableWidget::item:selected {
+        QTableView::item:selected {
             background-color: #8ED0F8; /* Color when a cell is selected */
             color: white;
         }
@@ -102,7 +102,7 @@ STYLES = {
             padding: 5px;
         }
     
-        QTableWidget QTableCornerButton::section {
+        QTableView QTableCornerButton::section {
             background-color: transparent; /* No background color for corners */
         }
     
@@ -20,7 +20,7 @@ Main Functions:
 
 Dependencies:
     Core: pandas, matplotlib, seaborn
-    Local: data_dictionary (questions, answers, gender, school, income)
+    Local: data_dictionary (questions, gender, school, income, *_CATEGORIES, decode_codes)
 
 Customization Parameters:
     - category_order: Override default response ordering
@@ -33,19 +33,26 @@ Customization Parameters:
 import textwrap
 
 # Third-party imports
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import seaborn as sns
+from matplotlib.artist import setp
 from matplotlib.figure import Figure
 from pandas import DataFrame
 
+# seaborn is imported by the chart functions on first use, so importing this module (done
+# when the dashboard builds its question selector) does not load it
+
 # Local project-specific imports
 from src.assets.impulse_buying_data.data_dictionary import (
     questions,
-    answers,
     gender,
     school,
-    income
+    income,
+    ANSWER_CATEGORIES,
+    GENDER_CATEGORIES,
+    SCHOOL_CATEGORIES,
+    INCOME_CATEGORIES,
+    decode_codes
 )
 from src.styles.styles import STYLES
 
@@ -56,6 +63,109 @@ from src.styles.styles import STYLES
 DEFAULT_CATEGORY_ORDER = ['Very disagree', 'Disagree', 'Normal', 'Agree', 'Very agree']
 DEFAULT_FIGSIZE = (8, 6)        # Default width and height of the figure
 SCHOOL_FIGSIZE = (10, 6)        # Width and height of the school figure
+# Ordered answer dtype for the default order, built once instead of on every chart
+DEFAULT_ANSWER_DTYPE = pd.CategoricalDtype(DEFAULT_CATEGORY_ORDER, ordered=True)
+# Labels and first code of each demographic column, to decode it into a categorical
+GROUP_CODES = {
+    'Q2_GENDER': (GENDER_CATEGORIES, min(gender)),
+    'Q3_SCHOOL': (SCHOOL_CATEGORIES, min(school)),
+    'Q4_INCOME': (INCOME_CATEGORIES, min(income))
+}
+
+
+def _answer_dtype(category_order: list[str]) -> pd.CategoricalDtype:
+    """Returns the ordered answer dtype for a category order, reusing the default one."""
+    if category_order == DEFAULT_CATEGORY_ORDER:
+        return DEFAULT_ANSWER_DTYPE
+    return pd.CategoricalDtype(category_order, ordered=True)
+
+
+def _decode_grouped_answers(df: DataFrame, selected_question: str,
+                            group_column: str) -> DataFrame:
+    """
+    Decodes the answers of a question and the demographic group of each respondent.
+
+    Both columns become categoricals, so the counts are keyed on small integer codes
+    instead of strings.
+
+    Args:
+        df (DataFrame): Survey data with the coded answers
+        selected_question (str): Column name of the question to decode
+        group_column (str): Demographic column, one of the keys of `GROUP_CODES`
+
+    Returns:
+        DataFrame: The decoded question and group columns, with the index of `df`.
+    """
+    group_categories, first_code = GROUP_CODES[group_column]
+    return pd.DataFrame({
+        selected_question: decode_codes(df[selected_question], ANSWER_CATEGORIES),
+        group_column: decode_codes(df[group_column], group_categories, first_code)
+    })
+
+
+def _count_answers_by_group(processed_df: DataFrame, group_column: str,
+                            selected_question: str) -> DataFrame:
+    """
+    Counts the answers of a question for every group in a single pass over their codes.
+
+    Args:
+        processed_df (DataFrame): Decoded answers and group labels of each respondent
+        group_column (str): Column holding the group of each respondent
+        selected_question (str): Categorical column holding the decoded answers
+
+    Returns:
+        DataFrame: One row per group and answer category, with the number of answers
+            in a 'counts' column. Groups are sorted by label, and categories without
+            answers are kept with a count of 0.
+    """
+    groups = processed_df[group_column].astype('category')
+    answers = processed_df[selected_question]
+    # Widened so the combined code cannot overflow the int8 codes of small categoricals
+    group_codes = groups.cat.codes.to_numpy().astype(np.int64)
+    answer_codes = answers.cat.codes.to_numpy()
+    n_answers = len(answers.cat.categories)
+
+    # Count every (group, answer) pair at once on a combined code, missing values excluded
+    is_answered = (group_codes >= 0) & (answer_codes >= 0)
+    counts = np.bincount(group_codes[is_answered] * n_answers + answer_codes[is_answered],
+                         minlength=len(groups.cat.categories) * n_answers).reshape(-1, n_answers)
+
+    # Keep every group that appears, even when none of its answers is valid
+    labels = groups.cat.categories.to_numpy(dtype=object)
+    group_order = sorted(np.unique(group_codes[group_codes >= 0]), key=labels.__getitem__)
+
+    answer_order = np.tile(np.arange(n_answers), len(group_order))
+    return pd.DataFrame({
+        group_column: np.repeat(labels[group_order], n_answers),
+        selected_question: pd.Categorical.from_codes(answer_order, dtype=answers.dtype),
+        'counts': counts[group_order].ravel()
+    })
+
+
+def _add_value_labels(axis) -> None:
+    """
+    Writes the count of every bar just below its top.
+
+    Args:
+        axis (matplotlib.axes.Axes): Axis holding the bars drawn by seaborn
+    """
+    bar_style = STYLES["chart"]["bar"]
+    text_style = {
+        "ha": 'center',                             # Horizontal alignment: Center
+        "va": 'bottom',                             # Vertical alignment: Bottom
+        "color": bar_style["color"],                # Text color
+        "fontsize": bar_style["fontsize"],          # Font size
+        "fontweight": bar_style["fontweight"]       # Font weight
+    }
+
+    for bar in axis.patches:
+        height = bar.get_height()
+        axis.text(
+            bar.get_x() + bar.get_width() / 2,      # X position: Center of the bar
+            height - 0.1,                           # Y position: Slightly below the top of the bar
+            f'{int(height)}',                       # Display the count value
+            **text_style
+        )
 
 
 def create_bar_chart_general(
@@ -64,7 +174,7 @@ def create_bar_chart_general(
         category_order: list[str] | None = None,
         figsize: tuple[int, int] = DEFAULT_FIGSIZE,
         palette: str = STYLES["chart"]["palettes"]["general"]
-) -> plt.Figure | None:
+) -> Figure | None:
     """
     Generates a bar chart for a selected survey question with integrated error handling.
     Args:
@@ -84,11 +194,13 @@ def create_bar_chart_general(
         Exception: Unexpected errors during execution
 
     Notes:
-        - Maps responses using the `answers` dictionary
+        - Decodes responses with `decode_codes` and `ANSWER_CATEGORIES`
         - Supports custom category ordering
         - Handles null values and excludes them from tests_visualization
         - Adds value labels on top of bars for clarity
     """
+    import seaborn as sns
+
     try:
         # ======================
         # INPUT VALIDATION
@@ -115,13 +227,11 @@ def create_bar_chart_general(
         # DATA PROCESSING
         # ======================
 
-        # Map the answers using the `answers` dictionary
-        mapped_answers_df: DataFrame = pd.DataFrame(
-            {selected_question: df[selected_question].map(answers)}
-        )
+        # Decode the answers in a single vectorized pass
+        mapped_answers: pd.Series = decode_codes(df[selected_question], ANSWER_CATEGORIES)
 
         # Check for null values in the mapped answers
-        if mapped_answers_df[selected_question].isnull().any():
+        if mapped_answers.isnull().any():
             print(f"⚠️ [WARNING] Null values found for the question '{selected_question}'."
                   f" These will be excluded.")
 
@@ -133,11 +243,13 @@ def create_bar_chart_general(
         # DATA ANALYSIS
         # ======================
 
-        # Count the number of answers for each category
-        response_counts: pd.Series = mapped_answers_df[selected_question].value_counts()
-
-        # Reindex the categories according to the defined order and fill missing values with 0
-        response_counts = response_counts.reindex(category_order, fill_value=0)
+        # Count the answers of each category in the defined order with a single bincount
+        answer_codes = mapped_answers.astype(_answer_dtype(category_order)).cat.codes.to_numpy()
+        response_counts: pd.Series = pd.Series(
+            np.bincount(answer_codes[answer_codes >= 0], minlength=len(category_order)),
+            index=pd.Index(category_order, name=selected_question),
+            name='count'
+        )
 
         # Check if there are no valid responses
         if response_counts.sum() == 0:
@@ -148,31 +260,23 @@ def create_bar_chart_general(
         # VISUALIZATION
         # ======================
 
-        # Initialize figure
-        figure, axis = plt.subplots(figsize=figsize)
+        # Initialize the figure outside pyplot, so it is not kept in its list of open figures
+        figure = Figure(figsize=figsize)
+        axis = figure.subplots()
 
         # Create Seaborn barplot
-        axis = sns.barplot(
+        sns.barplot(
             x=response_counts.index,                # x-axis: Response categories (index of counts)
             y=response_counts.values,                       # y_axis: Count values
             palette=palette,                                # Color scheme from input parameter
             edgecolor=STYLES["chart"]["bar"]["edgecolor"],  # White borders between bars
-            hue=response_counts.index                       # Color differentiation by category
+            hue=response_counts.index,                      # Color differentiation by category
+            errorbar=None,                                  # Counts have no error bars to estimate
+            ax=axis                                         # Draw on the figure created above
         )
 
         # Add values on top of the bars
-        for bar in axis.patches:
-            value: int = int(bar.get_height())      # Get the height of the bar (frequency)
-            axis.text(
-                bar.get_x() + bar.get_width() / 2,      # X position: Center of the bar
-                bar.get_height() - 0.1,                 # Y position: Slightly below the top of the bar
-                f'{value}',                          # Text to display (the count)
-                ha='center',                            # Horizontal alignment: Center
-                va='bottom',                            # Vertical alignment: Bottom
-                color=STYLES["chart"]["bar"]["color"],              # Text color
-                fontsize=STYLES["chart"]["bar"]["fontsize"],        # Font size
-                fontweight=STYLES["chart"]["bar"]["fontweight"]     # Font weight
-            )
+        _add_value_labels(axis)
 
         # ======================
         # STYLING
@@ -186,29 +290,30 @@ def create_bar_chart_general(
         wrapped_title: str = textwrap.fill(question_title, width=40)
 
         # Apply title styling
-        plt.title(wrapped_title, **STYLES["chart"]["title"])
+        axis.set_title(wrapped_title, **STYLES["chart"]["title"])
 
         # Axis labels
-        plt.xlabel('Degree of agreement/disagreement', **STYLES["chart"]["axis_labels"])
-        plt.ylabel('Number of Answers', **STYLES["chart"]["axis_labels"])
+        axis.set_xlabel('Degree of agreement/disagreement', **STYLES["chart"]["axis_labels"])
+        axis.set_ylabel('Number of Answers', **STYLES["chart"]["axis_labels"])
 
         # X-axis rotation for label readability
-        plt.xticks(**STYLES["chart"]["x_ticks"])
+        setp(axis.get_xticklabels(), **STYLES["chart"]["x_ticks"])
 
         # Set y-axis ticks at 25-unit intervals
         max_y: int = response_counts.values.max()   # Find the highest bar value
         # From 0 to max+25 in steps of 25
-        plt.yticks(range(0, max_y + 25, 25), **STYLES["chart"]["y_ticks"])
+        axis.set_yticks(range(0, max_y + 25, 25))
+        setp(axis.get_yticklabels(), **STYLES["chart"]["y_ticks"])
 
         # Add horizontal grid lines for easier value estimation
-        plt.grid(**STYLES["chart"]["grid"])
+        axis.grid(**STYLES["chart"]["grid"])
 
         # Enhance chart border visibility
         for spine in axis.spines.values():
             spine.set_linewidth(STYLES["chart"]["spines"]["linewidth"])
 
         # Adjust layout to prevent overlap
-        plt.tight_layout()
+        figure.tight_layout()
 
         # Display the chart
         return figure
@@ -234,38 +339,35 @@ def create_bar_chart_general(
         return None
 
 
-def create_bar_chart_by_gender(
-        df: pd.DataFrame,
+def _create_grouped_bar_chart(
+        df: DataFrame,
         selected_question: str,
-        category_order: list[str] | None = None,
-        figsize: tuple[int, int] = DEFAULT_FIGSIZE,
-        palette: str = STYLES["chart"]["palettes"]["gender"]
-) -> plt.Figure | None:
+        group_column: str,
+        legend_title: str,
+        category_order: list[str] | None,
+        figsize: tuple[int, int],
+        palette: str
+) -> Figure | None:
     """
-    Generates a gender-distinguished bar chart for a selected survey question.
+    Generates a bar chart of a survey question with one bar per demographic group.
+
+    Shared by the gender, school and income charts, which only differ in the demographic
+    column, the legend title and their default size and palette.
 
     Args:
-        df (pd.DataFrame): Input DataFrame containing survey data
+        df (DataFrame): Input DataFrame containing survey data
         selected_question (str): Column name of the question to visualize
+        group_column (str): Demographic column, one of the keys of `GROUP_CODES`
+        legend_title (str): Title of the legend naming the groups
         category_order (list[str] | None): Custom order for response categories (optional)
         figsize (tuple[int, int]): Chart dimensions (width, height)
-        palette (list[str]): Color palette for gender distinction (pink for female, blue for male)
+        palette (str): Seaborn color palette name
 
     Returns:
         matplotlib.figure.Figure | None: Generated bar chart or None on failure
-
-    Raises:
-        ValueError: Invalid DataFrame or empty input
-        KeyError: Missing selected question or required columns in DataFrame
-        TypeError: Incorrect type for selected_question
-        Exception: Unexpected errors during execution
-
-    Notes:
-        - Maps responses using the `answers` and `gender` dictionaries
-        - Groups data by gender for tests_visualization
-        - Supports custom category ordering
-        - Adds value labels on top of bars for clarity
     """
+    import seaborn as sns
+
     try:
         # ======================
         # INPUT VALIDATION
@@ -288,7 +390,7 @@ def create_bar_chart_by_gender(
                            f" in the DataFrame columns.")
 
         # Check if required columns are present
-        required_columns = [selected_question, 'Q2_GENDER']
+        required_columns = [selected_question, group_column]
         missing_cols = [col for col in required_columns if col not in df.columns]
         if missing_cols:
             raise KeyError(f"❌ [ERROR] Missing columns: {', '.join(missing_cols)}")
@@ -296,12 +398,8 @@ def create_bar_chart_by_gender(
         # ======================
         # DATA PROCESSING
         # ======================
-        # Create a clean copy of the DataFrame with only necessary columns
-        processed_df = df[[selected_question, 'Q2_GENDER']].copy()
-
-        # Map values using predefined dictionaries (answers and gender mapping)
-        processed_df[selected_question] = processed_df[selected_question].map(answers)
-        processed_df['Q2_GENDER'] = processed_df['Q2_GENDER'].map(gender)
+        # Decode the answers and the group of each respondent into categoricals
+        processed_df = _decode_grouped_answers(df, selected_question, group_column)
 
         # Check for null values in the mapped answers
         if processed_df[selected_question].isnull().any():
@@ -313,25 +411,19 @@ def create_bar_chart_by_gender(
         category_order: list[str] = category_order or DEFAULT_CATEGORY_ORDER
 
         # Ensure the question column is treated as a categorical variable with the specified order
-        processed_df[selected_question] = pd.Categorical(
-            processed_df[selected_question],
-            categories=category_order,
-            ordered=True
-        )
+        processed_df[selected_question] = (processed_df[selected_question]
+                                           .astype(_answer_dtype(category_order)))
 
         # ======================
         # DATA ANALYSIS
         # ======================
 
         # --- DATA RESHAPING ---
-        # Count the number of answers for each category, grouped by gender
-        gender_count_data = (processed_df
-                      .groupby(['Q2_GENDER', selected_question], observed=False)
-                      .size()
-                      .reset_index(name='counts'))
+        # Count the number of answers for each category, grouped by demographic group
+        group_count_data = _count_answers_by_group(processed_df, group_column, selected_question)
 
         # Check if no data is available for the selected question
-        if gender_count_data.empty:
+        if group_count_data.empty:
             print(f"❌ [ERROR] No responses were found for the question {selected_question}.")
             return
 
@@ -339,67 +431,61 @@ def create_bar_chart_by_gender(
         # VISUALIZATION
         # ======================
 
-        # Initialize the figure and axis for plotting
-        plt.figure(figsize=figsize)
+        # Initialize the figure and axis outside pyplot, so it is not kept in its open figures
+        figure = Figure(figsize=figsize)
+        axis = figure.subplots()
 
         # Create grouped bar plot using Seaborn
-        axis = sns.barplot(
+        sns.barplot(
             x=selected_question,        # X-axis will be the selected question
             y='counts',                 # Y-axis will be the count of answers
-            hue='Q2_GENDER',            # Color bars by gender
-            data=gender_count_data,     # Data to plot
+            hue=group_column,           # Color bars by demographic group
+            data=group_count_data,      # Data to plot
             palette=palette,            # Set the color palette
             edgecolor=STYLES["chart"]["bar"]["edgecolor"],      # Set the bar edge color to white
-            order=category_order        # Order the categories as specified
+            order=category_order,       # Order the categories as specified
+            errorbar=None,              # One count per bar, no error bar to estimate
+            ax=axis                     # Draw on the figure created above
         )
 
         # --- VALUE LABELS ---
         # Add value labels on top of each bar
-        for bar in axis.patches:
-            axis.text(
-                bar.get_x() + bar.get_width() / 2,      # X position: Center of the bar
-                bar.get_height() - 0.1,                 # Y position: Slightly below the top of the bar
-                f'{int(bar.get_height())}',          # Display the count value
-                ha='center',                            # Horizontal alignment: Center
-                va='bottom',                            # Vertical alignment: Bottom
-                color=STYLES["chart"]["bar"]["color"],              # Text color
-                fontsize=STYLES["chart"]["bar"]["fontsize"],        # Font size
-                fontweight=STYLES["chart"]["bar"]["fontweight"]     # Font weight
-            )
+        _add_value_labels(axis)
 
         # ======================
         # STYLING
         # ======================
         # Title and labels
         question_title: str = (f"{questions.get(selected_question, selected_question)}"
-                          f"\n({selected_question})")
+                               f"\n({selected_question})")
 
-        plt.title(textwrap.fill(question_title, width=40), **STYLES["chart"]["title"])
+        axis.set_title(textwrap.fill(question_title, width=40), **STYLES["chart"]["title"])
 
-        plt.xlabel('Degree of agreement/disagreement', **STYLES["chart"]["axis_labels"])
-        plt.ylabel('Number of Answers', **STYLES["chart"]["axis_labels"])
+        axis.set_xlabel('Degree of agreement/disagreement', **STYLES["chart"]["axis_labels"])
+        axis.set_ylabel('Number of Answers', **STYLES["chart"]["axis_labels"])
 
         # Adjust the X-axis labels to be centered
-        plt.xticks(**STYLES["chart"]["x_ticks"])
+        setp(axis.get_xticklabels(), **STYLES["chart"]["x_ticks"])
 
         # Adjust the Y-axis so that the ticks are every 25 units
-        max_y: int = gender_count_data['counts'].max()      # Find the highest bar value
+        max_y: int = group_count_data['counts'].max()       # Find the highest bar value
         # From 0 to max+25 in steps of 25
-        plt.yticks(range(0, max_y + 25, 25), **STYLES["chart"]["y_ticks"])
+        axis.set_yticks(range(0, max_y + 25, 25))
+        setp(axis.get_yticklabels(), **STYLES["chart"]["y_ticks"])
 
         # Add grid lines to improve readability
-        plt.grid(**STYLES["chart"]["grid"])
+        axis.grid(**STYLES["chart"]["grid"])
 
         # Legend and borders
-        axis.legend(title='Gender', frameon=True)
+        axis.legend(title=legend_title, frameon=True)
         for spine in axis.spines.values():
             spine.set_linewidth(STYLES["chart"]["spines"]["linewidth"])
 
         # Adjust space for the title
-        plt.tight_layout()
+        figure.tight_layout()
 
         # Display the chart
-        return plt.gcf()
+        return figure
 
     # ======================
     # ERROR HANDLING
@@ -422,6 +508,43 @@ def create_bar_chart_by_gender(
         return None
 
 
+
+def create_bar_chart_by_gender(
+        df: pd.DataFrame,
+        selected_question: str,
+        category_order: list[str] | None = None,
+        figsize: tuple[int, int] = DEFAULT_FIGSIZE,
+        palette: str = STYLES["chart"]["palettes"]["gender"]
+) -> Figure | None:
+    """
+    Generates a gender-distinguished bar chart for a selected survey question.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame containing survey data
+        selected_question (str): Column name of the question to visualize
+        category_order (list[str] | None): Custom order for response categories (optional)
+        figsize (tuple[int, int]): Chart dimensions (width, height)
+        palette (list[str]): Color palette for gender distinction (pink for female, blue for male)
+
+    Returns:
+        matplotlib.figure.Figure | None: Generated bar chart or None on failure
+
+    Raises:
+        ValueError: Invalid DataFrame or empty input
+        KeyError: Missing selected question or required columns in DataFrame
+        TypeError: Incorrect type for selected_question
+        Exception: Unexpected errors during execution
+
+    Notes:
+        - Decodes responses and genders into categoricals with `_decode_grouped_answers`
+        - Groups data by gender for tests_visualization
+        - Supports custom category ordering
+        - Adds value labels on top of bars for clarity
+    """
+    return _create_grouped_bar_chart(df, selected_question, 'Q2_GENDER', 'Gender',
+                                     category_order, figsize, palette)
+
+
 def create_bar_chart_by_school(
         df: DataFrame,
         selected_question: str,
@@ -449,164 +572,13 @@ def create_bar_chart_by_school(
         Exception: Unexpected errors during execution
 
     Notes:
-        - Maps responses using the `answers` and `school` dictionaries
+        - Decodes responses and schools into categoricals with `_decode_grouped_answers`
         - Groups data by school for tests_visualization
         - Supports custom category ordering
         - Adds value labels on top of bars for clarity
     """
-    try:
-        # ======================
-        # INPUT VALIDATION
-        # ======================
-        # Validate input DataFrame
-        if df is None or not isinstance(df, DataFrame):
-            raise ValueError("❌ [ERROR] Input data is not a valid DataFrame.")
-
-        # Check for empty DataFrame
-        if df.empty:
-            raise ValueError("❌ [ERROR] Input DataFrame is empty.")
-
-        # Ensure the selected question is a string
-        if not isinstance(selected_question, str):
-            raise TypeError("❌ [ERROR] Selected question must be a string.")
-
-        # Verify question exists in DataFrame columns
-        if selected_question not in df.columns:
-            raise KeyError(f"❌ [ERROR] The question '{selected_question}' is not found"
-                           f" in the DataFrame columns.")
-
-        # Check if required columns are present
-        required_columns = [selected_question, 'Q3_SCHOOL']
-        missing_cols = [col for col in required_columns if col not in df.columns]
-        if missing_cols:
-            raise KeyError(f"❌ [ERROR] Missing columns: {', '.join(missing_cols)}")
-
-        # ======================
-        # DATA PROCESSING
-        # ======================
-        # Create a clean copy of the DataFrame with only necessary columns
-        processed_df = df[[selected_question, 'Q3_SCHOOL']].copy()
-
-        # Map values using predefined dictionaries (answers and school mapping)
-        processed_df['Q3_SCHOOL'] = processed_df['Q3_SCHOOL'].map(school)
-        processed_df[selected_question] = processed_df[selected_question].map(answers)
-
-        # Check for null values in the mapped answers
-        if processed_df[selected_question].isnull().any():
-            print(f"⚠️ [WARNING] Null values found in '{selected_question}'. Excluded.")
-
-        # --- CATEGORY ORDER HANDLING ---
-        # Set default response order if not provided
-        category_order: list[str] = category_order or DEFAULT_CATEGORY_ORDER
-
-        # Ensure the question column is treated as a categorical variable with the specified order
-        processed_df[selected_question] = pd.Categorical(
-            processed_df[selected_question],
-            categories=category_order,
-            ordered=True
-        )
-
-        # ======================
-        # DATA ANALYSIS
-        # ======================
-
-        # --- DATA RESHAPING ---
-        # Count the number of answers for each category, grouped by school
-        school_count_data = (processed_df
-                             .groupby(['Q3_SCHOOL', selected_question], observed=False)
-                             .size()
-                             .reset_index(name='counts'))
-
-        # Check if no data is available for the selected question
-        if school_count_data.empty:
-            print(f"❌ [ERROR] No responses were found for the question {selected_question}.")
-            return
-
-        # ======================
-        # VISUALIZATION
-        # ======================
-
-        # Initialize the figure and axis for plotting
-        plt.figure(figsize=figsize)
-
-        # Create grouped bar plot using Seaborn
-        axis = sns.barplot(
-            x=selected_question,        # X-axis will be the selected question
-            y='counts',                 # Y-axis will be the count of answers
-            hue='Q3_SCHOOL',            # Color bars by school
-            data=school_count_data,     # Data to plot
-            palette=palette,            # Set the color palette
-            edgecolor=STYLES["chart"]["bar"]["edgecolor"],      # Set the bar edge color to white
-            order=category_order        # Order the categories as specified
-        )
-
-        # --- VALUE LABELS ---
-        # Add value labels on top of each bar
-        for bar in axis.patches:
-            axis.text(
-                bar.get_x() + bar.get_width() / 2,      # X position: Center of the bar
-                bar.get_height() - 0.1,                 # Y position: Slightly below the top of the bar
-                f'{int(bar.get_height())}',          # Display the count value
-                ha='center',                            # Horizontal alignment: Center
-                va='bottom',                            # Vertical alignment: Bottom
-                color=STYLES["chart"]["bar"]["color"],              # Text color
-                fontsize=STYLES["chart"]["bar"]["fontsize"],        # Font size
-                fontweight=STYLES["chart"]["bar"]["fontweight"]     # Font weight
-            )
-
-        # ======================
-        # STYLING
-        # ======================
-        # Title and labels
-        question_title: str = (f"{questions.get(selected_question, selected_question)}"
-                               f"\n({selected_question})")
-
-        plt.title(textwrap.fill(question_title, width=40), **STYLES["chart"]["title"])
-
-        plt.xlabel('Degree of agreement/disagreement', **STYLES["chart"]["axis_labels"])
-        plt.ylabel('Number of Answers', **STYLES["chart"]["axis_labels"])
-
-        # Adjust the X-axis labels to be centered
-        plt.xticks(**STYLES["chart"]["x_ticks"])
-
-        # Adjust the Y-axis so that the ticks are every 25 units
-        max_y: int = school_count_data['counts'].max()      # Find the highest bar value
-        # From 0 to max+25 in steps of 25
-        plt.yticks(range(0, max_y + 25, 25), **STYLES["chart"]["y_ticks"])
-
-        # Add grid lines to improve readability
-        plt.grid(**STYLES["chart"]["grid"])
-
-        # Legend and borders
-        axis.legend(title='School', frameon=True)
-        for spine in axis.spines.values():
-            spine.set_linewidth(STYLES["chart"]["spines"]["linewidth"])
-
-        # Adjust space for the title
-        plt.tight_layout()
-
-        # Display the chart
-        return plt.gcf()
-
-    # ======================
-    # ERROR HANDLING
-    # ======================
-
-    except ValueError as val_err:
-        print(f"❌ [ERROR] {val_err}")
-        return None
-
-    except KeyError as key_err:
-        print(f"❌ [ERROR] {key_err}")
-        return None
-
-    except TypeError as type_err:
-        print(f"❌ [ERROR] {type_err}")
-        return None
-
-    except Exception as gen_err:
-        print(f"❌ [ERROR] An unexpected error occurred: {gen_err}")
-        return None
+    return _create_grouped_bar_chart(df, selected_question, 'Q3_SCHOOL', 'School',
+                                     category_order, figsize, palette)
 
 
 def create_bar_chart_by_income(
@@ -615,7 +587,7 @@ def create_bar_chart_by_income(
         category_order: list[str] | None = None,
         figsize: tuple[int, int] = DEFAULT_FIGSIZE,
         palette: str = STYLES["chart"]["palettes"]["income"]
-) -> plt.Figure | None:
+) -> Figure | None:
     """
     Generates an income-distinguished bar chart for a selected survey question.
 
@@ -636,162 +608,10 @@ def create_bar_chart_by_income(
         Exception: Unexpected errors during execution
 
     Notes:
-        - Maps responses using the `answers` and `income` dictionaries
+        - Decodes responses and incomes into categoricals with `_decode_grouped_answers`
         - Groups data by income level for tests_visualization
         - Supports custom category ordering
         - Adds value labels on top of bars for clarity
     """
-    try:
-        # ======================
-        # INPUT VALIDATION
-        # ======================
-        # Validate input DataFrame
-        if df is None or not isinstance(df, DataFrame):
-            raise ValueError("❌ [ERROR] Input data is not a valid DataFrame.")
-
-        # Check for empty DataFrame
-        if df.empty:
-            raise ValueError("❌ [ERROR] Input DataFrame is empty.")
-
-        # Ensure the selected question is a string
-        if not isinstance(selected_question, str):
-            raise TypeError("❌ [ERROR] Selected question must be a string.")
-
-        # Verify question exists in DataFrame columns
-        if selected_question not in df.columns:
-            raise KeyError(f"❌ [ERROR] The question '{selected_question}' is not found"
-                           f" in the DataFrame columns.")
-
-        # Check if required columns are present
-        required_columns = [selected_question, 'Q4_INCOME']
-        missing_cols = [col for col in required_columns if col not in df.columns]
-        if missing_cols:
-            raise KeyError(f"❌ [ERROR] Missing columns: {', '.join(missing_cols)}")
-
-        # ======================
-        # DATA PROCESSING
-        # ======================
-        # Create a clean copy of the DataFrame with only necessary columns
-        processed_df = df[[selected_question, 'Q4_INCOME']].copy()
-
-        # Map values using predefined dictionaries (answers and income mapping)
-        processed_df['Q4_INCOME'] = processed_df['Q4_INCOME'].map(income)
-        processed_df[selected_question] = processed_df[selected_question].map(answers)
-
-        # Check for null values in the mapped answers
-        if processed_df[selected_question].isnull().any():
-            print(f"⚠️ [WARNING] Null values found in '{selected_question}'. Excluded.")
-
-        # --- CATEGORY ORDER HANDLING ---
-        # Set default response order if not provided
-        category_order: list[str] = category_order or DEFAULT_CATEGORY_ORDER
-
-        # Ensure the question column is treated as a categorical variable with the specified order
-        processed_df[selected_question] = pd.Categorical(
-            processed_df[selected_question],
-            categories=category_order,
-            ordered=True
-        )
-
-        # ======================
-        # DATA ANALYSIS
-        # ======================
-
-        # --- DATA RESHAPING ---
-        # Count the number of answers for each category, grouped by school
-        income_count_data = (processed_df
-                             .groupby(['Q4_INCOME', selected_question], observed=False)
-                             .size()
-                             .reset_index(name='counts'))
-
-        # Check if no data is available for the selected question
-        if income_count_data.empty:
-            print(f"❌ [ERROR] No responses were found for the question {selected_question}.")
-            return
-
-        # ======================
-        # VISUALIZATION
-        # ======================
-
-        # Initialize the figure and axis for plotting
-        plt.figure(figsize=figsize)
-
-        # Create grouped bar plot using Seaborn
-        axis = sns.barplot(
-            x=selected_question,        # X-axis will be the selected question
-            y='counts',                 # Y-axis will be the count of answers
-            hue='Q4_INCOME',            # Color bars by school
-            data=income_count_data,     # Data to plot
-            palette=palette,            # Set the color palette
-            edgecolor=STYLES["chart"]["bar"]["edgecolor"],      # Set the bar edge color to white
-            order=category_order        # Order the categories as specified
-        )
-
-        # --- VALUE LABELS ---
-        # Add value labels on top of each bar
-        for bar in axis.patches:
-            axis.text(
-                bar.get_x() + bar.get_width() / 2,      # X position: Center of the bar
-                bar.get_height() - 0.1,                 # Y position: Slightly below the top of the bar
-                f'{int(bar.get_height())}',          # Display the count value
-                ha='center',                            # Horizontal alignment: Center
-                va='bottom',                            # Vertical alignment: Bottom
-                color=STYLES["chart"]["bar"]["color"],              # Text color
-                fontsize=STYLES["chart"]["bar"]["fontsize"],        # Font size
-                fontweight=STYLES["chart"]["bar"]["fontweight"]     # Font weight
-            )
-
-        # ======================
-        # STYLING
-        # ======================
-
-        # Title and labels
-        question_title: str = (f"{questions.get(selected_question, selected_question)}"
-                               f"\n({selected_question})")
-
-        plt.title(textwrap.fill(question_title, width=40), **STYLES["chart"]["title"])
-
-        plt.xlabel('Degree of agreement/disagreement', **STYLES["chart"]["axis_labels"])
-        plt.ylabel('Number of Answers', **STYLES["chart"]["axis_labels"])
-
-        # Adjust the X-axis labels to be centered
-        plt.xticks(**STYLES["chart"]["x_ticks"])
-
-        # Adjust the Y-axis so that the ticks are every 25 units
-        max_y: int = income_count_data['counts'].max()  # Find the highest bar value
-        # From 0 to max+25 in steps of 25
-        plt.yticks(range(0, max_y + 25, 25), **STYLES["chart"]["y_ticks"])
-
-        # Add grid lines to improve readability
-        plt.grid(**STYLES["chart"]["grid"])
-
-        # Legend and borders
-        axis.legend(title='Income', frameon=True)
-        for spine in axis.spines.values():
-            spine.set_linewidth(STYLES["chart"]["spines"]["linewidth"])
-
-        # Adjust space for the title
-        plt.tight_layout()
-
-        # Display the chart
-        return plt.gcf()
-
-    # ======================
-    # ERROR HANDLING
-    # ======================
-
-    except ValueError as val_err:
-        print(f"❌ [ERROR] {val_err}")
-        return None
-
-    except KeyError as key_err:
-        print(f"❌ [ERROR] {key_err}")
-        return None
-
-    except TypeError as type_err:
-        print(f"❌ [ERROR] {type_err}")
-        return None
-
-    except Exception as gen_err:
-        print(f"❌ [ERROR] An unexpected error occurred: {gen_err}")
-        return None
\ No newline at end of file
+    return _create_grouped_bar_chart(df, selected_question, 'Q4_INCOME', 'Income',
+                                     category_order, figsize, palette)
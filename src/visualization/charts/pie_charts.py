@@ -32,12 +32,13 @@ Customization Options:
 import textwrap
 
 # Third-party imports
-import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
 from matplotlib.figure import Figure
 from pandas import DataFrame
 
+# seaborn is imported by the chart functions on first use, so importing this module (done
+# when the dashboard builds its question selector) does not load it
+
 # Local project-specific imports
 from src.assets.impulse_buying_data.data_dictionary import (
     questions,
@@ -84,6 +85,8 @@ def create_pie_chart_general(
         TypeError: For incorrect parameter types
         KeyError: If specified question column doesn't exist in DataFrame
     """
+    import seaborn as sns
+
     try:
         # ======================
         # INPUT VALIDATION
@@ -142,8 +145,9 @@ def create_pie_chart_general(
         # VISUALIZATION
         # ======================
 
-        # Initialize the figure and axis for plotting
-        figure, axis = plt.subplots(figsize=figsize)
+        # Initialize the figure and axis outside pyplot, so it is not kept in its open figures
+        figure = Figure(figsize=figsize)
+        axis = figure.subplots()
 
         # Create color palette
         colors = sns.color_palette(palette, len(filtered_sizes))
@@ -179,7 +183,7 @@ def create_pie_chart_general(
         wrapped_title: str = textwrap.fill(question_title, width=40)
 
         # Apply title styling
-        plt.title(wrapped_title, **STYLES["chart"]["title"])
+        axis.set_title(wrapped_title, **STYLES["chart"]["title"])
 
         # Percentage label styling
         for autotext in autotexts:
@@ -204,7 +208,7 @@ def create_pie_chart_general(
             )
 
         # Display the chart
-        plt.tight_layout()
+        figure.tight_layout()
 
         return figure
 
@@ -260,6 +264,8 @@ def create_pie_chart_by_gender(
         TypeError: Selected_question is not a string
         KeyError: Missing required 'Q2_GENDER' column or question
     """
+    import seaborn as sns
+
     try:
         # ======================
         # INPUT VALIDATION
@@ -320,8 +326,9 @@ def create_pie_chart_by_gender(
         # VISUALIZATION
         # ======================
 
-        # Initialize the figure and axis for plotting
-        figure, axes = plt.subplots(1, len(grouped_data.index), figsize=figsize)
+        # Initialize the figure and axes outside pyplot, so it is not kept in its open figures
+        figure = Figure(figsize=figsize)
+        axes = figure.subplots(1, len(grouped_data.index))
         if len(grouped_data.index) == 1:
             axes = [axes]  # Ensure axes is iterable for single subplot
 
@@ -422,7 +429,7 @@ def create_pie_chart_by_gender(
             )
 
         # Display the chart
-        plt.tight_layout()
+        figure.tight_layout()
 
         return figure
     # ======================
@@ -477,6 +484,8 @@ def create_pie_chart_by_school(
         TypeError: Selected_question is not a string
         KeyError: Missing required 'Q3_SCHOOL' column or question
     """
+    import seaborn as sns
+
     try:
         # ======================
         # INPUT VALIDATION
@@ -545,8 +554,9 @@ def create_pie_chart_by_school(
         # VISUALIZATION
         # ======================
 
-        # Initialize the figure and axis for plotting
-        figure, axes = plt.subplots(1, len(grouped_data.index), figsize=figsize)
+        # Initialize the figure and axes outside pyplot, so it is not kept in its open figures
+        figure = Figure(figsize=figsize)
+        axes = figure.subplots(1, len(grouped_data.index))
         if len(grouped_data.index) == 1:
             axes = [axes]   # Ensure axes is iterable for single subplot
 
@@ -647,7 +657,7 @@ def create_pie_chart_by_school(
             )
 
         # Display the chart
-        plt.tight_layout()
+        figure.tight_layout()
 
         return figure
 
@@ -704,6 +714,8 @@ def create_pie_chart_by_income(
         TypeError: Selected_question is not a string
         KeyError: Missing required 'Q4_INCOME' column or question
     """
+    import seaborn as sns
+
     try:
         # ======================
         # INPUT VALIDATION
@@ -775,8 +787,9 @@ def create_pie_chart_by_income(
         # VISUALIZATION
         # ======================
 
-        # Initialize the figure and axis for plotting
-        figure, axes = plt.subplots(1, len(grouped_data.index), figsize=figsize)
+        # Initialize the figure and axes outside pyplot, so it is not kept in its open figures
+        figure = Figure(figsize=figsize)
+        axes = figure.subplots(1, len(grouped_data.index))
         if len(grouped_data.index) == 1:
             axes = [axes]  # Ensure axes is iterable for single subplot
 
@@ -877,7 +890,7 @@ def create_pie_chart_by_income(
             )
 
         # Display the chart
-        plt.tight_layout()
+        figure.tight_layout()
 
         return figure
 
@@ -1,23 +1,41 @@
 # Standard library imports
 import datetime
+import io
 import os
-import subprocess
-import sys
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
 # Third-party imports
-import pandas as pd
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, QTimer
+from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (QMainWindow, QLabel, QVBoxLayout, QWidget, QMessageBox,
-                               QTableWidgetItem, QSizePolicy, QHBoxLayout, QPushButton,
-                               QLayout, QComboBox)
+                               QTableView, QSizePolicy, QHBoxLayout, QPushButton, QLayout,
+                               QComboBox)
 
 # Local project-specific imports
+from src.assets.background_task import BackgroundTask
+from src.assets.csv_loader import CsvLoader, read_csv_preview
 from src.assets.dashboard_window_setup import (setup_dashboard_window, setup_dashboard_ui,
                                                setup_dashboard_menu, setup_graph_container)
-from src.assets.graph_widget import GraphWidget
 from src.assets.impulse_buying_data.data_dictionary import school, income, gender
+from src.assets.io_utils import ASSETS_DIR, DATA_DIR
+from src.assets.pixmap_label import PixmapLabel
 from src.styles.styles import STYLES, style_feedback_label
-from src.visualization.charts.base import visualize_survey_responses, build_question_selector
+
+# pandas, matplotlib and the chart modules are imported on first use, so importing this
+# module (done by the login window at startup) does not pay for the plotting stack
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.figure import Figure
+
+# Paths resolved once at import time
+CLEANED_CSV_PATH = os.path.join(DATA_DIR, "cleaned_data.csv")
+PROCESSED_CSV_PATH = os.path.join(DATA_DIR, "processed_data.csv")
+EXPORT_DIR = os.path.join(ASSETS_DIR, "exported_graphs")
+
+# Constants
+PREVIEW_ROWS = 5  # Number of rows shown in the dataframe preview
+STATIC_CHART_CACHE_SIZE = 8  # Rendered general pie charts kept for switching questions
 
 
 class DashboardWindow(QMainWindow):
@@ -27,6 +45,10 @@ class DashboardWindow(QMainWindow):
     This class represents the main dashboard that users see after logging in.
     """
 
+    # Preview rows of the cleaned CSV file shared by every dashboard opened in the session,
+    # keyed by the file path and its modification time
+    _preview_cache: dict[tuple[str, int], tuple[list[str], list[list[str]]]] = {}
+
     def __init__(self) -> None:
         """
         Initialize the dashboard window.
@@ -45,8 +67,20 @@ class DashboardWindow(QMainWindow):
         # Create container for the graph
         setup_graph_container(self)
 
-        # Display the first 5 rows of the XLSX file
-        self.display_tables()
+        # Modification times of the CSV files currently shown in the tables
+        self._csv_mtimes: dict[str, int] = {}
+        # CSV files being read in the background, by table name
+        self._csv_loaders: dict[str, CsvLoader] = {}
+        # Download and preprocessing runs in progress, and the buttons that started them
+        self._background_tasks: dict[str, BackgroundTask] = {}
+        self._task_buttons: dict[str, QPushButton] = {}
+
+        # The table blocks are built once; display_tables and refresh only fill their data
+        self._build_table_blocks()
+
+        # Display the first 5 rows of the XLSX file on the next event loop tick, so the
+        # window and its menu are shown before the CSV files are parsed
+        QTimer.singleShot(0, self.display_tables)
 
         # Initialize the QComboBox for selecting a question
         self.initialize_question_selection()
@@ -63,6 +97,12 @@ class DashboardWindow(QMainWindow):
 
         self.gender_filter_buttons = None
 
+        # General pie charts rendered once per question and cleaned CSV version, served as
+        # pixmaps; the figures are only kept for exporting
+        self._static_charts: OrderedDict[tuple[str, int], tuple["Figure", QPixmap]] = \
+            OrderedDict()
+        self._static_pixmap: QPixmap | None = None
+
     def _handle_income_filter(self, income_category: str, button: QPushButton):
         """Updates the chart with the selected income filter."""
         # Reset styles for all buttons
@@ -113,6 +153,9 @@ class DashboardWindow(QMainWindow):
 
     def update_income_pie_chart(self, selected_income: str) -> None:
         """Updates the pie chart with the selected income category."""
+        from src.visualization.charts.base import visualize_survey_responses
+        from src.assets.graph_widget import GraphWidget
+
         selected_question = self.question_combobox.currentData()
 
         new_fig2 = visualize_survey_responses(
@@ -179,6 +222,9 @@ class DashboardWindow(QMainWindow):
 
     def update_school_pie_chart(self, selected_school: str) -> None:
         """Updates the pie chart with the selected school."""
+        from src.visualization.charts.base import visualize_survey_responses
+        from src.assets.graph_widget import GraphWidget
+
         selected_question = self.question_combobox.currentData()
 
         # Generate a new chart
@@ -273,6 +319,9 @@ class DashboardWindow(QMainWindow):
         return container
 
     def update_pie_chart(self, gender: str) -> None:
+        from src.visualization.charts.base import visualize_survey_responses
+        from src.assets.graph_widget import GraphWidget
+
         selected_question_key = self.question_combobox.currentData()
 
         # Generate new pie chart
@@ -387,184 +436,254 @@ class DashboardWindow(QMainWindow):
 
 
     def download_xlsx(self) -> None:
-        """Call the download_files.py script to download the latest XLSX file."""
-        try:
-            # Get the directory where the script is being executed
-            current_dir = os.path.dirname(os.path.abspath(__file__))
+        """Run the download_files workflow on a worker thread to download the latest XLSX file."""
+        from src.assets.download_files import main as download_main
 
-            # Build the relative path to the 'download_files.py' script
-            script_path = os.path.join(current_dir, "..", "assets", "download_files.py")
+        self._start_background_task("download", download_main, self.download_button)
 
-            # Run the script using the same Python executable that's running the application
-            subprocess.run([sys.executable, script_path], check=True)
+    def run_preprocessing(self) -> None:
+        """Run the preprocessing pipeline (preprocess.py) on a worker thread."""
+        from src.assets.preprocess import main as preprocess_main
 
-            # If the download is successful, display a message
-            QMessageBox.information(self, "Download", "File downloaded successfully.")
+        self._start_background_task("preprocessing", preprocess_main, self.preprocess_button)
 
-        except subprocess.CalledProcessError as subpr_err:
-            # If an error occurs during the script execution
-            print(f"❌ [ERROR] An error occurred while downloading the file: {subpr_err}")
-            QMessageBox.critical(self, "Error",
-                                 f"An error occurred while downloading the file: {subpr_err}")
+    def _start_background_task(self, name: str, function, button: QPushButton) -> None:
+        """Runs a function in-process on a QThreadPool worker, unless it is already running.
 
-        except FileNotFoundError:
-            print("❌ [ERROR] File not found. Please check the path to the script.")
-            QMessageBox.critical(self, "Error",
-                                 "File not found. Please check the path to the script.")
-            raise FileNotFoundError("❌ [ERROR] File not found. Please check the path to the script.")
-        except Exception as gen_err:
-            print(f"Unexpected error: {gen_err}")
-            QMessageBox.critical(self, "Error",
-                                 "Unexpected error")
-            raise gen_err(f"❌ [ERROR] Unexpected error: {gen_err}")
+        The button that started the task stays disabled until the task finishes, so the
+        window remains responsive without allowing the same task to be started twice."""
+        if name in self._background_tasks:
+            print(f"⚠️ [WARNING] The {name} is already running.")
+            return
 
-    def run_preprocessing(self) -> None:
-        """Run the preprocessing script (preprocess.py)."""
-        try:
-            # Get the directory where the script is being executed
-            current_dir = os.path.dirname(os.path.abspath(__file__))
+        button.setEnabled(False)
+        self._task_buttons[name] = button
 
-            # Build the relative path to the 'preprocess.py' script
-            script_path = os.path.join(current_dir, "..", "assets", "preprocess.py")
+        task = BackgroundTask(name, function)
+        task.setAutoDelete(False)  # Kept alive until its outcome has been handled
+        task.signals.finished.connect(self._on_background_task_finished)
+        task.signals.failed.connect(self._on_background_task_failed)
+        self._background_tasks[name] = task
 
-            # Run the script using the same Python executable that's running the application
-            subprocess.run([sys.executable, script_path], check=True)
+        QThreadPool.globalInstance().start(task)
 
-            # If the preprocessing is successful, display a message
-            QMessageBox.information(self, "Preprocessing",
-                                    "Data preprocessing completed successfully.")
+    def _release_background_task(self, name: str) -> None:
+        """Forgets a finished task and re-enables the button that started it."""
+        self._background_tasks.pop(name, None)
+        button = self._task_buttons.pop(name, None)
+        if button is not None:
+            button.setEnabled(True)
 
-            self.display_tables()
+    def _on_background_task_finished(self, name: str, result: object) -> None:
+        """Reports a completed download or preprocessing run."""
+        self._release_background_task(name)
 
-            self._feedback_label.setText("")
+        # Both workflows report their own errors and return None
+        if result is None:
+            self._on_background_task_failed(name, "see the console output for details")
+            return
 
-        except subprocess.CalledProcessError as subpr_err:
-            # If an error occurs during the script execution
-            print(f"❌ [ERROR] An error occurred while running preprocessing: {subpr_err}")
-            QMessageBox.critical(self, "Error",
-                                 f"An error occurred while running preprocessing: {subpr_err}")
+        if name == "download":
+            # If the download is successful, display a message
+            QMessageBox.information(self, "Download", "File downloaded successfully.")
+            return
 
-        except FileNotFoundError:
-            print("❌ [ERROR] File not found. Please check the path to the script.")
-            QMessageBox.critical(self, "Error",
-                                 "File not found. Please check the path to the script.")
-            raise FileNotFoundError("❌ [ERROR] File not found. Please check the path to the script.")
-        except Exception as gen_err:
-            print(f"Unexpected error: {gen_err}")
-            QMessageBox.critical(self, "Error",
-                                 "Unexpected error")
-            raise gen_err(f"❌ [ERROR] Unexpected error: {gen_err}")
+        # If the preprocessing is successful, display a message
+        QMessageBox.information(self, "Preprocessing",
+                                "Data preprocessing completed successfully.")
+
+        # Show the data returned by the pipeline instead of reading the new files back
+        cleaned_df, summary_df = result
+        self._show_preprocessed_data(cleaned_df, summary_df)
+
+        self._feedback_label.setText("")
+
+    def _show_preprocessed_data(self, cleaned_df: "pd.DataFrame",
+                                summary_df: "pd.DataFrame") -> None:
+        """Fills both tables with the DataFrames just written by the preprocessing pipeline.
+
+        The modification times of the new files and the preview cache are updated as if the
+        files had been read, so the next refresh does not load them again."""
+        preview_df = cleaned_df.head(PREVIEW_ROWS)
+        preview = ([str(column) for column in preview_df.columns],
+                   preview_df.astype(str).values.tolist())
+        self._populate_table(self.table_widget, preview)
+        self._populate_table(self.table_widget_processed, summary_df)
+
+        cleaned_mtime = os.stat(CLEANED_CSV_PATH).st_mtime_ns
+        self._cache_cleaned_preview((CLEANED_CSV_PATH, cleaned_mtime), preview)
+        self._csv_mtimes["cleaned"] = cleaned_mtime
+        self._csv_mtimes["processed"] = os.stat(PROCESSED_CSV_PATH).st_mtime_ns
+
+    def _on_background_task_failed(self, name: str, message: str) -> None:
+        """Reports an error raised by a download or preprocessing run."""
+        self._release_background_task(name)
+        print(f"❌ [ERROR] An error occurred while running the {name}: {message}")
+        QMessageBox.critical(self, "Error",
+                             f"An error occurred while running the {name}: {message}")
+
+    def refresh(self) -> None:
+        """Reloads the tables whose CSV files changed since they were shown.
+
+        Used when an existing dashboard is shown again, so its widgets are reused instead of
+        building a new window."""
+        self.display_tables()
 
     def display_tables(self) -> None:
         """Read the first 5 rows of the 'cleaned_data.csv' file and display them in the first table,
-           and display all rows of the 'processed_data.csv' file in the second table."""
-
-        # Get the directory where the script is being executed
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Build the relative paths to the CSV files
-        cleaned_csv_path = os.path.join(current_dir, "..", "assets", "impulse_buying_data",
-                                        "cleaned_data.csv")
-        processed_csv_path = os.path.join(current_dir, "..", "assets", "impulse_buying_data",
-                                          "processed_data.csv")
+           and display all rows of the 'processed_data.csv' file in the second table.
 
+        The preview rows are read directly as text with the csv module. The processed CSV
+        file is read with pandas on a QThreadPool worker, and its table is filled once the
+        data arrives back on the GUI thread."""
         try:
             # --- First Table: Cleaned Data ---
             # Process cleaned_data.csv (first 5 rows)
-            if os.path.exists(cleaned_csv_path):
-                # Read the cleaned data CSV file using pandas
-                cleaned_df = pd.read_csv(cleaned_csv_path)
+            if (os.path.exists(CLEANED_CSV_PATH)
+                    and not self._has_csv_changed("cleaned", CLEANED_CSV_PATH)):
+                print("🔍 [DEBUG] cleaned_data.csv unchanged, skipping reload.")
+
+            elif os.path.exists(CLEANED_CSV_PATH):
+                self._populate_table(self.table_widget, self._read_cleaned_preview())
+                self._csv_mtimes["cleaned"] = os.stat(CLEANED_CSV_PATH).st_mtime_ns
+
+            else:
+                style_feedback_label(self._feedback_label,
+                                     "The cleaned dataset has not been found", "error")
+
+            # --- Second Table: Processed Data ---
+            if (os.path.exists(PROCESSED_CSV_PATH)
+                    and not self._has_csv_changed("processed", PROCESSED_CSV_PATH)):
+                print("🔍 [DEBUG] processed_data.csv unchanged, skipping reload.")
+
+            elif os.path.exists(PROCESSED_CSV_PATH):
+                # Read the processed data CSV file
+                self._start_csv_loader("processed", PROCESSED_CSV_PATH)
+
+            else:
+                style_feedback_label(self._feedback_label,
+                                     "The processed dataset has not been found", "error")
+
+        except Exception as gen_err:
+            print(f"❌ [ERROR] An error occurred while reading the CSV files: {gen_err}")
+            QMessageBox.critical(self, "Error",
+                                 f"❌ [ERROR] An error occurred while reading the CSV files: {gen_err}")
 
-                # Use the summary function to get the first 5 rows
-                first_5_rows = cleaned_df.head()
+    @classmethod
+    def _read_cleaned_preview(cls) -> tuple[list[str], list[list[str]]]:
+        """Returns the preview rows of the cleaned CSV file, reusing them while it is unchanged."""
+        key = (CLEANED_CSV_PATH, os.stat(CLEANED_CSV_PATH).st_mtime_ns)
 
-                # Create a layout for the first table block
-                table1_block_layout = QVBoxLayout()
+        if key not in cls._preview_cache:
+            # Read only the rows shown in the preview as text, without pandas
+            cls._cache_cleaned_preview(key, read_csv_preview(CLEANED_CSV_PATH, PREVIEW_ROWS))
+        else:
+            print("🔍 [DEBUG] Using the cached preview of cleaned_data.csv.")
 
-                # Add a label for the first table (Dataframe Preview)
-                self.dataframe_label = QLabel("Dataframe Preview")
-                self.dataframe_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.dataframe_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #333;")
-                table1_block_layout.addWidget(self.dataframe_label)
+        return cls._preview_cache[key]
 
-                # Set the number of rows and columns in the first table widget
-                self.table_widget.setRowCount(len(first_5_rows))
-                self.table_widget.setColumnCount(len(first_5_rows.columns))
-                self.table_widget.setHorizontalHeaderLabels(first_5_rows.columns)
+    @classmethod
+    def _cache_cleaned_preview(cls, key: tuple[str, int],
+                               preview: tuple[list[str], list[list[str]]]) -> None:
+        """Stores the preview of a version of the cleaned CSV file, replacing older ones."""
+        cls._preview_cache.clear()  # Older versions of the file are no longer needed
+        cls._preview_cache[key] = preview
 
-                # Populate the first table widget with data
-                for row in range(len(first_5_rows)):
-                    for col in range(len(first_5_rows.columns)):
-                        self.table_widget.setItem(row, col,
-                                                    QTableWidgetItem(
-                                                        str(first_5_rows.iloc[row, col])))
+    def _start_csv_loader(self, name: str, csv_path: str, **read_csv_kwargs) -> None:
+        """Starts reading a CSV file in the background, unless it is already being read."""
+        if name in self._csv_loaders:
+            print(f"🔍 [DEBUG] {os.path.basename(csv_path)} is already being loaded.")
+            return
 
-                # Add the table to the block layout
-                table1_block_layout.addWidget(self.scroll_area)
+        loader = CsvLoader(name, csv_path, **read_csv_kwargs)
+        loader.setAutoDelete(False)  # Kept alive until its result has been handled
+        loader.signals.loaded.connect(self._on_csv_loaded)
+        loader.signals.failed.connect(self._on_csv_load_failed)
+        self._csv_loaders[name] = loader
 
-                # Create a container for the first table block
-                table1_block_container = QWidget()
-                table1_block_container.setLayout(table1_block_layout)
+        QThreadPool.globalInstance().start(loader)
 
-                # Center the block inside a layout
-                table1_block_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    def _on_csv_loaded(self, name: str, df: "pd.DataFrame", mtime_ns: int) -> None:
+        """Fills the table matching a CSV file once it has been read in the background.
 
-                # Insert the container into the main layout
-                self.central_layout.insertWidget(1, table1_block_container)
+        `mtime_ns` is the modification time of the file before it was read. Results older
+        than the data already shown (e.g. written by a preprocessing run meanwhile) are
+        dropped, and a file rewritten during the read is reloaded on the next refresh."""
+        self._csv_loaders.pop(name, None)
 
-            else:
-                style_feedback_label(self._feedback_label,
-                                     "The cleaned dataset has not been found", "error")
+        if mtime_ns < self._csv_mtimes.get(name, mtime_ns):
+            print(f"🔍 [DEBUG] Discarding an outdated read of the {name} data.")
+            return
 
-            # --- Second Table: Processed Data ---
-            if os.path.exists(processed_csv_path):
-                # Read the processed data CSV file using pandas
-                processed_df = pd.read_csv(processed_csv_path)
+        # Only the processed data is read with pandas in the background, the cleaned data
+        # preview is small enough to be read directly in display_tables
+        self._populate_table(self.table_widget_processed, df)
+
+        self._csv_mtimes[name] = mtime_ns
+
+    def _on_csv_load_failed(self, name: str, message: str) -> None:
+        """Reports an error raised while reading a CSV file in the background."""
+        self._csv_loaders.pop(name, None)
+        print(f"❌ [ERROR] An error occurred while reading the CSV files: {message}")
+        QMessageBox.critical(self, "Error",
+                             f"❌ [ERROR] An error occurred while reading the CSV files: {message}")
 
-                # Create a layout for the second table block
-                table2_block_layout = QVBoxLayout()
+    def _build_table_blocks(self) -> None:
+        """Builds the titled blocks of both tables once; refreshing the data only fills them."""
+        self.dataframe_label = self._insert_table_block(
+            "Dataframe Preview", self.scroll_area, 1)
+        self.processed_data_label = self._insert_table_block(
+            "Descriptive Statistics", self.scroll_area_processed, 2)
 
-                # Add a label for the second table (Processed Data Preview)
-                self.processed_data_label = QLabel("Descriptive Statistics")
-                self.processed_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.processed_data_label.setStyleSheet(
-                    "font-size: 24px; font-weight: bold; color: #333;")
-                table2_block_layout.addWidget(self.processed_data_label)
+    def _insert_table_block(self, title: str, scroll_area: QWidget, index: int) -> QLabel:
+        """Wraps a table scroll area in a titled block and inserts it in the main layout."""
+        # Create a layout for the table block
+        block_layout = QVBoxLayout()
 
-                # Set the number of rows and columns in the second table widget
-                self.table_widget_processed.setRowCount(len(processed_df))
-                self.table_widget_processed.setColumnCount(len(processed_df.columns))
-                self.table_widget_processed.setHorizontalHeaderLabels(processed_df.columns)
+        # Add a label for the table
+        title_label = QLabel(title)
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #333;")
+        block_layout.addWidget(title_label)
 
-                # Populate the second table widget with data (all rows of processed_data)
-                for row in range(len(processed_df)):
-                    for col in range(len(processed_df.columns)):
-                        self.table_widget_processed.setItem(row, col,
-                                                    QTableWidgetItem(
-                                                        str(processed_df.iloc[row, col])))
+        # Add the table to the block layout
+        block_layout.addWidget(scroll_area)
 
-                # Add the table to the block layout
-                table2_block_layout.addWidget(self.scroll_area_processed)
+        # Create a container for the table block
+        block_container = QWidget()
+        block_container.setLayout(block_layout)
 
-                # Create a container for the second table block
-                table2_block_container = QWidget()
-                table2_block_container.setLayout(table2_block_layout)
+        # Center the block inside a layout
+        block_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-                # Center the block inside a layout
-                table2_block_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Insert the container into the main layout
+        self.central_layout.insertWidget(index, block_container)
 
-                # Insert the container into the main layout
-                self.central_layout.insertWidget(2, table2_block_container)
+        return title_label
 
+    def _populate_table(self, table_view: QTableView,
+                        data: "pd.DataFrame | tuple[list[str], list[list[str]]]") -> None:
+        """Shows the contents of a DataFrame, or of a (columns, rows) pair, in a table view.
 
+        The view is backed by a PandasModel, so no item is allocated per cell and only the
+        visible cells are queried when painting. Columns are only sized after a model reset;
+        data updated in place keeps the current column widths. Updates are suspended
+        meanwhile so the view repaints a single time at the end.
+        """
+        table_view.setUpdatesEnabled(False)
+        try:
+            if isinstance(data, tuple):
+                was_reset = table_view.model().set_rows(*data)
             else:
-                style_feedback_label(self._feedback_label,
-                                     "The processed dataset has not been found", "error")
+                was_reset = table_view.model().set_dataframe(data)
+            if was_reset:
+                table_view.resizeColumnsToContents()
+        finally:
+            table_view.setUpdatesEnabled(True)
 
-        except Exception as gen_err:
-            print(f"❌ [ERROR] An error occurred while reading the CSV files: {gen_err}")
-            QMessageBox.critical(self, "Error",
-                                 f"❌ [ERROR] An error occurred while reading the CSV files: {gen_err}")
+    def _has_csv_changed(self, name: str, path: str) -> bool:
+        """Checks whether a CSV file was modified since it was last loaded into its table."""
+        return self._csv_mtimes.get(name) != os.stat(path).st_mtime_ns
 
 
     def hide_visibility(self) -> None:
@@ -598,6 +717,8 @@ class DashboardWindow(QMainWindow):
 
     def initialize_question_selection(self) -> None:
         """Create and initialize the QComboBox for selecting a question."""
+        from src.visualization.charts.base import build_question_selector
+
         # Use the imported function to create the QComboBox
         self.question_combobox = build_question_selector(self, self.show_graph)
 
@@ -653,6 +774,8 @@ class DashboardWindow(QMainWindow):
             income_filter: str = None
     ) -> None:
         """Generates tests_visualization figures based on current parameters."""
+        from src.visualization.charts.base import visualize_survey_responses
+
         # Main chart configuration
         if distinction == "gender":
             self.fig1 = visualize_survey_responses(question_key, distinction_by_gender=True)
@@ -664,6 +787,7 @@ class DashboardWindow(QMainWindow):
             self.fig1 = visualize_survey_responses(question_key)
 
         # Secondary chart configuration
+        self._static_pixmap = None
         if distinction == "gender":
             self.fig2 = visualize_survey_responses(
                 question_key,
@@ -683,8 +807,45 @@ class DashboardWindow(QMainWindow):
                 income_filter=income_filter or list(income.values())[0]
             )
         else:
-            # Regular pie chart for non-gender distinctions
-            self.fig2 = visualize_survey_responses(question_key, pie_chart=True)
+            # The general pie chart is static, reuse its rendering while the data is unchanged
+            chart_key = self._static_chart_key(question_key)
+            cached_chart = self._static_charts.get(chart_key) if chart_key else None
+
+            if cached_chart is not None:
+                self._static_charts.move_to_end(chart_key)
+                self.fig2, self._static_pixmap = cached_chart
+            else:
+                # Regular pie chart for non-gender distinctions
+                self.fig2 = visualize_survey_responses(question_key, pie_chart=True)
+                if self.fig2 is not None and chart_key is not None:
+                    self._static_pixmap = self._render_figure_to_pixmap(self.fig2)
+                    self._cache_static_chart(chart_key, self.fig2, self._static_pixmap)
+
+    @staticmethod
+    def _static_chart_key(question_key: str) -> tuple[str, int] | None:
+        """Returns the cache key of a general pie chart, or None if the data cannot be read."""
+        try:
+            return question_key, os.stat(CLEANED_CSV_PATH).st_mtime_ns
+        except OSError:
+            return None
+
+    def _cache_static_chart(self, chart_key: tuple[str, int], fig: "Figure",
+                            pixmap: QPixmap) -> None:
+        """Stores a rendered chart, dropping charts of older data and the least recently used."""
+        for stale_key in [key for key in self._static_charts if key[1] != chart_key[1]]:
+            del self._static_charts[stale_key]
+
+        self._static_charts[chart_key] = (fig, pixmap)
+        while len(self._static_charts) > STATIC_CHART_CACHE_SIZE:
+            self._static_charts.popitem(last=False)
+
+    def _render_figure_to_pixmap(self, fig) -> QPixmap:
+        """Renders a figure once to an in-memory PNG and returns it as a pixmap."""
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
+        pixmap = QPixmap()
+        pixmap.loadFromData(buffer.getvalue())
+        return pixmap
 
     def _validate_figure_creation(self) -> bool:
         """Validates successful figure generation."""
@@ -720,7 +881,7 @@ class DashboardWindow(QMainWindow):
     def _refresh_graph_interface(self, distinction: str) -> None:
         """Updates UI with new visualizations and controls."""
         # Create graph widgets
-        graph_widgets = self._initialize_graph_components()
+        graph_widgets = self._initialize_graph_components(distinction)
 
         # Build main layout structure
         main_layout = QHBoxLayout()
@@ -746,10 +907,21 @@ class DashboardWindow(QMainWindow):
         main_layout.addLayout(charts_layout)
         self._complete_interface_setup(main_layout, graph_widgets)
 
-    def _initialize_graph_components(self) -> tuple:
-        """Creates and configures graph widgets."""
+    def _initialize_graph_components(self, distinction: str = None) -> tuple:
+        """Creates and configures graph widgets.
+
+        The general pie chart has no interactive controls, so it is displayed as a
+        cached pixmap that is only rescaled on resize, instead of a matplotlib canvas
+        that draws the figure again.
+        """
+        from src.assets.graph_widget import GraphWidget
+
         primary_graph = GraphWidget(self.fig1)
-        secondary_graph = GraphWidget(self.fig2)
+
+        if distinction is None and self._static_pixmap is not None:
+            secondary_graph = PixmapLabel(self._static_pixmap)
+        else:
+            secondary_graph = GraphWidget(self.fig2)
 
         # Common widget configuration
         for widget in (primary_graph, secondary_graph):
@@ -785,19 +957,15 @@ class DashboardWindow(QMainWindow):
     def export_graphs(self) -> None:
         """Export the current graph as an image."""
         try:
-            # Get the directory where the files will be saved
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            export_dir = os.path.join(current_dir, "..", "assets", "exported_graphs")
-
             # Create the directory if it doesn't exist
-            os.makedirs(export_dir, exist_ok=True)
+            os.makedirs(EXPORT_DIR, exist_ok=True)
 
             # Get the current date and time to avoid overwriting files
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
             # Define the output file names with a unique timestamp
-            file_path1 = os.path.join(export_dir, f"graph1_{timestamp}.png")
-            file_path2 = os.path.join(export_dir, f"graph2_{timestamp}.png")
+            file_path1 = os.path.join(EXPORT_DIR, f"graph1_{timestamp}.png")
+            file_path2 = os.path.join(EXPORT_DIR, f"graph2_{timestamp}.png")
 
             # Export the graphs using savefig()
             if self.fig1 is not None:
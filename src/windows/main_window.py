@@ -1,3 +1,7 @@
+# Standard library imports
+import importlib
+import threading
+
 # Third-party imports
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget, QLabel, QSpacerItem, QSizePolicy
@@ -15,6 +19,20 @@ from src.windows.dashboard_window import DashboardWindow
 from src.windows.recovery_window import RecoveryWindow
 from src.windows.registration_window import RegistrationWindow
 
+# Constants
+# Data libraries imported in the background while the login window is shown, so opening
+# the dashboard does not pay for them on the UI thread
+PRELOADED_MODULES: tuple[str, ...] = ("pandas", "openpyxl")
+
+
+def _preload_modules() -> None:
+    """Imports the modules in `PRELOADED_MODULES`, skipping any that are not installed."""
+    for module_name in PRELOADED_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as imp_err:
+            print(f"⚠️ [WARNING] Could not preload '{module_name}': {imp_err}")
+
 
 class MainWindow(QMainWindow):
     """
@@ -39,6 +57,9 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
 
+        # Warm up the data libraries while the user is typing their credentials
+        threading.Thread(target=_preload_modules, name="module-preload", daemon=True).start()
+
         # References to other windows (Dashboard, Registration, Recovery)
         self._dashboard_window: DashboardWindow | None = None
         self._registration_window: RegistrationWindow | None = None
@@ -200,6 +221,9 @@ class MainWindow(QMainWindow):
             # or if the attribute exists but its value is falsy
             if not hasattr(self, '_dashboard_window') or not self._dashboard_window:
                 self._dashboard_window = DashboardWindow()
+            else:
+                # Reuse the existing dashboard, only reloading the data that changed
+                self._dashboard_window.refresh()
 
             self._dashboard_window.show()
             self.close()
@@ -1,5 +1,5 @@
 # Third-party imports
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 
 # Local project-specific imports
@@ -8,6 +8,9 @@ from src.assets.utils import show_message, PasswordValidator, UsernameValidator
 from src.assets.custom_errors import InputValidationError, WidgetError
 from src.styles.styles import create_title, create_input_field, create_button
 
+# Constants
+VALIDATION_DEBOUNCE_MS = 150  # Idle time after the last keystroke before validating
+
 
 class RegistrationWindow(QWidget):
     """
@@ -23,6 +26,10 @@ class RegistrationWindow(QWidget):
         password_validator (PasswordValidator): Validator for the password.
         username_validator (UsernameValidator): Validator for the username.
         register_button (QPushButton): Button for user registration.
+        _username_debounce (QTimer): Single-shot timer that delays the username validation.
+        _password_debounce (QTimer): Single-shot timer that delays the password validation.
+        _last_username (str | None): Last username checked against the requirements.
+        _last_password (str | None): Last password checked against the requirements.
         _is_closing (bool): Flag to track if the window is closing.
         _is_registered (bool): Flag to track if the user has successfully registered.
     """
@@ -35,7 +42,7 @@ class RegistrationWindow(QWidget):
         respective validation functions.
 
         Calls validation methods to provide real-time feedback as the user types
-        in the input fields.
+        in the input fields, once typing pauses for `VALIDATION_DEBOUNCE_MS`.
         """
         super().__init__()
         self.setWindowTitle("User Registration")
@@ -71,9 +78,25 @@ class RegistrationWindow(QWidget):
         for label in self.username_validator.create_labels():
             layout.addWidget(label)
 
-        # Connect input fields to validation functions
-        self.username_input.textChanged.connect(self._validate_username)
-        self.password_input.textChanged.connect(self._validate_password)
+        # Debounce timers: a burst of keystrokes restarts the timer, so the validation
+        # runs once when typing pauses instead of on every character
+        self._username_debounce = QTimer(self)
+        self._username_debounce.setSingleShot(True)
+        self._username_debounce.setInterval(VALIDATION_DEBOUNCE_MS)
+        self._username_debounce.timeout.connect(self._validate_username)
+
+        self._password_debounce = QTimer(self)
+        self._password_debounce.setSingleShot(True)
+        self._password_debounce.setInterval(VALIDATION_DEBOUNCE_MS)
+        self._password_debounce.timeout.connect(self._validate_password)
+
+        # Last values checked, so unchanged text is not validated again
+        self._last_username: str | None = None
+        self._last_password: str | None = None
+
+        # Connect input fields to the debounce timers of their validation functions
+        self.username_input.textChanged.connect(lambda: self._username_debounce.start())
+        self.password_input.textChanged.connect(lambda: self._password_debounce.start())
 
         # Create register button using the `create_button` function from styles.py
         self.register_button = create_button("Register", self._on_register)
@@ -107,6 +130,8 @@ class RegistrationWindow(QWidget):
             print("⚠️ [WARNING] Closing registration window, stopping validation.")
 
         try:
+            self._password_debounce.stop()  # Drop any pending password validation
+            self._username_debounce.stop()  # Drop any pending username validation
             self.password_validator.get_timer().stop()  # Stop the password validation timer
             self.username_validator.get_timer().stop()  # Stop the username validation timer
 
@@ -127,6 +152,9 @@ class RegistrationWindow(QWidget):
         """
         Validates the password in real-time as the user types.
 
+        Called by the password debounce timer once typing pauses; the requirements are only
+        checked again if the password changed since the last validation.
+
         Displays password requirements and validates that the password meets
         security criteria. If the password does not meet the requirements, it shows
         the corresponding error labels.
@@ -141,9 +169,11 @@ class RegistrationWindow(QWidget):
 
         password: str = self.password_input.text().strip()
 
-        # Show and validate password requirements
+        # Show and validate password requirements, unless the password is unchanged
         self.password_validator.show_labels()
-        self.password_validator.validate_password(password)
+        if password != self._last_password:
+            self.password_validator.validate_password(password)
+            self._last_password = password
 
         # Restart the timer to hide labels after inactivity
         timer = self.password_validator.get_timer()
@@ -158,6 +188,9 @@ class RegistrationWindow(QWidget):
         """
         Validates the username in real-time as the user types.
 
+        Called by the username debounce timer once typing pauses; the requirements are only
+        checked again if the username changed since the last validation.
+
         Displays username requirements and validates that the username meets
         the necessary criteria. If the username is invalid, it shows the corresponding
         error labels.
@@ -172,9 +205,11 @@ class RegistrationWindow(QWidget):
 
         username: str = self.username_input.text().strip()
 
-        # Show and validate username requirements
+        # Show and validate username requirements, unless the username is unchanged
         self.username_validator.show_labels()
-        self.username_validator.validate_username(username)
+        if username != self._last_username:
+            self.username_validator.validate_username(username)
+            self._last_username = username
 
         # Restart the timer to hide labels after inactivity
         timer = self.username_validator.get_timer()
@@ -210,14 +245,18 @@ class RegistrationWindow(QWidget):
             print("❌ [ERROR] Registration failed: One or more fields are empty.")
             return
 
-        # Validate username
-        if not self.username_validator.validate_username(username):
+        # Validate username, remembering it so the debounced check does not repeat it
+        is_valid_username: bool = self.username_validator.validate_username(username)
+        self._last_username = username
+        if not is_valid_username:
             show_message(self, "Error", "Username does not meet all requirements.")
             print("❌ [ERROR] Registration failed: Invalid username.")
             return
 
-        # Validate password
-        if not self.password_validator.validate_password(password):
+        # Validate password, remembering it so the debounced check does not repeat it
+        is_valid_password: bool = self.password_validator.validate_password(password)
+        self._last_password = password
+        if not is_valid_password:
             show_message(self, "Error", "Password does not meet all requirements.")
             print("❌ [ERROR] Registration failed: Invalid password.")
             return
@@ -0,0 +1,64 @@
+"""
+Unit tests for the `BackgroundTask` runnable in the `src.assets.background_task` module.
+
+This test suite verifies that the task calls its function with the given arguments and
+reports the outcome through the `finished` and `failed` signals.
+
+Key tests include:
+
+- `test_run_emits_finished`: Ensures that the function is called with the forwarded
+arguments and that `finished` is emitted with the task name and its return value.
+
+- `test_run_emits_failed`: Verifies that an exception raised by the function is reported
+through the `failed` signal instead of propagating on the worker thread.
+
+The tests call `run()` directly, so the signals are delivered synchronously without
+needing a running event loop.
+"""
+# Standard library imports
+import unittest
+from unittest.mock import MagicMock
+
+# Local project-specific imports
+from src.assets.background_task import BackgroundTask
+
+
+class TestBackgroundTask(unittest.TestCase):
+    """
+    Unit tests for the BackgroundTask class.
+
+    This class verifies that the task emits its name on success and the error message
+    on failure.
+    """
+
+    def test_run_emits_finished(self) -> None:
+        """Test that the function is called and `finished` is emitted."""
+        function = MagicMock(return_value="result")
+        task = BackgroundTask("download", function, 1, key="value")
+        on_finished = MagicMock()
+        on_failed = MagicMock()
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+
+        task.run()
+
+        function.assert_called_once_with(1, key="value")
+        on_finished.assert_called_once_with("download", "result")
+        on_failed.assert_not_called()
+
+    def test_run_emits_failed(self) -> None:
+        """Test that an exception raised by the function is reported with `failed`."""
+        task = BackgroundTask("preprocessing", MagicMock(side_effect=ValueError("bad data")))
+        on_finished = MagicMock()
+        on_failed = MagicMock()
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+
+        task.run()
+
+        on_finished.assert_not_called()
+        on_failed.assert_called_once_with("preprocessing", "bad data")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for the `CsvLoader` runnable in the `src.assets.csv_loader` module.
+
+This test suite verifies that the loader reads CSV files with the requested options and
+reports its result through the `loaded` and `failed` signals.
+
+Key tests include:
+
+- `test_run_emits_loaded`: Ensures that a readable CSV file is emitted as a DataFrame,
+honoring the keyword arguments forwarded to `pandas.read_csv`, together with the
+modification time of the file.
+
+- `test_run_emits_failed`: Verifies that a missing file is reported through the
+`failed` signal instead of raising on the worker thread.
+
+- `test_read_csv_preview`: Checks that the preview helper returns the header and only the
+requested number of rows as text.
+
+The tests call `run()` directly, so the signals are delivered synchronously without
+needing a running event loop.
+"""
+# Standard library imports
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+# Local project-specific imports
+from src.assets.csv_loader import CsvLoader, read_csv_preview
+
+
+class TestCsvLoader(unittest.TestCase):
+    """
+    Unit tests for the CsvLoader class.
+
+    This class verifies that the loader emits the loaded DataFrame on success
+    and the error message on failure.
+    """
+
+    def test_run_emits_loaded(self) -> None:
+        """
+        Test that a CSV file is read and emitted with the `loaded` signal.
+
+        This test writes a small CSV file, loads only its first row and ensures the
+        emitted DataFrame matches the file contents.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "data.csv")
+            with open(csv_path, "w", encoding="utf-8") as file:
+                file.write("A,B\n1,2\n3,4\n")
+
+            loader = CsvLoader("cleaned", csv_path, nrows=1)
+            on_loaded = MagicMock()
+            on_failed = MagicMock()
+            loader.signals.loaded.connect(on_loaded)
+            loader.signals.failed.connect(on_failed)
+
+            expected_mtime_ns = os.stat(csv_path).st_mtime_ns
+            loader.run()
+
+        on_failed.assert_not_called()
+        on_loaded.assert_called_once()
+        name, df, mtime_ns = on_loaded.call_args.args
+        self.assertEqual(name, "cleaned")
+        self.assertEqual(list(df.columns), ["A", "B"])
+        self.assertEqual(df.values.tolist(), [[1, 2]])
+        self.assertEqual(mtime_ns, expected_mtime_ns)
+
+    def test_run_emits_failed(self) -> None:
+        """
+        Test that a read error is reported with the `failed` signal.
+
+        This test points the loader at a missing file and ensures that `failed` is
+        emitted with the loader name and that `loaded` is never emitted.
+        """
+        loader = CsvLoader("processed", os.path.join("missing_folder", "missing.csv"))
+        on_loaded = MagicMock()
+        on_failed = MagicMock()
+        loader.signals.loaded.connect(on_loaded)
+        loader.signals.failed.connect(on_failed)
+
+        loader.run()
+
+        on_loaded.assert_not_called()
+        on_failed.assert_called_once()
+        self.assertEqual(on_failed.call_args.args[0], "processed")
+
+
+    def test_read_csv_preview(self) -> None:
+        """Test that the preview helper reads the header and the first rows as text."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "data.csv")
+            with open(csv_path, "w", encoding="utf-8") as file:
+                file.write('A,B\n1,"x, y"\n3,4\n5,6\n')
+
+            columns, rows = read_csv_preview(csv_path, 2)
+
+        self.assertEqual(columns, ["A", "B"])
+        self.assertEqual(rows, [["1", "x, y"], ["3", "4"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,21 +10,41 @@ that they behave as expected.
 Key tests include:
 
 - `TestUnzipFile`: Verifies the behavior of the `unzip_file` function. This includes:
-    - Handling valid ZIP files and extracting them correctly.
+    - Handling valid ZIP files, extracting them correctly and returning the top-level folder.
+    - Finding the top-level folder when a file stored at the root is listed first.
+    - Refusing members whose path would be extracted outside the target folder.
     - Properly rejecting invalid ZIP files (e.g., non-ZIP files).
     - Handling corrupt or broken ZIP files and raising the appropriate exceptions.
 
 - `TestSetupBrowser`: Tests the `setup_browser` function to ensure:
-    - Successful initialization of the Chrome browser.
+    - Successful initialization of the Chrome browser, with eager page loads, no
+      extensions and a page load timeout.
     - Proper handling of browser initialization failures.
 
 - `TestDownloadFile`: Simulates scenarios in the `download_file` function where:
     - No ZIP files are found, ensuring the function returns `None` in such cases.
 
+- `TestWaitForDownload`: Checks the `wait_for_download` function, ensuring that:
+    - A completed ZIP file is returned as soon as it is detected.
+    - Pre-existing ZIP files and partial downloads lead to a `TimeoutError`.
+
+- `TestDownloadAndExtract`: Tests the `download_and_extract` function, ensuring that:
+    - A downloaded archive is extracted into the target folder.
+    - The name of the extracted top-level folder is returned.
+    - Unreachable URLs are reported with `None` so the browser can be used instead.
+    - An archive reported as unchanged is extracted from the download cache.
+    - Failed downloads and metadata writes leave no partial files in the cache.
+    - The Kaggle API token is only sent to Kaggle, never to other hosts.
+
+- `TestCopyOverlapped`: Checks the threaded download copy, ensuring that:
+    - Every chunk is written in order and the returned digest matches the data.
+    - A failing write is raised to the caller instead of blocking the reader.
+
 - `TestRenameFolder`: Validates the `rename_folder` function by testing:
     - Successfully renaming a folder when it exists.
     - Returning `None` if the folder to be renamed does not exist.
     - Handling errors during the renaming process, such as `OSError`.
+    - Replacing a folder left at the destination by a previous run.
 
 Each test case is designed to address normal behavior, edge cases,
 and potential error conditions, ensuring that the functions are both reliable
@@ -32,14 +52,21 @@ and resilient to unexpected situations.
 """
 
 # Standard library imports
+import hashlib
+import io
 import os
+import pathlib
+import tempfile
+import time
+import urllib.error
 import zipfile
 import unittest
 from unittest.mock import patch, MagicMock
 
 # Local project-specific imports
 from src.assets.download_files import unzip_file, setup_browser, download_file, \
-    rename_folder
+    rename_folder, wait_for_download, download_and_extract, DATASET_URL, DOWNLOAD_QUEUE_SIZE, \
+    BROWSER_PAGE_LOAD_STRATEGY, BROWSER_PAGE_LOAD_TIMEOUT, _copy_overlapped
 
 
 class TestUnzipFile(unittest.TestCase):
@@ -52,47 +79,64 @@ class TestUnzipFile(unittest.TestCase):
     - Corrupt ZIP files: checking that the function handles corrupt files correctly.
     """
 
-    @patch("zipfile.ZipFile") # Mocking the ZipFile class
-    @patch("zipfile.is_zipfile") # Mocking the is_zipfile function
-    @patch("os.remove") # Mocking os.remove to prevent actual file deletion
-    def test_unzip_file_valid(self, mock_remove, mock_is_zipfile, mock_zipfile) -> None:
+    def test_unzip_file_valid(self) -> None:
         """
         Test the unzip_file function for a valid ZIP file.
-        - Simulate a valid ZIP file scenario.
-        - Ensure that the file is extracted correctly and then deleted.
+        - Create a real ZIP file with a nested folder.
+        - Ensure that every member is extracted correctly and the ZIP file is then deleted.
         """
-        # Arrange
-        mock_is_zipfile.return_value = True  # Simulate that the file is a valid ZIP file
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange: Build a ZIP file with a member larger than the copy buffer
+            zip_file_path = os.path.join(temp_dir, "test.zip")
+            extract_to_folder = os.path.join(temp_dir, "test_folder")
+            large_content = os.urandom(3 * 1024 * 1024 + 17)
+            with zipfile.ZipFile(zip_file_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+                zip_ref.writestr("dataset/", b"")
+                zip_ref.writestr("dataset/data.csv", "a,b\n1,2\n")
+                zip_ref.writestr("dataset/large.bin", large_content)
 
-        # Create a mock ZipFile instance to simulate file extraction
-        mock_zip = MagicMock()
-        mock_zipfile.return_value = mock_zip
+            # Act: Call the unzip_file function to test
+            extracted_name = unzip_file(zip_file_path, extract_to_folder)
 
-        # Mock the context manager behavior
-        # This ensures the 'with' statement works properly
-        mock_zip.__enter__.return_value = mock_zip
+            # Assert: Verify the extracted files and that the ZIP file was removed
+            self.assertEqual(extracted_name, "dataset")
+            with open(os.path.join(extract_to_folder, "dataset", "data.csv"),
+                      encoding="utf-8") as file:
+                self.assertEqual(file.read(), "a,b\n1,2\n")
+            with open(os.path.join(extract_to_folder, "dataset", "large.bin"), "rb") as file:
+                self.assertEqual(file.read(), large_content)
+            self.assertFalse(os.path.exists(zip_file_path))
 
-        # Mock the extractall method to simulate extraction behavior
-        mock_zip.extractall = MagicMock()
+        print("Test for valid zip file passed.")
 
-        # Mock file paths
-        zip_file_path = "test.zip"
-        extract_to_folder = "test_folder"
+    def test_unzip_file_root_file_first(self) -> None:
+        """
+        Test that files stored at the root of the archive do not hide its top-level folder.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file_path = os.path.join(temp_dir, "test.zip")
+            with zipfile.ZipFile(zip_file_path, "w") as zip_ref:
+                zip_ref.writestr("README.md", "Dataset description")
+                zip_ref.writestr("dataset/data.csv", "a,b\n1,2\n")
 
-        # Ensure the file exists in the test setup
-        with patch("os.path.exists", return_value=True):
-            # Act: Call the unzip_file function to test
-            unzip_file(zip_file_path, extract_to_folder)
+            extracted_name = unzip_file(zip_file_path, os.path.join(temp_dir, "test_folder"))
 
-        # Assert: Verify that the mocks were called with the correct arguments
-        mock_is_zipfile.assert_called_once_with(
-            zip_file_path)  # Ensure is_zipfile was called with the correct file path
-        mock_zip.extractall.assert_called_once_with(
-            extract_to_folder)  # Ensure extractall was called with the correct target folder
-        mock_remove.assert_called_once_with(
-            zip_file_path)  # Ensure the zip file was removed after extraction
+        self.assertEqual(extracted_name, "dataset")
 
-        print("Test for valid zip file passed.")
+    def test_unzip_file_unsafe_member(self) -> None:
+        """
+        Test the unzip_file function for a ZIP member that points outside the target folder.
+        - Ensure that a ValueError is raised and nothing is written outside the folder.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file_path = os.path.join(temp_dir, "unsafe.zip")
+            with zipfile.ZipFile(zip_file_path, "w") as zip_ref:
+                zip_ref.writestr("../escaped.txt", "data")
+
+            with self.assertRaises(ValueError):
+                unzip_file(zip_file_path, os.path.join(temp_dir, "test_folder"))
+
+            self.assertFalse(os.path.exists(os.path.join(temp_dir, "escaped.txt")))
 
     @patch("zipfile.is_zipfile")
     def test_unzip_file_invalid(self, mock_is_zipfile) -> None:
@@ -161,6 +205,12 @@ class TestSetupBrowser(unittest.TestCase):
         self.assertEqual(driver, mock_driver)
 
         mock_chrome.assert_called_once()
+
+        # The browser loads pages eagerly, without extensions, and gives up on slow pages
+        options = mock_chrome.call_args.kwargs["options"]
+        self.assertEqual(options.page_load_strategy, BROWSER_PAGE_LOAD_STRATEGY)
+        self.assertIn("--disable-extensions", options.arguments)
+        mock_driver.set_page_load_timeout.assert_called_once_with(BROWSER_PAGE_LOAD_TIMEOUT)
         print("Test for browser setup passed.")
 
     # Mocking the Chrome browser initialization
@@ -215,6 +265,208 @@ class TestDownloadFile(unittest.TestCase):
         print("Test for no ZIP file found passed.")
 
 
+class TestWaitForDownload(unittest.TestCase):
+    """
+    Test suite for the `wait_for_download` function in the `src.assets.download_files` module.
+
+    This test suite verifies that the function:
+    - Returns the name of a new ZIP file once its size is stable.
+    - Ignores ZIP files that existed before the download and raises on timeout.
+    """
+
+    def test_wait_for_download_complete(self) -> None:
+        """
+        Test that a completed ZIP file is detected without waiting for the timeout.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "dataset.zip"), "wb") as file:
+                file.write(b"data")
+
+            start = time.monotonic()
+            self.assertEqual(wait_for_download(temp_dir, timeout=5), "dataset.zip")
+            self.assertLess(time.monotonic() - start, 2)
+
+    def test_wait_for_download_timeout(self) -> None:
+        """
+        Test that old ZIP files and partial downloads never count as a completed download.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("old.zip", "dataset.zip.crdownload"):
+                with open(os.path.join(temp_dir, name), "wb") as file:
+                    file.write(b"data")
+
+            with self.assertRaises(TimeoutError):
+                wait_for_download(temp_dir, timeout=0.5, ignored_files={"old.zip"})
+
+
+class TestDownloadAndExtract(unittest.TestCase):
+    """
+    Test suite for the `download_and_extract` function in the `src.assets.download_files` module.
+
+    The archive is served from a `file://` URL, so the download code path runs without
+    network access.
+    """
+
+    def test_download_and_extract_success(self) -> None:
+        """
+        Test that a downloaded archive is extracted into the target folder.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file_path = os.path.join(temp_dir, "dataset.zip")
+            with zipfile.ZipFile(zip_file_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+                zip_ref.writestr("dataset/data.csv", "a,b\n1,2\n")
+            extract_to_folder = os.path.join(temp_dir, "output")
+
+            url = pathlib.Path(zip_file_path).as_uri()
+            cache_dir = os.path.join(temp_dir, "cache")
+            self.assertEqual(download_and_extract(url, extract_to_folder, cache_dir=cache_dir),
+                             "dataset")
+
+            with open(os.path.join(extract_to_folder, "dataset", "data.csv"),
+                      encoding="utf-8") as file:
+                self.assertEqual(file.read(), "a,b\n1,2\n")
+
+    def test_download_and_extract_failure(self) -> None:
+        """
+        Test that a missing archive returns None instead of raising.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            url = pathlib.Path(os.path.join(temp_dir, "missing.zip")).as_uri()
+            self.assertIsNone(download_and_extract(url, temp_dir,
+                                                   cache_dir=os.path.join(temp_dir, "cache")))
+
+    def test_download_and_extract_uses_cache(self) -> None:
+        """
+        Test that an archive reported as unchanged is extracted from the cache.
+
+        The first call downloads and caches the archive. The second one simulates a
+        `304 Not Modified` answer and must still extract the cached copy.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file_path = os.path.join(temp_dir, "dataset.zip")
+            with zipfile.ZipFile(zip_file_path, "w") as zip_ref:
+                zip_ref.writestr("data.csv", "a,b\n1,2\n")
+            url = pathlib.Path(zip_file_path).as_uri()
+            cache_dir = os.path.join(temp_dir, "cache")
+
+            self.assertTrue(download_and_extract(url, os.path.join(temp_dir, "first"),
+                                                 cache_dir=cache_dir))
+            self.assertTrue(os.path.exists(zip_file_path))  # The source is never removed
+
+            not_modified = urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+            with patch("urllib.request.urlopen", side_effect=not_modified) as mock_urlopen:
+                self.assertTrue(download_and_extract(url, os.path.join(temp_dir, "second"),
+                                                     cache_dir=cache_dir))
+
+            request = mock_urlopen.call_args.args[0]
+            self.assertIsNotNone(request.get_header("If-modified-since"))
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, "second", "data.csv")))
+
+    def test_download_and_extract_removes_partial_archive(self) -> None:
+        """
+        Test that an interrupted download leaves no partial archive in the cache.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file_path = os.path.join(temp_dir, "dataset.zip")
+            with zipfile.ZipFile(zip_file_path, "w") as zip_ref:
+                zip_ref.writestr("data.csv", "a,b\n1,2\n")
+            url = pathlib.Path(zip_file_path).as_uri()
+            cache_dir = os.path.join(temp_dir, "cache")
+
+            with patch("src.assets.download_files._copy_overlapped",
+                       side_effect=OSError("Connection reset")):
+                self.assertIsNone(download_and_extract(url, os.path.join(temp_dir, "output"),
+                                                       cache_dir=cache_dir))
+
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_download_and_extract_writes_metadata_atomically(self) -> None:
+        """
+        Test that a failing metadata write keeps the previous metadata file intact.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_file_path = os.path.join(temp_dir, "dataset.zip")
+            with zipfile.ZipFile(zip_file_path, "w") as zip_ref:
+                zip_ref.writestr("data.csv", "a,b\n1,2\n")
+            url = pathlib.Path(zip_file_path).as_uri()
+            cache_dir = os.path.join(temp_dir, "cache")
+
+            self.assertTrue(download_and_extract(url, os.path.join(temp_dir, "first"),
+                                                 cache_dir=cache_dir))
+            metadata_files = [name for name in os.listdir(cache_dir) if name.endswith(".json")]
+            self.assertEqual(len(metadata_files), 1)
+            metadata_path = os.path.join(cache_dir, metadata_files[0])
+            with open(metadata_path, "r", encoding="utf-8") as file:
+                previous_metadata = file.read()
+
+            with patch("json.dump", side_effect=OSError("No space left on device")):
+                self.assertIsNone(download_and_extract(url, os.path.join(temp_dir, "second"),
+                                                       cache_dir=cache_dir, force=True))
+
+            with open(metadata_path, "r", encoding="utf-8") as file:
+                self.assertEqual(file.read(), previous_metadata)
+            self.assertFalse(any(name.endswith(".part") for name in os.listdir(cache_dir)))
+
+    @patch.dict(os.environ, {"KAGGLE_USERNAME": "user", "KAGGLE_KEY": "secret"})
+    def test_download_and_extract_kaggle_credentials(self) -> None:
+        """
+        Test that the Kaggle API token authenticates Kaggle requests only.
+        """
+        offline = urllib.error.URLError("offline")
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("urllib.request.urlopen", side_effect=offline) as mock_urlopen:
+            self.assertIsNone(download_and_extract(DATASET_URL, temp_dir, cache_dir=temp_dir))
+            kaggle_request = mock_urlopen.call_args.args[0]
+
+            self.assertIsNone(download_and_extract("https://example.com/data.zip", temp_dir,
+                                                   cache_dir=temp_dir))
+            other_request = mock_urlopen.call_args.args[0]
+
+        self.assertEqual(kaggle_request.get_header("Authorization"), "Basic dXNlcjpzZWNyZXQ=")
+        self.assertIsNone(other_request.get_header("Authorization"))
+
+
+class TestCopyOverlapped(unittest.TestCase):
+    """
+    Test suite for the `_copy_overlapped` helper in the `src.assets.download_files` module.
+
+    The source is read on the calling thread while a writer thread writes and hashes the
+    chunks, so these tests check both the copied data and the error handling between them.
+    """
+
+    def test_copy_overlapped_contents_and_digest(self) -> None:
+        """
+        Test that more chunks than the queue holds are copied in order with a matching digest.
+        """
+        chunk_size = 1024
+        data = os.urandom(chunk_size * (DOWNLOAD_QUEUE_SIZE * 4) + 123)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "archive.zip")
+            with open(file_path, "wb") as destination:
+                digest = _copy_overlapped(io.BytesIO(data), destination, chunk_size)
+
+            with open(file_path, "rb") as file:
+                self.assertEqual(file.read(), data)
+        self.assertEqual(digest, hashlib.sha256(data).hexdigest())
+
+    def test_copy_overlapped_write_error(self) -> None:
+        """
+        Test that a failing write reaches the caller and the reader stops early.
+        """
+        chunk_size = 16
+        source = io.BytesIO(b"x" * chunk_size * DOWNLOAD_QUEUE_SIZE * 100)
+        destination = MagicMock()
+        destination.write.side_effect = OSError("No space left on device")
+
+        with self.assertRaises(OSError):
+            _copy_overlapped(source, destination, chunk_size)
+
+        # Only the first write is attempted and the rest of the source is never read
+        destination.write.assert_called_once()
+        self.assertLess(source.tell(), len(source.getvalue()))
+
+
 class TestRenameFolder(unittest.TestCase):
     """
     Test suite for the `rename_folder` function in the `FinalProject.assets.download_files` module.
@@ -225,8 +477,10 @@ class TestRenameFolder(unittest.TestCase):
     - Folder not found: Ensures that when the folder does not exist, the function returns `None`.
     - Folder rename failure: Simulates a failure in renaming and checks
         that the function handles the error properly.
+    - Existing destination: A folder left by a previous run is replaced.
+    - Same name: Renaming a folder to its own name does nothing.
     """
-    @patch("os.rename")
+    @patch("os.replace")
     @patch("os.path.exists")
     def test_rename_folder_success(self, mock_exists, mock_rename) -> None:
         """
@@ -241,7 +495,7 @@ class TestRenameFolder(unittest.TestCase):
         # Act: Call the rename_folder function
         renamed_folder_path = rename_folder(original_folder, new_folder_name)
 
-        # Assert: Verify that os.rename was called with the correct arguments
+        # Assert: Verify that os.replace was called with the correct arguments
         mock_rename.assert_called_once_with(original_folder,
                                             os.path.join(os.path.dirname(original_folder),
                                                          new_folder_name))
@@ -269,19 +523,19 @@ class TestRenameFolder(unittest.TestCase):
         self.assertIsNone(renamed_folder_path)
         print("Test for folder not found passed.")
 
-    @patch("os.rename")
+    @patch("os.replace")
     @patch("os.path.exists")
     def test_rename_folder_failure(self, mock_exists, mock_rename) -> None:
         """
         Test the rename_folder function when renaming a folder fails.
-        - Simulate a failure scenario in os.rename.
+        - Simulate a failure scenario in os.replace.
         """
         # Arrange: Simulate that the folder exists
         mock_exists.return_value = True
         original_folder = "test_folder"
         new_folder_name = "new_test_folder"
 
-        # Simulate that os.rename raises an exception
+        # Simulate that os.replace raises an exception
         mock_rename.side_effect = OSError("Failed to rename folder")
 
         # Act & Assert: Ensure that the function handles the error and returns None
@@ -289,6 +543,36 @@ class TestRenameFolder(unittest.TestCase):
         self.assertIsNone(renamed_folder_path)
         print("Test for folder rename failure passed.")
 
+    def test_rename_folder_replaces_existing_destination(self) -> None:
+        """
+        Test that a folder left at the destination by a previous run is replaced.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original_folder = os.path.join(temp_dir, "extracted")
+            stale_folder = os.path.join(temp_dir, "dataset")
+            os.makedirs(original_folder)
+            os.makedirs(stale_folder)
+            with open(os.path.join(original_folder, "new.csv"), "w", encoding="utf-8") as file:
+                file.write("new")
+            with open(os.path.join(stale_folder, "old.csv"), "w", encoding="utf-8") as file:
+                file.write("old")
+
+            renamed_folder_path = rename_folder(original_folder, "dataset")
+
+            self.assertEqual(renamed_folder_path, stale_folder)
+            self.assertFalse(os.path.exists(original_folder))
+            self.assertEqual(os.listdir(stale_folder), ["new.csv"])
+
+    @patch("os.replace")
+    def test_rename_folder_same_name(self, mock_replace) -> None:
+        """
+        Test that renaming a folder to its own name is a no-op that returns its path.
+        """
+        folder = os.path.join("downloads", "dataset")
+
+        self.assertEqual(rename_folder(folder, "dataset"), folder)
+        mock_replace.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,11 +21,17 @@ Key tests include:
     - `on_click`: Tests handling of valid and invalid mouse click events, ensuring
       the widget enters dragging mode only when appropriate.
     - `on_release`: Confirms that dragging mode is correctly disabled on mouse release.
-    - `on_move`: Verifies panning functionality when dragging is enabled.
+    - Event errors: an exception inside a mouse handler is reported, not propagated.
+    - `on_move`: Verifies panning functionality when dragging is enabled, and that
+      the redraws of a fast drag are coalesced into a single throttled draw. The axis
+      limits are read once per drag and then updated in place.
 
 - Other Functionalities:
+    - `pan_view`: Verifies keyboard panning shifts the limits and defers the redraw.
     - `reset_zoom`: Ensures the widget correctly resets the view to its default zoom.
     - `toggle_grid`: Verifies the ability to toggle the grid display on or off.
+    - `add_annotation` / `delete_last_annotation`: Verifies that annotations with the
+      same text are all kept and are removed in reverse order.
     - `save_figure`: Tests saving the figure to a file, including handling user cancellations.
     - `show_help`: Validates the help message display with accurate content.
 
@@ -151,6 +157,22 @@ class TestGraphWidget(unittest.TestCase):
         self.assertFalse(self.widget._dragging) # Dragging should not be enabled
 
 
+    def test_event_handler_error_is_reported(self) -> None:
+        """
+        Test that an error inside a mouse handler is printed instead of propagated.
+        """
+        self.widget._dragging = True
+        self.widget._last_x = None  # Makes the pan arithmetic fail
+        self.widget._last_y = None
+
+        with patch("builtins.print") as mock_print:
+            self.widget.on_move(MagicMock(inaxes=MagicMock(), xdata=1, ydata=1))
+
+        message: str = mock_print.call_args[0][0]
+        self.assertIn("[ERROR]", message)
+        self.assertIn("on_move", message)
+
+
     def test_on_release(self) -> None:
         """
         Test mouse release handling.
@@ -181,6 +203,76 @@ class TestGraphWidget(unittest.TestCase):
         mock_axes.set_ylim.assert_called_once_with(-2, 8)
 
 
+    def test_on_move_throttles_redraw(self) -> None:
+        """
+        Test that several motion events during a drag trigger a single deferred redraw.
+        """
+        mock_axes: MagicMock = MagicMock()
+        mock_axes.get_xlim.return_value = (0, 10)
+        mock_axes.get_ylim.return_value = (0, 10)
+
+        self.widget._dragging = True
+        self.widget._last_x = 5
+        self.widget._last_y = 5
+
+        with patch.object(self.widget, "draw") as mock_draw, \
+                patch.object(self.widget, "draw_idle") as mock_draw_idle:
+            for x_pos in (6, 7, 8):
+                self.widget.on_move(MagicMock(inaxes=mock_axes, xdata=x_pos, ydata=5))
+
+            # Nothing is rendered synchronously; one redraw is pending
+            mock_draw.assert_not_called()
+            mock_draw_idle.assert_not_called()
+            self.assertTrue(self.widget._draw_timer.isActive())
+
+            self.widget._draw_timer.stop()
+            self.widget._flush_pending_draw()
+            self.widget._flush_pending_draw()  # A second flush has nothing to draw
+
+            mock_draw_idle.assert_called_once()
+            self.assertFalse(self.widget._draw_pending)
+
+
+    def test_on_move_reuses_cached_limits(self) -> None:
+        """
+        Test that a drag reads the axis limits once and then updates them in place.
+        """
+        mock_axes: MagicMock = MagicMock()
+        mock_axes.get_xlim.return_value = (0, 10)
+        mock_axes.get_ylim.return_value = (0, 10)
+
+        self.widget.on_click(MagicMock(button=1, inaxes=mock_axes, xdata=5, ydata=5))
+        self.widget.on_move(MagicMock(inaxes=mock_axes, xdata=6, ydata=5))
+        self.widget.on_move(MagicMock(inaxes=mock_axes, xdata=8, ydata=4))
+
+        mock_axes.get_xlim.assert_called_once()
+        mock_axes.get_ylim.assert_called_once()
+        mock_axes.set_xlim.assert_called_with(-3, 7)
+        mock_axes.set_ylim.assert_called_with(1, 11)
+
+        self.widget.on_release(MagicMock(button=1))
+        self.assertIsNone(self.widget._ax)
+
+
+    def test_pan_view_defers_redraw(self) -> None:
+        """
+        Test that `pan_view` shifts the limits and schedules a redraw instead of drawing.
+        """
+        mock_axes: MagicMock = MagicMock()
+        mock_axes.get_xlim.return_value = (0, 10)
+        mock_axes.get_ylim.return_value = (0, 10)
+        self.widget.figure.gca = MagicMock(return_value=mock_axes)
+
+        with patch.object(self.widget, "draw") as mock_draw, \
+                patch.object(self.widget, "draw_idle") as mock_draw_idle:
+            self.widget.pan_view(1, -2)
+
+        mock_axes.set_xlim.assert_called_once_with(1, 11)
+        mock_axes.set_ylim.assert_called_once_with(-2, 8)
+        mock_draw.assert_not_called()
+        mock_draw_idle.assert_called_once()
+
+
     def test_reset_zoom(self) -> None:
         """
         Test that the zoom is reset correctly.
@@ -203,6 +295,31 @@ class TestGraphWidget(unittest.TestCase):
         self.widget.toggle_grid()
         mock_axes.grid.assert_called_once_with(True) # Verify grid is toggled on
 
+        self.widget.toggle_grid()
+        mock_axes.grid.assert_called_with(False) # Verify grid is toggled off again
+
+
+    @patch("src.assets.graph_widget.QInputDialog.getText", return_value=("Peak", True))
+    def test_delete_last_annotation_with_repeated_text(self, _mock_get_text: MagicMock) -> None:
+        """
+        Test that annotations sharing a text are kept apart and removed last-in, first-out.
+        """
+        axis = self.fig.add_subplot()
+        self.widget._last_x, self.widget._last_y = 0.5, 0.5
+
+        self.widget.add_annotation()
+        self.widget.add_annotation()
+        first, second = self.widget._annotations
+        self.assertEqual(len(axis.texts), 2) # Both annotations are on the axes
+
+        self.widget.delete_last_annotation()
+        self.assertEqual(list(axis.texts), [first]) # Only the most recent one is removed
+
+        self.widget.delete_last_annotation()
+        self.widget.delete_last_annotation() # Nothing left to delete
+        self.assertEqual(len(axis.texts), 0)
+        self.assertNotIn(second, axis.texts)
+
 
     @patch("PySide6.QtWidgets.QFileDialog.getSaveFileName")
     def test_save_figure(self, mock_get_save_file_name: MagicMock) -> None:
@@ -0,0 +1,113 @@
+"""
+Unit tests for the `PandasModel` class in the `src.assets.pandas_model` module.
+
+This test suite verifies that the table model exposes the shape, cell texts and headers
+of a pandas DataFrame, and that replacing the DataFrame resets the model.
+
+Key tests include:
+
+- `test_empty_model`: Ensures that a model created without data has no rows or columns.
+
+- `test_data_and_headers`: Verifies that cell texts match `str()` of the original values
+and that column names and row numbers are returned as headers.
+
+- `test_set_dataframe_resets_model`: Confirms that `set_dataframe` replaces the data
+inside a model reset.
+
+- `test_same_shape_updates_in_place`: Ensures that data with the same header and shape
+is reported through `dataChanged` without resetting the model.
+
+- `test_set_rows`: Checks that plain rows are shown as text and padded or cut to the
+header width.
+"""
+# Standard library imports
+import unittest
+from unittest.mock import MagicMock
+
+# Third-party imports
+import pandas as pd
+from PySide6.QtCore import Qt
+
+# Local project-specific imports
+from src.assets.pandas_model import PandasModel
+
+
+class TestPandasModel(unittest.TestCase):
+    """
+    Unit tests for the PandasModel class.
+
+    This class verifies that the model reports the DataFrame contents to the views
+    that display it.
+    """
+
+    def test_empty_model(self) -> None:
+        """Test that a model without a DataFrame is empty."""
+        model = PandasModel()
+
+        self.assertEqual(model.rowCount(), 0)
+        self.assertEqual(model.columnCount(), 0)
+
+    def test_data_and_headers(self) -> None:
+        """
+        Test the cell texts and headers exposed by the model.
+
+        This test ensures that every cell is shown as `str()` of its value and that the
+        headers are the column names and 1-based row numbers.
+        """
+        df = pd.DataFrame({'A': [1, 2], 'B': [0.5, None], 'C': ['x', 'y']})
+        model = PandasModel(df)
+
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.columnCount(), 3)
+        for row in range(2):
+            for col in range(3):
+                self.assertEqual(model.index(row, col).data(), str(df.iloc[row, col]))
+
+        self.assertEqual(model.headerData(1, Qt.Orientation.Horizontal), 'B')
+        self.assertEqual(model.headerData(0, Qt.Orientation.Vertical), '1')
+        self.assertIsNone(model.index(0, 0).data(Qt.ItemDataRole.EditRole))
+
+    def test_set_dataframe_resets_model(self) -> None:
+        """Test that replacing the DataFrame resets the model with the new data."""
+        model = PandasModel(pd.DataFrame({'A': [1, 2, 3]}))
+        on_reset = MagicMock()
+        model.modelReset.connect(on_reset)
+
+        self.assertTrue(model.set_dataframe(pd.DataFrame({'X': ['a'], 'Y': ['b']})))
+
+        on_reset.assert_called_once()
+        self.assertEqual(model.rowCount(), 1)
+        self.assertEqual(model.columnCount(), 2)
+        self.assertEqual(model.index(0, 1).data(), 'b')
+
+
+    def test_same_shape_updates_in_place(self) -> None:
+        """Test that replacing data of the same shape emits dataChanged instead of a reset."""
+        model = PandasModel(pd.DataFrame({'A': [1, 2], 'B': ['x', 'y']}))
+        on_reset = MagicMock()
+        on_changed = MagicMock()
+        model.modelReset.connect(on_reset)
+        model.dataChanged.connect(on_changed)
+
+        self.assertFalse(model.set_dataframe(pd.DataFrame({'A': [3, 4], 'B': ['z', 'w']})))
+
+        on_reset.assert_not_called()
+        on_changed.assert_called_once()
+        self.assertEqual(model.index(1, 1).data(), 'w')
+
+    def test_set_rows(self) -> None:
+        """Test that plain rows replace the data and are fitted to the header width."""
+        model = PandasModel(pd.DataFrame({'A': [1, 2, 3]}))
+
+        model.set_rows(['X', 'Y'], [[1, 'a'], [2], [3, 'c', 'extra']])
+
+        self.assertEqual(model.rowCount(), 3)
+        self.assertEqual(model.columnCount(), 2)
+        self.assertEqual(model.index(0, 0).data(), '1')
+        self.assertEqual(model.index(1, 1).data(), '')
+        self.assertEqual(model.index(2, 1).data(), 'c')
+        self.assertEqual(model.headerData(1, Qt.Orientation.Horizontal), 'Y')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Unit tests for the `PixmapLabel` class in the `src.assets.pixmap_label` module.
+
+This test suite verifies that the label keeps the original image and rescales it to its
+own size whenever it is resized.
+
+Key tests include:
+
+- `test_initial_pixmap`: Ensures that the original pixmap is shown and kept unchanged.
+
+- `test_resize_rescales_pixmap`: Verifies that resizing the label scales the displayed
+pixmap to fit, keeping the aspect ratio, and that growing it again starts from the
+original image.
+"""
+# Standard library imports
+import unittest
+
+# Third-party imports
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+# Local project-specific imports
+from src.assets.pixmap_label import PixmapLabel
+
+
+class TestPixmapLabel(unittest.TestCase):
+    """
+    Unit tests for the PixmapLabel class.
+
+    This class verifies that the displayed pixmap follows the size of the label.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Initialize the QApplication instance required to create widgets."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_initial_pixmap(self) -> None:
+        """Test that the label shows the original pixmap and keeps a reference to it."""
+        pixmap = QPixmap(200, 100)
+        label = PixmapLabel(pixmap)
+
+        self.assertEqual(label.pixmap().size(), QSize(200, 100))
+        self.assertEqual(label.original_pixmap().size(), QSize(200, 100))
+
+    def test_resize_rescales_pixmap(self) -> None:
+        """Test that resizing the label rescales the original pixmap to fit."""
+        label = PixmapLabel(QPixmap(200, 100))
+        label.show()
+
+        label.resize(100, 100)
+        QApplication.processEvents()
+        self.assertEqual(label.pixmap().size(), QSize(100, 50))
+
+        label.resize(400, 400)
+        QApplication.processEvents()
+        self.assertEqual(label.pixmap().size(), QSize(400, 200))
+        self.assertEqual(label.original_pixmap().size(), QSize(200, 100))
+
+        label.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
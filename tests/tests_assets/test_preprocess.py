@@ -13,6 +13,8 @@ Key tests include:
     - Verifies that the `remove_outliers` function correctly identifies and removes
       outliers from numeric columns.
     - Ensures non-outlier values are preserved and the resulting dataset is smaller.
+    - Checks that rows with missing or negative numeric values are dropped, as are rows
+      with outliers in several columns.
 
 - `TestCalculateEntropy`:
     - Confirms that the `calculate_entropy` function accurately computes entropy
@@ -121,6 +123,21 @@ class TestPreprocess(unittest.TestCase):
         self.assertNotIn(10, cleaned_df_custom['Q3_SCHOOL'].values,
                          "Outlier 10 was not removed correctly with custom threshold for Q3_SCHOOL")
 
+    def test_remove_outliers_missing_and_negative_values(self) -> None:
+        """
+        Test that rows with missing, negative or several out-of-range values are dropped.
+        """
+        data = pd.DataFrame({
+            'numeric_col': [1, np.nan, -1, 9, 2],
+            'Q3_SCHOOL': [1, 2, 3, 9, 8],  # 8 is the inclusive upper bound of Q3_SCHOOL
+            'string_col': ['a', 'b', 'c', 'd', 'e'],
+        })
+
+        cleaned_df: pd.DataFrame = remove_outliers(data)
+
+        self.assertListEqual(cleaned_df.index.tolist(), [0, 4])
+        self.assertListEqual(cleaned_df['string_col'].tolist(), ['a', 'e'])
+
     def test_calculate_entropy(self) -> None:
         """
         Test the `calculate_entropy` function for accurate entropy calculation.
@@ -204,6 +221,23 @@ class TestPreprocess(unittest.TestCase):
         # Assert outlier counts are correct
         self.assertEqual(summary_df.loc['numeric_col', 'Outliers'], 1) # Only 100 is outlier
 
+    def test_summary_first_values(self) -> None:
+        """
+        Test that `summary` reports the first three values of every column, keeping
+        numeric values as numbers and converting the rest to strings.
+        """
+        summary_df: pd.DataFrame = summary(self.sample_data)
+
+        self.assertEqual(summary_df.loc['numeric_col', 'First Value'], 1.0)
+        self.assertEqual(summary_df.loc['numeric_col', 'Third Value'], 3.0)
+        self.assertEqual(summary_df.loc['string_col', 'Second Value'], 'b')
+        self.assertTrue(np.isnan(summary_df.loc['missing_col', 'Third Value']))
+
+        # A dataframe with fewer than three rows leaves the missing positions empty
+        short_summary: pd.DataFrame = summary(self.sample_data.head(1))
+        self.assertEqual(short_summary.loc['string_col', 'First Value'], 'a')
+        self.assertIsNone(short_summary.loc['string_col', 'Second Value'])
+
     @patch('src.assets.preprocess.read_xls_from_folder')
     def test_pipeline_end_to_end(self, mock_read_xls) -> None:
         """
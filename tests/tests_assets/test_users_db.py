@@ -31,6 +31,9 @@ with an existing username raises a validation error.
 
 - `test_get_user_by_username`: Verifies that the correct user is retrieved by username.
 
+- `test_get_user_by_username_uses_cache`: Ensures that repeated username lookups reuse the
+  in-memory copy of an unchanged database.
+
 - `test_get_user_by_email`: Verifies that the correct user is retrieved by email.
 
 - `test_check_password_hash`: Ensures the correct verification of passwords against stored hashes.
@@ -46,6 +49,8 @@ for a real database or filesystem operations.
 
 # Standard library imports
 import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 
@@ -56,7 +61,8 @@ import bcrypt
 from src.assets.custom_errors import DatabaseError, ValidationError
 from src.assets.users_db import (
     validate_users_db, load_users_db, save_users_db, add_user_to_db,
-    get_user_by_username, get_user_by_email, check_password_hash, username_exists
+    get_user_by_username, get_user_by_email, check_password_hash, username_exists,
+    clear_users_db_cache
 )
 
 
@@ -69,6 +75,11 @@ class TestUsersDb(unittest.TestCase):
     the existence of users in the database.
     """
 
+    def setUp(self) -> None:
+        """Start every test without a cached users database."""
+        clear_users_db_cache()
+
+
     # Mocks the check for whether the database file exists
     # and simulates opening an empty file to test if it is handled correctly
     @patch("src.assets.users_db.os.path.exists")
@@ -206,6 +217,31 @@ class TestUsersDb(unittest.TestCase):
         self.assertIsNotNone(user) # Verifying that a user is returned
 
 
+    # Mocks the database file and counts how many times it is read
+    @patch("src.assets.users_db.load_users_db",
+           return_value={"user": {"email": "user@example.com", "password_hash": "hash"}})
+    def test_get_user_by_username_uses_cache(self, mock_load_users_db) -> None:
+        """
+        Test case for the in-memory cache used by username lookups.
+
+        This test verifies that repeated lookups read the database once while the file is
+        unchanged, and that clearing the cache forces a new read.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_file = os.path.join(temp_dir, "users_db.json")
+            with open(db_file, "w", encoding="utf-8") as file:
+                file.write("{}")
+
+            with patch("src.assets.users_db.DB_FILE", db_file):
+                self.assertIsNotNone(get_user_by_username("user"))
+                self.assertIsNone(get_user_by_username("missing"))
+                self.assertEqual(mock_load_users_db.call_count, 1)
+
+                clear_users_db_cache()
+                get_user_by_username("user")
+                self.assertEqual(mock_load_users_db.call_count, 2)
+
+
     # Mocks getting a user by their email address
     @patch("src.assets.users_db.load_users_db",
            return_value={"user": {"email": "user@example.com", "password_hash": "hash"}})
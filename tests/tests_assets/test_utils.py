@@ -13,8 +13,8 @@ Key tests include:
 - `test_show_message`: Verifies that `show_message` correctly uses `QMessageBox`
 to display messages.
 
-- `test_read_xls_from_folder_no_files`: Ensures that when no files are found
-in the folder, `read_xls_from_folder` returns `None`.
+- `test_read_xls_from_folder_no_files`: Ensures that when no Excel files are found
+in a real temporary folder, `read_xls_from_folder` returns `None`.
 
 - `test_read_xls_from_folder_file_not_found`: Verifies that if the specified
 file is not found during reading, `read_xls_from_folder` correctly
@@ -26,6 +26,15 @@ handles general exceptions correctly when reading an Excel file.
 - `test_read_xls_from_folder_success`: Ensures that `read_xls_from_folder`
 successfully reads and returns the data from an Excel file when present.
 
+- `test_read_xls_from_folder_remembers_file`: Ensures that the chosen Excel file is
+reused until the folder is modified.
+
+- `test_read_xls_from_folder_uses_cache`: Ensures that a cached copy of an
+unchanged Excel file is returned without parsing the file again.
+
+- `test_read_xls_from_folder_prunes_cache`: Ensures that caching a new version of
+a workbook removes the cached copy of its previous version.
+
 - `test_validator_base_create_labels`: Ensures `ValidatorBase` creates
 validation labels with appropriate styles.
 
@@ -38,6 +47,10 @@ label styles and validation status correctly.
 - `test_password_validator`: Ensures `PasswordValidator` validates passwords
 according to defined criteria.
 
+- `test_validators_reuse_compiled_patterns`: Checks that the validators use patterns
+compiled once, paired with their labels only once, and fail validation until their
+labels have been created.
+
 - `test_username_validator`: Verifies that `UsernameValidator` checks usernames
 against specified rules.
 
@@ -47,6 +60,8 @@ for a full graphical environment or actual user input.
 """
 
 # Standard library imports
+import os
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, patch
@@ -56,6 +71,7 @@ import pandas as pd
 from PySide6.QtWidgets import QApplication
 
 # Local imports
+from src.assets.io_utils import EXCEL_NO_CACHE_ENV
 from src.assets.utils import (show_message, ValidatorBase, PasswordValidator,
                               UsernameValidator, read_xls_from_folder)
 
@@ -125,15 +141,24 @@ class TestUtils(unittest.TestCase):
         MockQMessageBox.return_value.setText.assert_called_once_with("Test Message")
 
 
-    @staticmethod
-    def mock_os_listdir(files: list[str]) -> patch:
+    def make_folder(self, *file_names: str) -> str:
         """
-        Helper function to mock the os.listdir function.
+        Helper function to build a temporary folder holding the given files.
 
-        This function simulates the behavior of os.listdir, which lists files in a directory,
-        and returns a specified list of files.
+        The folder is removed when the test ends. The Excel cache is disabled for the
+        test, so reading the placeholder files never writes to the user's cache.
         """
-        return mock.patch('os.listdir', return_value=files)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        for file_name in file_names:
+            with open(os.path.join(temp_dir.name, file_name), 'wb') as file:
+                file.write(b'placeholder')
+
+        env_patcher = mock.patch.dict(os.environ, {EXCEL_NO_CACHE_ENV: '1'})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        return temp_dir.name
 
 
     @staticmethod
@@ -147,18 +172,21 @@ class TestUtils(unittest.TestCase):
 
     def test_read_xls_from_folder_no_files(self) -> None:
         """
-        Test when no files are present in the folder.
+        Test when no Excel files are present in the folder.
 
-        This test simulates the scenario where the folder does not contain any files,
-        and ensures that the function returns None.
+        This test uses a folder holding only other files and a directory whose name ends
+        in .xlsx, and ensures that the function returns None.
         """
-        # Mock empty directory
-        with mock.patch('os.listdir', return_value=[]):
+        folder = self.make_folder('data.csv')
+        os.mkdir(os.path.join(folder, 'archive.xlsx'))
 
-            df = read_xls_from_folder('mock_folder')
-            # No files found
-            assert df is None
-            print("Test passed: No Excel files found in the folder.")
+        with mock.patch('pandas.read_excel') as mock_read:
+            df = read_xls_from_folder(folder)
+
+        # No files found
+        assert df is None
+        mock_read.assert_not_called()
+        print("Test passed: No Excel files found in the folder.")
 
     def test_read_xls_from_folder_file_not_found(self) -> None:
         """
@@ -168,14 +196,14 @@ class TestUtils(unittest.TestCase):
         and ensures that the function handles the exception correctly.
         """
         # Simulate file presence
-        with mock.patch('os.listdir', return_value=['file.xlsx']):
+        folder = self.make_folder('file.xlsx')
 
-            with mock.patch('pandas.read_excel', side_effect=FileNotFoundError):
-                df = read_xls_from_folder('mock_folder')
+        with mock.patch('pandas.read_excel', side_effect=FileNotFoundError):
+            df = read_xls_from_folder(folder)
 
-                # File not found
-                assert df is None
-                print("Test passed: FileNotFoundError handled correctly.")
+            # File not found
+            assert df is None
+            print("Test passed: FileNotFoundError handled correctly.")
 
     def test_read_xls_from_folder_general_exception(self) -> None:
         """
@@ -184,30 +212,100 @@ class TestUtils(unittest.TestCase):
         This test simulates a general error when attempting to read an Excel file,
         and ensures that the function handles the exception correctly.
         """
-        with mock.patch('os.listdir', return_value=['file.xlsx']):
-            with mock.patch('pandas.read_excel', side_effect=Exception('General Error')):
-                df = read_xls_from_folder('mock_folder')
-                assert df is None
-                print("Test passed: General exception handled correctly.")
+        folder = self.make_folder('file.xlsx')
+
+        with mock.patch('pandas.read_excel', side_effect=Exception('General Error')):
+            df = read_xls_from_folder(folder)
+            assert df is None
+            print("Test passed: General exception handled correctly.")
 
     def test_read_xls_from_folder_success(self) -> None:
         """
         Test when the Excel file is successfully read.
 
-        This test simulates reading an Excel file that exists in the folder,
+        This test reads a folder holding an Excel file next to other files,
         and ensures that the function returns the correct dataframe.
         """
         # Mock dataframe
         mock_df = pd.DataFrame({'col1': [1, 2], 'col2': [3, 4]})
+        folder = self.make_folder('notes.txt', 'file.xlsx')
+
+        with mock.patch('pandas.read_excel', return_value=mock_df) as mock_read:
+            df = read_xls_from_folder(folder)
+            assert df is not None
+
+            # Ensure the returned dataframe matches the mock, read from the Excel file
+            assert df.equals(mock_df)
+            self.assertEqual(mock_read.call_args.args[0], os.path.join(folder, 'file.xlsx'))
+            print("Test passed: Successfully read Excel file.")
+
+    def test_read_xls_from_folder_remembers_file(self) -> None:
+        """
+        Test that the chosen Excel file is remembered until the folder changes.
+
+        This test reads a folder twice and ensures that the second read does not scan it
+        again, then removes the file and ensures that the change is noticed.
+        """
+        folder = self.make_folder('file.xlsx')
 
-        with mock.patch('os.listdir', return_value=['file.xlsx']):
-            with mock.patch('pandas.read_excel', return_value=mock_df):
-                df = read_xls_from_folder('mock_folder')
-                assert df is not None
+        with mock.patch('pandas.read_excel', return_value=pd.DataFrame()) as mock_read:
+            read_xls_from_folder(folder)
+            with mock.patch('os.scandir') as mock_scandir:
+                read_xls_from_folder(folder)
+            mock_scandir.assert_not_called()
 
-                # Ensure the returned dataframe matches the mock
-                assert df.equals(mock_df)
-                print("Test passed: Successfully read Excel file.")
+            os.remove(os.path.join(folder, 'file.xlsx'))
+            os.utime(folder, ns=(0, 10 ** 9))
+            self.assertIsNone(read_xls_from_folder(folder))
+
+        self.assertEqual(mock_read.call_count, 2)
+
+    def test_read_xls_from_folder_uses_cache(self) -> None:
+        """
+        Test that an unchanged Excel file is served from the cache.
+
+        This test reads the same file twice and ensures that the second read returns
+        the cached dataframe without calling pandas.read_excel again.
+        """
+        mock_df = pd.DataFrame({'col1': [1, 2], 'col2': [3, 4]})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, 'file.xlsx'), 'wb') as file:
+                file.write(b'placeholder')
+
+            cache_dir = os.path.join(temp_dir, '.cache')
+            with mock.patch('src.assets.io_utils.EXCEL_CACHE_DIR', cache_dir):
+                with mock.patch('pandas.read_excel', return_value=mock_df) as mock_read:
+                    first_df = read_xls_from_folder(temp_dir)
+                    second_df = read_xls_from_folder(temp_dir)
+
+                mock_read.assert_called_once()
+                assert first_df.equals(mock_df)
+                assert second_df.equals(mock_df)
+
+    def test_read_xls_from_folder_prunes_cache(self) -> None:
+        """
+        Test that only the cached copy of the latest workbook version is kept.
+
+        This test reads a file, rewrites it with a new modification time and reads it
+        again, then ensures that a single cache file is left for it.
+        """
+        mock_df = pd.DataFrame({'col1': [1, 2]})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'file.xlsx')
+            cache_dir = os.path.join(temp_dir, 'cache')
+            with open(file_path, 'wb') as file:
+                file.write(b'placeholder')
+
+            with mock.patch('src.assets.io_utils.EXCEL_CACHE_DIR', cache_dir):
+                with mock.patch('pandas.read_excel', return_value=mock_df) as mock_read:
+                    read_xls_from_folder(temp_dir)
+                    os.utime(file_path, ns=(0, 10 ** 9))
+                    read_xls_from_folder(temp_dir)
+
+                self.assertEqual(mock_read.call_count, 2)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
 
     def test_validator_base_create_labels(self) -> None:
         """
@@ -320,5 +418,34 @@ class TestUtils(unittest.TestCase):
         self.assertFalse(validator.validate_username("invalid username"))
 
 
+    def test_validators_reuse_compiled_patterns(self) -> None:
+        """
+        Test that the validators pass precompiled patterns to `validate_input`.
+
+        The patterns are compiled once per class, so validating does not compile or look
+        them up again, and a validator without labels reports the input as invalid.
+        """
+        for validator, text in ((PasswordValidator(), "Password1@"),
+                                (UsernameValidator(), "valid.username_1")):
+            validate = (validator.validate_password if isinstance(validator, PasswordValidator)
+                        else validator.validate_username)
+            # Without labels there is nothing to pair the patterns with
+            self.assertFalse(validate(text))
+
+            validator.create_labels()
+            with patch.object(ValidatorBase, "validate_input",
+                              wraps=ValidatorBase.validate_input) as mock_validate:
+                self.assertTrue(validate(text))
+
+            regex_list = mock_validate.call_args[0][1]
+            self.assertEqual(len(regex_list), len(validator.get_labels()))
+            for pattern, _label in regex_list:
+                self.assertIn(pattern, type(validator)._PATTERNS)
+
+            # The pairs are built once and reused on the following keystrokes
+            validate(text + "x")
+            self.assertIs(validator._get_rules(), regex_list)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -17,6 +17,11 @@ Key Features Tested:
 - Null value handling and expected warnings
 - Custom category ordering in bar charts
 - Verification of chart labels, legends, and expected output types
+- Vectorized decoding of answer codes with `decode_codes`
+- Answer counts per demographic group, matching a grouped count
+- Answer counts with more groups than fit an int8 combined code
+- Decoding of answers and demographic groups into categoricals
+- Figures created outside pyplot's list of open figures
 
 Mocked Data:
 - Simulated survey responses
@@ -34,6 +39,7 @@ import os
 import sys
 import unittest
 from io import StringIO
+from types import MappingProxyType
 from unittest.mock import patch
 
 # Third-party imports
@@ -41,11 +47,23 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 # Local project-specific imports
+from src.assets.impulse_buying_data import data_dictionary
+from src.assets.impulse_buying_data.data_dictionary import (
+    answers,
+    gender,
+    income,
+    ANSWER_CATEGORIES,
+    decode_codes
+)
+from src.visualization.charts import bar_charts
 from src.visualization.charts.bar_charts import (
     create_bar_chart_general,
     create_bar_chart_by_gender,
     create_bar_chart_by_school,
-    create_bar_chart_by_income
+    create_bar_chart_by_income,
+    _count_answers_by_group,
+    _decode_grouped_answers,
+    DEFAULT_ANSWER_DTYPE
 )
 
 # Add the src directory to the path
@@ -104,14 +122,21 @@ class TestBarCharts(unittest.TestCase):
             'Q4_INCOME': [1, 2, 1, 2, 1]    # Income distribution
         })
 
-        # Set up mocks with the full path
-        self.patchers = [
-            patch.dict('src.assets.impulse_buying_data.data_dictionary.questions', TEST_QUESTIONS),
-            patch.dict('src.assets.impulse_buying_data.data_dictionary.answers', TEST_ANSWERS),
-            patch.dict('src.assets.impulse_buying_data.data_dictionary.gender', TEST_GENDER),
-            patch.dict('src.assets.impulse_buying_data.data_dictionary.school', TEST_SCHOOL),
-            patch.dict('src.assets.impulse_buying_data.data_dictionary.income', TEST_INCOME)
-        ]
+        # Replace the read-only tables with copies holding the test entries, both in the
+        # data dictionary and where the chart module bound them at import
+        test_tables = {
+            'questions': TEST_QUESTIONS,
+            'answers': TEST_ANSWERS,
+            'gender': TEST_GENDER,
+            'school': TEST_SCHOOL,
+            'income': TEST_INCOME
+        }
+        self.patchers = []
+        for name, test_table in test_tables.items():
+            table = MappingProxyType({**getattr(data_dictionary, name), **test_table})
+            self.patchers.append(patch.object(data_dictionary, name, table))
+            if hasattr(bar_charts, name):
+                self.patchers.append(patch.object(bar_charts, name, table))
 
         # Start all patchers and schedule cleanup
         for patcher in self.patchers:
@@ -168,6 +193,7 @@ class TestBarCharts(unittest.TestCase):
 
         - Checks that a matplotlib Figure is returned.
         - Ensures the legend title matches 'Gender'.
+        - Ensures no error bars are drawn over the counts.
         """
         # Use the correct question and remove redundant patches
         result = create_bar_chart_by_gender(self.valid_df, 'SC1')
@@ -177,6 +203,9 @@ class TestBarCharts(unittest.TestCase):
         # Verify legend title matches segmentation type
         self.assertEqual(ax.get_legend().get_title().get_text(), 'Gender')
 
+        # Counts are plotted as they are, without an error bar per bar
+        self.assertEqual(len(ax.lines), 0)
+
 
     def test_create_bar_chart_by_gender_missing_column(self):
         """
@@ -253,5 +282,108 @@ class TestBarCharts(unittest.TestCase):
             self.assertIn("Null values found", mock_stdout.getvalue())
 
 
+    def test_decode_codes(self):
+        """
+        Test that `decode_codes` matches `Series.map` on the answers dictionary.
+
+        - Valid codes are decoded into their labels.
+        - Out-of-range, fractional and missing codes become NaN.
+        - The index and name of the input Series are kept.
+        """
+        codes = pd.Series([1, 5, 0, 6, 2.5, None], index=list('abcdef'), name='SC1')
+
+        result = decode_codes(codes, ANSWER_CATEGORIES)
+
+        self.assertEqual(result.dtype, 'category')
+        self.assertEqual(list(result.cat.categories), list(ANSWER_CATEGORIES))
+        self.assertEqual(result.name, 'SC1')
+        self.assertEqual(list(result.index), list('abcdef'))
+        self.assertEqual(result.iloc[:2].tolist(), [ANSWER_CATEGORIES[0], ANSWER_CATEGORIES[4]])
+        self.assertTrue(result.iloc[2:].isna().all())
+
+    def test_count_answers_by_group(self):
+        """
+        Test that `_count_answers_by_group` matches the grouped count it replaces.
+
+        - Every group with a label gets one row per answer category, in order.
+        - Categories and groups left without answers are kept with a count of 0.
+        - Rows without a group are excluded.
+        """
+        processed_df = pd.DataFrame({
+            'SC1': pd.Series(['Agree', None, 'Normal', 'Agree', 'Agree'],
+                             dtype=DEFAULT_ANSWER_DTYPE),
+            'Q2_GENDER': ['Male', 'Female', 'Male', None, 'Male']
+        })
+
+        result = _count_answers_by_group(processed_df, 'Q2_GENDER', 'SC1')
+
+        expected = (processed_df
+                    .groupby(['Q2_GENDER', 'SC1'], observed=False)
+                    .size()
+                    .reset_index(name='counts'))
+        pd.testing.assert_frame_equal(result, expected)
+        self.assertEqual(result['counts'].tolist(), [0, 0, 0, 0, 0, 0, 0, 1, 2, 0])
+
+    def test_count_answers_by_group_many_groups(self):
+        """
+        Test `_count_answers_by_group` with more groups than fit a small combined code.
+
+        - With 40 groups and 5 categories the combined code exceeds the int8 range.
+        - Each group still gets its own answer counted once.
+        """
+        labels = [f'Group {number:02d}' for number in range(40)]
+        processed_df = pd.DataFrame({
+            'SC1': pd.Series(['Very agree'] * 40, dtype=DEFAULT_ANSWER_DTYPE),
+            'Q3_SCHOOL': labels
+        })
+
+        result = _count_answers_by_group(processed_df, 'Q3_SCHOOL', 'SC1')
+
+        very_agree = result[result['SC1'] == 'Very agree']
+        self.assertEqual(very_agree['Q3_SCHOOL'].tolist(), labels)
+        self.assertEqual(very_agree['counts'].tolist(), [1] * 40)
+        self.assertEqual(result['counts'].sum(), 40)
+
+    def test_bar_charts_not_kept_by_pyplot(self):
+        """
+        Test that the bar charts are created outside pyplot.
+
+        - Every chart function returns a Figure.
+        - None of them leaves a figure open in pyplot, so charts that are never closed
+          by the caller are not kept alive by it.
+        """
+        open_figures = plt.get_fignums()
+
+        for chart_function in (create_bar_chart_general, create_bar_chart_by_gender,
+                               create_bar_chart_by_school, create_bar_chart_by_income):
+            with self.subTest(chart_function=chart_function.__name__):
+                self.assertIsInstance(chart_function(self.valid_df, 'SC1'), plt.Figure)
+                self.assertEqual(plt.get_fignums(), open_figures)
+
+    def test_decode_grouped_answers(self):
+        """
+        Test that `_decode_grouped_answers` decodes like the dictionaries it replaces.
+
+        - Both columns become categoricals with the labels of the dictionaries.
+        - Gender codes start at 0, the other demographic codes at 1.
+        - Unknown codes become NaN and the index is kept.
+        """
+        df = pd.DataFrame({'SC1': [4, 1, 9], 'Q2_GENDER': [1, 0, 2], 'Q4_INCOME': [1, 4, 0]},
+                          index=[10, 11, 12])
+
+        by_gender = _decode_grouped_answers(df, 'SC1', 'Q2_GENDER')
+        by_income = _decode_grouped_answers(df, 'SC1', 'Q4_INCOME')
+
+        self.assertEqual(list(by_gender.columns), ['SC1', 'Q2_GENDER'])
+        self.assertEqual(list(by_gender.index), [10, 11, 12])
+        self.assertTrue((by_gender.dtypes == 'category').all())
+        pd.testing.assert_series_equal(by_gender['SC1'].astype(object),
+                                       df['SC1'].map(answers).astype(object))
+        pd.testing.assert_series_equal(by_gender['Q2_GENDER'].astype(object),
+                                       df['Q2_GENDER'].map(gender).astype(object))
+        pd.testing.assert_series_equal(by_income['Q4_INCOME'].astype(object),
+                                       df['Q4_INCOME'].map(income).astype(object))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -12,6 +12,7 @@ Key Features Tested:
 - Handling of invalid inputs, missing columns, and empty datasets.
 - Proper labeling, title formatting, and data mapping.
 - Minimum percentage threshold handling for pie slices.
+- Figures created outside pyplot's list of open figures.
 
 Dependencies:
 - unittest
@@ -22,6 +23,7 @@ Dependencies:
 import unittest
 
 # Third-party imports
+import matplotlib.pyplot as plt
 import pandas as pd
 from matplotlib.figure import Figure
 
@@ -245,6 +247,22 @@ class TestPieCharts(unittest.TestCase):
         fig = create_pie_chart_by_gender(test_data, 'SC1', gender_filter='Male')
         self.assertIsNone(fig)  # No Male data should return None
 
+    def test_pie_charts_not_kept_by_pyplot(self):
+        """
+        Test that the pie charts are created outside pyplot.
+
+        - Every chart function returns a Figure.
+        - None of them leaves a figure open in pyplot, so charts that are never closed
+          by the caller are not kept alive by it.
+        """
+        open_figures = plt.get_fignums()
+
+        for chart_function in (create_pie_chart_general, create_pie_chart_by_gender,
+                               create_pie_chart_by_school, create_pie_chart_by_income):
+            with self.subTest(chart_function=chart_function.__name__):
+                self.assertIsInstance(chart_function(self.df, 'SC1'), Figure)
+                self.assertEqual(plt.get_fignums(), open_figures)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,7 +6,7 @@ for displaying the main dashboard UI. It includes tests for UI initialization, g
 criteria (such as gender, school, and income), file download and preprocessing operations, and the correct
 display of tables.
 
-The tests utilize Python's `unittest` framework, and external dependencies like subprocess calls and file I/O
+The tests utilize Python's `unittest` framework, and external dependencies like the download and preprocessing workflows and file I/O
 are mocked to simulate different scenarios and verify the correct handling of success and error cases.
 
 Key tests include:
@@ -14,22 +14,28 @@ Key tests include:
 - Graph display toggling by gender, school, and income
 - Downloading and handling XLSX files
 - Running preprocessing tasks and handling exceptions
-- Displaying tables with CSV data
+- Displaying tables with CSV data, discarding background reads of older file versions
+- Reusing the rendered general pie chart while the data is unchanged, and exporting it
 
 This suite ensures that the `DashboardWindow` class behaves as expected under various conditions,
 providing a comprehensive check of its core functionality.
 """
 # Standard library imports
+import os
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 # Third-party imports
 import pandas as pd
+from PySide6.QtCore import Qt, QThreadPool
 from PySide6.QtWidgets import QApplication, QMainWindow
+from matplotlib.figure import Figure
 
 # Local project-specific imports
 from src.assets.dashboard_window_setup import (setup_dashboard_ui, setup_dashboard_window,
                                                setup_dashboard_menu, setup_graph_container)
+from src.assets.pixmap_label import PixmapLabel
 from src.windows.dashboard_window import DashboardWindow
 
 
@@ -42,7 +48,7 @@ class TestDashboardWindow(unittest.TestCase):
     XLSX file download, preprocessing, and table display.
 
     It tests methods that involve user interactions and background processing,
-    with mock objects for subprocess calls and file handling to ensure proper error handling
+    with mock objects for the background workflows and file handling to ensure proper error handling
     and successful operations.
     """
     @classmethod
@@ -94,58 +100,193 @@ class TestDashboardWindow(unittest.TestCase):
         self.assertTrue(self.dashboard_window.is_graph_displayed)
 
 
-    @patch('src.windows.dashboard_window.subprocess.run')
-    def test_download_xlsx_success(self, mock_subprocess_run) -> None:
+    def _wait_for_background_tasks(self) -> None:
+        """Wait for the worker threads and deliver their queued signals."""
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+
+
+    @patch('src.windows.dashboard_window.QMessageBox')
+    @patch('src.assets.download_files.main')
+    def test_download_xlsx_success(self, mock_download_main, mock_message_box) -> None:
         """Test downloading XLSX file successfully."""
-        mock_subprocess_run.return_value = MagicMock(returncode=0)
         self.dashboard_window.download_xlsx()
-        mock_subprocess_run.assert_called_once()
+        self.assertFalse(self.dashboard_window.download_button.isEnabled())
+        self._wait_for_background_tasks()
 
+        mock_download_main.assert_called_once()
+        mock_message_box.information.assert_called_once()
+        self.assertTrue(self.dashboard_window.download_button.isEnabled())
+        mock_message_box.critical.assert_not_called()
 
-    @patch('src.windows.dashboard_window.subprocess.run', side_effect=FileNotFoundError)
-    def test_download_xlsx_file_not_found(self, mock_subprocess_run) -> None:
-        """Test downloading XLSX file with File Not Found error."""
-        with self.assertRaises(FileNotFoundError):
-            self.dashboard_window.download_xlsx()
 
+    @patch('src.windows.dashboard_window.QMessageBox')
+    @patch('src.assets.download_files.main', side_effect=FileNotFoundError("missing"))
+    def test_download_xlsx_exception(self, mock_download_main, mock_message_box) -> None:
+        """Test that an error raised by the download is reported to the user."""
+        self.dashboard_window.download_xlsx()
+        self._wait_for_background_tasks()
 
-    @patch('src.windows.dashboard_window.subprocess.run', side_effect=Exception)
-    def test_download_xlsx_exception(self, mock_subprocess_run) -> None:
-        """Test downloading XLSX file with a general exception."""
-        with self.assertRaises(Exception):
-            self.dashboard_window.download_xlsx()
+        mock_download_main.assert_called_once()
+        mock_message_box.critical.assert_called_once()
+        mock_message_box.information.assert_not_called()
 
 
-    @patch('src.windows.dashboard_window.subprocess.run')
-    def test_run_preprocessing_success(self, mock_subprocess_run) -> None:
-        """Test running preprocessing successfully."""
-        mock_subprocess_run.return_value = MagicMock(returncode=0)
-        self.dashboard_window.run_preprocessing()
-        mock_subprocess_run.assert_called_once()
+    @patch('src.windows.dashboard_window.QMessageBox')
+    @patch('src.assets.download_files.main', return_value=None)
+    def test_download_xlsx_reported_error(self, mock_download_main, mock_message_box) -> None:
+        """Test that a download that reports an error is not shown as a success."""
+        self.dashboard_window.download_xlsx()
+        self._wait_for_background_tasks()
 
+        mock_message_box.critical.assert_called_once()
+        mock_message_box.information.assert_not_called()
+        self.assertTrue(self.dashboard_window.download_button.isEnabled())
 
-    @patch('src.windows.dashboard_window.subprocess.run', side_effect=FileNotFoundError)
-    def test_run_preprocessing_file_not_found(self, mock_subprocess_run) -> None:
-        """Test running preprocessing with File Not Found error."""
-        with self.assertRaises(FileNotFoundError):
-            self.dashboard_window.run_preprocessing()
 
+    @patch('src.windows.dashboard_window.QMessageBox')
+    @patch('src.assets.preprocess.main')
+    def test_run_preprocessing_success(self, mock_preprocess_main, mock_message_box) -> None:
+        """Test that the data returned by the preprocessing is shown without reading it back."""
+        cleaned_df = pd.DataFrame({'A': range(10), 'B': ['x'] * 10})
+        summary_df = pd.DataFrame({'Data Type': ['int64', 'object'], 'Count': [10, 10]})
+        mock_preprocess_main.return_value = (cleaned_df, summary_df)
 
-    @patch('src.windows.dashboard_window.subprocess.run', side_effect=Exception)
-    def test_run_preprocessing_exception(self, mock_subprocess_run) -> None:
-        """Test running preprocessing with a general exception."""
-        with self.assertRaises(Exception):
+        with patch('src.windows.dashboard_window.read_csv_preview') as mock_read_csv_preview:
             self.dashboard_window.run_preprocessing()
+            self._wait_for_background_tasks()
+
+        mock_preprocess_main.assert_called_once()
+        mock_message_box.information.assert_called_once()
+        mock_read_csv_preview.assert_not_called()
+        self.assertEqual(self.dashboard_window.table_widget.model().rowCount(), 5)
+        self.assertEqual(self.dashboard_window.table_widget_processed.model().columnCount(), 2)
+
+
+    @patch('src.windows.dashboard_window.QMessageBox')
+    @patch('src.assets.preprocess.main', return_value=None)
+    def test_run_preprocessing_reported_error(self, mock_preprocess_main,
+                                              mock_message_box) -> None:
+        """Test that a preprocessing run that reports an error is not shown as a success."""
+        self.dashboard_window.run_preprocessing()
+        self._wait_for_background_tasks()
 
+        mock_message_box.critical.assert_called_once()
+        mock_message_box.information.assert_not_called()
 
-    @patch('src.windows.dashboard_window.pd.read_csv')
-    def test_display_tables_success(self, mock_read_csv) -> None:
+
+    @patch('src.windows.dashboard_window.QMessageBox')
+    @patch('src.assets.preprocess.main', side_effect=Exception("boom"))
+    def test_run_preprocessing_exception(self, mock_preprocess_main, mock_message_box) -> None:
+        """Test that an error raised by the preprocessing is reported to the user."""
+        self.dashboard_window.run_preprocessing()
+        self._wait_for_background_tasks()
+
+        mock_preprocess_main.assert_called_once()
+        mock_message_box.critical.assert_called_once()
+        mock_message_box.information.assert_not_called()
+
+
+    @patch('src.windows.dashboard_window.read_csv_preview')
+    def test_display_tables_success(self, mock_read_csv_preview) -> None:
         """Test displaying tables successfully."""
-        mock_df = pd.DataFrame({'A': [1, 2, 3]})
-        mock_read_csv.return_value = mock_df
+        mock_read_csv_preview.return_value = (['A'], [['1'], ['2'], ['3']])
+        self.dashboard_window._csv_mtimes.clear()
+        DashboardWindow._preview_cache.clear()
         self.dashboard_window.display_tables()
-        self.assertEqual(self.dashboard_window.table_widget.rowCount(), 3)
-        self.assertEqual(self.dashboard_window.table_widget.columnCount(), 1)
+        self.assertEqual(self.dashboard_window.table_widget.model().rowCount(), 3)
+        self.assertEqual(self.dashboard_window.table_widget.model().columnCount(), 1)
+
+
+    @patch('src.windows.dashboard_window.read_csv_preview',
+           return_value=(['A'], [['1'], ['2']]))
+    def test_preview_is_cached_between_windows(self, mock_read_csv_preview) -> None:
+        """Test that a second dashboard reuses the preview read by the first one."""
+        DashboardWindow._preview_cache.clear()
+        self.dashboard_window._csv_mtimes.clear()
+        self.dashboard_window.display_tables()
+
+        second_window = DashboardWindow()
+        second_window.display_tables()
+
+        mock_read_csv_preview.assert_called_once()
+        self.assertEqual(second_window.table_widget.model().rowCount(), 2)
+
+
+    def test_in_place_update_keeps_column_widths(self) -> None:
+        """Test that columns are only resized to their contents when the model is reset."""
+        table_view = self.dashboard_window.table_widget
+        self.dashboard_window._populate_table(table_view, (['A', 'B'], [['1', '2']]))
+        table_view.setColumnWidth(0, 333)
+
+        self.dashboard_window._populate_table(table_view, (['A', 'B'], [['3', '4']]))
+        self.assertEqual(table_view.columnWidth(0), 333)
+
+        self.dashboard_window._populate_table(table_view, (['C'], [['5']]))
+        self.assertNotEqual(table_view.columnWidth(0), 333)
+
+
+    def test_outdated_csv_load_is_discarded(self) -> None:
+        """Test that a background read of an older file version does not replace newer data."""
+        table_model = self.dashboard_window.table_widget_processed.model()
+        self.dashboard_window._populate_table(self.dashboard_window.table_widget_processed,
+                                              pd.DataFrame({'Min': [0]}))
+        self.dashboard_window._csv_mtimes["processed"] = 10
+
+        self.dashboard_window._on_csv_loaded("processed", pd.DataFrame({'Count': [1]}), 5)
+        self.assertEqual(self.dashboard_window._csv_mtimes["processed"], 10)
+        self.assertEqual(table_model.headerData(0, Qt.Orientation.Horizontal), 'Min')
+
+        self.dashboard_window._on_csv_loaded("processed", pd.DataFrame({'Count': [1]}), 20)
+        self.assertEqual(self.dashboard_window._csv_mtimes["processed"], 20)
+        self.assertEqual(table_model.headerData(0, Qt.Orientation.Horizontal), 'Count')
+
+
+
+    def _secondary_graph(self):
+        """Return the widget displayed to the right of the bar chart."""
+        main_layout = self.dashboard_window.graph_layout.itemAt(0).layout()
+        return main_layout.itemAt(0).layout().itemAt(1).widget()
+
+
+    @patch('src.windows.dashboard_window.QMessageBox')
+    @patch.object(DashboardWindow, '_static_chart_key')
+    @patch('src.visualization.charts.base.visualize_survey_responses',
+           side_effect=lambda *args, **kwargs: Figure())
+    def test_general_pie_chart_is_cached(self, mock_visualize, mock_chart_key,
+                                         mock_message_box) -> None:
+        """
+        Test that the general pie chart is rendered once per question and data version.
+
+        The second display reuses the cached pixmap in a `PixmapLabel`, the cached figure can
+        still be exported, and new data renders the chart again and evicts the old one.
+        """
+        mock_chart_key.return_value = ("question", 1)
+
+        self.dashboard_window.show_graph()
+        self.dashboard_window.show_graph()
+
+        pie_chart_calls = [call for call in mock_visualize.call_args_list
+                           if call.kwargs.get("pie_chart")]
+        self.assertEqual(len(pie_chart_calls), 1)
+        self.assertIsInstance(self._secondary_graph(), PixmapLabel)
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch('src.windows.dashboard_window.EXPORT_DIR', temp_dir):
+            self.dashboard_window.export_graphs()
+            self.assertEqual(len([name for name in os.listdir(temp_dir)
+                                  if name.startswith("graph2_")]), 1)
+        mock_message_box.information.assert_called_once()
+
+        # New data under the same question must not reuse the old rendering
+        mock_chart_key.return_value = ("question", 2)
+        self.dashboard_window.show_graph()
+
+        pie_chart_calls = [call for call in mock_visualize.call_args_list
+                           if call.kwargs.get("pie_chart")]
+        self.assertEqual(len(pie_chart_calls), 2)
+        self.assertEqual(list(self.dashboard_window._static_charts), [("question", 2)])
+
 
 if __name__ == '__main__':
     unittest.main()
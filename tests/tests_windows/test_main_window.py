@@ -38,6 +38,9 @@ correctly when the corresponding button is clicked.
 - `test_open_recovery_window`: Verifies that the recovery window opens
 correctly when the corresponding button is clicked.
 
+- `test_login_reuses_dashboard_window`: Ensures that logging in again refreshes and
+shows the existing dashboard instead of creating a new one.
+
 The tests use Python's `unittest` framework to simulate user actions
 and verify the UI behavior, without needing to run the application
 in a graphical environment.
@@ -239,5 +242,22 @@ class TestMainWindow(unittest.TestCase):
         mock_window_instance.show.assert_called_once()
 
 
+    # Patching the DashboardWindow and the message box shown after logging in.
+    @patch('src.windows.main_window.show_message')
+    @patch('src.windows.main_window.DashboardWindow')
+    def test_login_reuses_dashboard_window(self, MockDashboardWindow, mock_show_message) -> None:
+        """
+        Test that an existing dashboard window is refreshed and shown again, not re-created.
+        """
+        existing_dashboard = MagicMock()
+        self.window._dashboard_window = existing_dashboard
+
+        self.window._login_successful()
+
+        MockDashboardWindow.assert_not_called()
+        existing_dashboard.refresh.assert_called_once()
+        existing_dashboard.show.assert_called_once()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -24,6 +24,12 @@ invalid username and verifies that the corresponding error message is displayed.
 - `test_register_invalid_password`: Tests a registration attempt with an
 invalid password and checks that the error message is shown.
 
+- `test_validation_is_debounced`: Ensures that a burst of keystrokes triggers a single
+validation once typing pauses.
+
+- `test_register_skips_repeated_validation`: Ensures that the inputs validated on
+registration are not validated again by the debounce timers.
+
 - `test_close_event`: Verifies that the correct methods are called
 when the window is closed (e.g., stopping the timers).
 
@@ -46,7 +52,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtTest import QTest
 
 # Local project-specific imports
-from src.windows.registration_window import RegistrationWindow
+from src.windows.registration_window import RegistrationWindow, VALIDATION_DEBOUNCE_MS
 
 
 class TestRegistrationWindow(unittest.TestCase):
@@ -220,5 +226,50 @@ class TestRegistrationWindow(unittest.TestCase):
             event.accept.assert_called_once()
 
 
+    def test_validation_is_debounced(self) -> None:
+        """
+        Test that the username validation runs once per pause in typing.
+
+        This test types several characters in quick succession and ensures that the
+        validator is only called after the debounce interval, once, with the final text.
+        """
+        with patch.object(self.window.username_validator, 'validate_username',
+                          return_value=True) as mock_validate:
+            for text in ("v", "va", "val", "vali", "valid"):
+                self.window.username_input.setText(text)
+
+            mock_validate.assert_not_called()
+
+            QTest.qWait(VALIDATION_DEBOUNCE_MS * 3)
+            mock_validate.assert_called_once_with("valid")
+
+    @patch('src.windows.registration_window.show_message')
+    def test_register_skips_repeated_validation(self, mock_show_message) -> None:
+        """
+        Test that the inputs checked on registration are not validated again.
+
+        A failed registration validates the current username and password, so the debounced
+        validation that follows must not check the same values a second time.
+        """
+        self.window.username_input.setText("validuser")
+        self.window.email_input.setText("valid@example.com")
+        self.window.password_input.setText("short")
+        QTest.qWait(VALIDATION_DEBOUNCE_MS * 3)
+
+        with patch.object(self.window.username_validator, 'validate_username',
+                          return_value=True) as mock_validate_username, \
+             patch.object(self.window.password_validator, 'validate_password',
+                          return_value=False) as mock_validate_password:
+            self.window.password_input.setText("short!")
+            QTest.mouseClick(self.window.register_button, Qt.LeftButton)
+            QTest.qWait(VALIDATION_DEBOUNCE_MS * 3)
+
+            mock_validate_username.assert_called_once_with("validuser")
+            mock_validate_password.assert_called_once_with("short!")
+        mock_show_message.assert_called_with(
+            self.window, "Error", "Password does not meet all requirements."
+        )
+
+
 if __name__ == '__main__':
     unittest.main()